@@ -2,22 +2,32 @@
 
 모든 Agent 실행을 SQLite DB에 기록한다.
 PreQuery에서 레코드 생성, PostQuery에서 결과 업데이트, OnError에서 에러 기록.
+
+handle()은 행을 큐에 넣고 즉시 반환하며, 백그라운드 flusher가
+batch_size 개 또는 flush_interval_ms 간격으로 묶어 한 트랜잭션에 기록한다.
+SQLite 호출은 전용 단일 writer 스레드에서만 수행하여 이벤트 루프를 막지 않는다.
 """
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
-from datetime import datetime, timezone
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
-
-import structlog
+from typing import Any, NamedTuple
 
-from aac.aspects.engine import AspectContext, AspectEventType, AspectHandler
+from aac.aspects.engine import (
+    PROMPT_SUMMARY_LENGTH,
+    AspectContext,
+    AspectEventType,
+    AspectHandler,
+)
+from aac.logging.formatter import utc_now_iso
 from aac.models.manifest import AspectManifest
 
-logger = structlog.get_logger()
-
 _CREATE_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS executions (
     id TEXT PRIMARY KEY,
@@ -36,6 +46,85 @@ CREATE TABLE IF NOT EXISTS executions (
 )
 """
 
+# 동일 문자열을 재사용하여 sqlite3 문장 캐시에서 컴파일된 statement를 재활용한다
+_INSERT_SQL = """INSERT INTO executions
+    (id, session_id, tx_id, agent_name, prompt, status, created_at)
+    VALUES (?, ?, ?, ?, ?, 'running', ?)"""
+
+_UPDATE_SQL = """UPDATE executions
+    SET response = ?, cost_usd = ?, duration_ms = ?, model = ?,
+        status = ?, error = ?, completed_at = ?
+    WHERE id = ?"""
+
+_ERROR_SQL = """UPDATE executions SET status = 'error', error = ? WHERE id = ?"""
+
+
+class _AuditSnapshot(NamedTuple):
+    """큐/writer 스레드로 넘기는 AspectContext의 불변 스냅샷 (요약 길이로 잘린 상태)."""
+
+    event_type: str
+    execution_id: str
+    session_id: str
+    tx_id: str
+    agent_name: str
+    prompt: str
+    response: str
+    cost_usd: float
+    duration_ms: int
+    model: str
+    error: str | None
+    timestamp: str
+
+
+def _insert_params(snap: _AuditSnapshot) -> tuple[Any, ...]:
+    """PreQuery: 실행 레코드 생성 파라미터."""
+    return (
+        snap.execution_id,
+        snap.session_id,
+        snap.tx_id,
+        snap.agent_name,
+        snap.prompt,
+        snap.timestamp,
+    )
+
+
+def _update_params(snap: _AuditSnapshot) -> tuple[Any, ...]:
+    """PostQuery: 결과 업데이트 파라미터."""
+    return (
+        snap.response,
+        snap.cost_usd,
+        snap.duration_ms,
+        snap.model,
+        "error" if snap.error else "completed",
+        snap.error,
+        snap.timestamp,
+        snap.execution_id,
+    )
+
+
+def _error_params(snap: _AuditSnapshot) -> tuple[Any, ...]:
+    """OnError: 에러 상태 기록 파라미터."""
+    return (snap.error, snap.execution_id)
+
+
+_SQL_BY_EVENT: dict[str, tuple[str, Callable[[_AuditSnapshot], tuple[Any, ...]]]] = {
+    AspectEventType.PRE_QUERY: (_INSERT_SQL, _insert_params),
+    AspectEventType.POST_QUERY: (_UPDATE_SQL, _update_params),
+    AspectEventType.ON_ERROR: (_ERROR_SQL, _error_params),
+}
+
+# 쓰기 위주 감사 로그용 기본 PRAGMA — config.pragmas 로 개별 override 가능
+_DEFAULT_PRAGMAS: dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -65536,  # 64 MiB
+    "mmap_size": 268435456,  # 256 MiB
+    "busy_timeout": 3000,
+    "wal_autocheckpoint": 1000,  # 페이지 단위 — 커밋 대신 WAL 체크포인트가 주기적으로 반영
+    "cache_spill": "OFF",  # 배치 트랜잭션 중 dirty page를 디스크로 흘리지 않음
+}
+
 
 class AuditLoggingHandler(AspectHandler):
     """SQLite 기반 감사 로그 Aspect."""
@@ -44,79 +133,141 @@ class AuditLoggingHandler(AspectHandler):
         super().__init__(manifest)
         self._db_path = self._config.get("db_path", "data/audit.db")
         self._summary_max_length = self._config.get("summary_max_length", 200)
+        self._pragmas: dict[str, Any] = {
+            **_DEFAULT_PRAGMAS,
+            **self._config.get("pragmas", {}),
+        }
+        self._batch_size: int = self._config.get("batch_size", 100)
+        self._flush_interval: float = self._config.get("flush_interval_ms", 50) / 1000
         self._conn: sqlite3.Connection | None = None
+        # 연결의 스레드 친화성을 지키기 위한 단일 writer 스레드
+        self._executor: ThreadPoolExecutor | None = None
+        self._queue: asyncio.Queue[_AuditSnapshot] = asyncio.Queue()
+        self._pending: list[_AuditSnapshot] = []
+        self._flusher_task: asyncio.Task[None] | None = None
 
     def _ensure_db(self) -> sqlite3.Connection:
-        """DB 연결 보장 + 테이블 생성."""
+        """DB 연결 보장 + PRAGMA 적용 + 테이블 생성."""
         if self._conn is None:
             db_path = Path(self._db_path)
             db_path.parent.mkdir(parents=True, exist_ok=True)
             self._conn = sqlite3.connect(str(db_path))
+            for key, value in self._pragmas.items():
+                self._conn.execute(f"PRAGMA {key}={value}")
             self._conn.execute(_CREATE_TABLE_SQL)
             self._conn.commit()
-            logger.info("audit_db_initialized", path=str(db_path))
+            self._log.info("audit_db_initialized", path=str(db_path))
         return self._conn
 
+    def open_reader(self) -> sqlite3.Connection:
+        """조회 전용 연결 생성 — WAL 모드에서 writer 트랜잭션에 막히지 않는다.
+
+        writer 연결(self._conn)은 flusher 스레드 전용이며, 대시보드/조회는 이 연결을 쓴다.
+        호출자가 close() 책임을 진다.
+        """
+        db_path = Path(self._db_path).resolve()
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+        conn.execute("PRAGMA query_only=1")
+        for key in ("cache_size", "mmap_size", "busy_timeout"):
+            if key in self._pragmas:
+                conn.execute(f"PRAGMA {key}={self._pragmas[key]}")
+        return conn
+
     async def handle(self, event_type: str, ctx: AspectContext) -> None:
-        """이벤트별 감사 로그 처리."""
-        conn = self._ensure_db()
+        """이벤트를 스냅샷하여 큐에 적재 (SQL 파라미터 구성과 기록은 writer 스레드에서)."""
+        if event_type not in _SQL_BY_EVENT:
+            return
 
-        if event_type == AspectEventType.PRE_QUERY:
-            self._insert_execution(conn, ctx)
-        elif event_type == AspectEventType.POST_QUERY:
-            self._update_execution(conn, ctx)
-        elif event_type == AspectEventType.ON_ERROR:
-            self._update_error(conn, ctx)
-
-    def _insert_execution(self, conn: sqlite3.Connection, ctx: AspectContext) -> None:
-        """PreQuery: 실행 레코드 생성."""
-        prompt_summary = ctx.prompt[:self._summary_max_length]
-        conn.execute(
-            """INSERT INTO executions (id, session_id, tx_id, agent_name, prompt, status, created_at)
-            VALUES (?, ?, ?, ?, ?, 'running', ?)""",
-            (
-                ctx.execution_id,
-                ctx.session_id,
-                ctx.tx_id,
-                ctx.agent_name,
-                prompt_summary,
-                datetime.now(timezone.utc).isoformat(),
-            ),
-        )
-        conn.commit()
-
-    def _update_execution(self, conn: sqlite3.Connection, ctx: AspectContext) -> None:
-        """PostQuery: 결과 업데이트."""
-        response_summary = ctx.response[:self._summary_max_length] if ctx.response else ""
-        status = "error" if ctx.error else "completed"
-        conn.execute(
-            """UPDATE executions
-            SET response = ?, cost_usd = ?, duration_ms = ?, model = ?,
-                status = ?, error = ?, completed_at = ?
-            WHERE id = ?""",
-            (
-                response_summary,
-                ctx.cost_usd,
-                ctx.duration_ms,
-                ctx.model,
-                status,
-                ctx.error,
-                datetime.now(timezone.utc).isoformat(),
-                ctx.execution_id,
-            ),
+        # 이후 aspect가 ctx를 변경해도 영향받지 않도록 기록할 필드만 동기적으로 복사
+        limit = self._summary_max_length
+        snapshot = _AuditSnapshot(
+            event_type,
+            ctx.execution_id,
+            ctx.session_id,
+            ctx.tx_id,
+            ctx.agent_name,
+            ctx.prompt_summary[:limit] if limit <= PROMPT_SUMMARY_LENGTH else ctx.prompt[:limit],
+            ctx.response[:limit] if ctx.response else "",
+            ctx.cost_usd,
+            ctx.duration_ms,
+            ctx.model,
+            ctx.error,
+            utc_now_iso(),
         )
-        conn.commit()
 
-    def _update_error(self, conn: sqlite3.Connection, ctx: AspectContext) -> None:
-        """OnError: 에러 상태 기록."""
-        conn.execute(
-            """UPDATE executions SET status = 'error', error = ? WHERE id = ?""",
-            (ctx.error, ctx.execution_id),
-        )
-        conn.commit()
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+        await self._queue.put(snapshot)
+
+    async def _flush_loop(self) -> None:
+        """큐를 batch_size / flush_interval 단위로 비워 한 트랜잭션에 기록."""
+        while True:
+            self._pending.append(await self._queue.get())
+            while len(self._pending) < self._batch_size:
+                try:
+                    self._pending.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=self._flush_interval)
+                    )
+                except TimeoutError:
+                    break
+
+            batch, self._pending = self._pending, []
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), self._write_batch, batch,
+                )
+            except sqlite3.Error as e:
+                self._log.error("audit_flush_error", rows=len(batch), error=str(e))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aac-audit")
+        return self._executor
+
+    def _write_batch(self, batch: list[_AuditSnapshot]) -> None:
+        """적재된 행을 이벤트 순서대로 executemany — 배치당 1회 commit (writer 스레드)."""
+        conn = self._ensure_db()
+        with conn:
+            for event_type, snapshots in groupby(batch, key=attrgetter("event_type")):
+                sql, to_params = _SQL_BY_EVENT[event_type]
+                conn.executemany(sql, [to_params(snap) for snap in snapshots])
+
+    async def flush(self) -> None:
+        """큐에 적재된 모든 행이 기록될 때까지 대기."""
+        await self._queue.join()
+
+    async def shutdown(self) -> None:
+        """남은 행을 모두 기록한 뒤 연결 종료."""
+        await self.flush()
+        self.close()
 
     def close(self) -> None:
-        """DB 연결 종료."""
+        """flusher 중단 + 미기록 행 동기 기록 + DB 연결 종료."""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+
+        remaining, self._pending = self._pending, []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if self._executor is None and not remaining:
+            return
+        executor = self._get_executor()
+        try:
+            if remaining:
+                executor.submit(self._write_batch, remaining).result()
+            executor.submit(self._close_conn).result()
+        finally:
+            for _ in remaining:
+                self._queue.task_done()
+            executor.shutdown(wait=True)
+            self._executor = None
+
+    def _close_conn(self) -> None:
+        """writer 스레드에서 연결 종료."""
         if self._conn:
             self._conn.close()
             self._conn = None
@@ -32,9 +32,17 @@ class AspectEventType:
     ON_ERROR = "OnError"
 
 
-@dataclass
+# 모든 aspect가 공유하는 prompt 요약 길이 — 전체 prompt 슬라이스를 aspect마다 반복하지 않음
+PROMPT_SUMMARY_LENGTH = 256
+
+
+@dataclass(slots=True)
 class AspectContext:
-    """Aspect 실행 시 전달되는 컨텍스트 데이터."""
+    """Aspect 실행 시 전달되는 컨텍스트 데이터.
+
+    prompt_summary는 생성 시 prompt 앞부분으로 1회 계산되며,
+    aspect들은 긴 prompt 대신 이 값을 잘라 쓴다.
+    """
 
     agent_name: str
     session_id: str
@@ -50,7 +58,20 @@ class AspectContext:
     tool_name: str | None = None
     tool_input: dict[str, Any] | None = None
     tool_output: dict[str, Any] | None = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    prompt_summary: str = field(default="", repr=False)
+    # 대부분의 aspect가 쓰지 않으므로 첫 접근 시에만 dict 할당
+    _metadata: dict[str, Any] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.prompt_summary:
+            self.prompt_summary = self.prompt[:PROMPT_SUMMARY_LENGTH]
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """aspect 간 공유 메타데이터 (지연 생성)."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
 
 
 class AspectHandler:
@@ -64,6 +85,14 @@ class AspectHandler:
         self._manifest = manifest
         self._name = manifest.metadata.name
         self._config = manifest.spec.config
+        # 이벤트마다 조회되는 값 — manifest 체인을 매번 따라가지 않도록 1회 캐시
+        pointcut = manifest.spec.pointcut
+        self._order = manifest.spec.order
+        self._events = frozenset(pointcut.events)
+        self._target_agents = frozenset(pointcut.agents)
+        self._target_tags = frozenset(pointcut.tags)
+        # aspect 이름이 미리 바인딩된 logger — 호출마다 컨텍스트를 다시 구성하지 않음
+        self._log = logger.bind(aspect=self._name)
 
     @property
     def name(self) -> str:
@@ -71,28 +100,26 @@ class AspectHandler:
 
     @property
     def order(self) -> int:
-        return self._manifest.spec.order
+        return self._order
 
     @property
-    def events(self) -> list[str]:
-        return self._manifest.spec.pointcut.events
+    def events(self) -> frozenset[str]:
+        return self._events
 
     @property
-    def target_agents(self) -> list[str]:
-        return self._manifest.spec.pointcut.agents
+    def target_agents(self) -> frozenset[str]:
+        return self._target_agents
 
     @property
-    def target_tags(self) -> list[str]:
-        return self._manifest.spec.pointcut.tags
+    def target_tags(self) -> frozenset[str]:
+        return self._target_tags
 
     async def handle(self, event_type: str, ctx: AspectContext) -> None:
         """이벤트 처리 — 하위 클래스에서 오버라이드."""
-        logger.debug(
-            "aspect_handle",
-            aspect=self._name,
-            event=event_type,
-            agent=ctx.agent_name,
-        )
+        self._log.debug("aspect_handle", event=event_type, agent=ctx.agent_name)
+
+    async def shutdown(self) -> None:
+        """종료 훅 — 버퍼를 가진 handler가 오버라이드하여 잔여 데이터를 기록."""
 
 
 class AspectEngine:
@@ -101,6 +128,11 @@ class AspectEngine:
     def __init__(self) -> None:
         self._handlers: list[AspectHandler] = []
         self._handler_registry: dict[str, type[AspectHandler]] = {}
+        # event_type → 매칭 handler 목록 (order 정렬 유지). 미색인 이벤트는 wildcard만 매칭
+        self._handlers_by_event: dict[str, list[AspectHandler]] = {}
+        self._wildcard_handlers: list[AspectHandler] = []
+        # (event_type, agent_name) → 이벤트/agent 필터를 모두 통과한 handler 튜플
+        self._dispatch_cache: dict[tuple[str, str], tuple[AspectHandler, ...]] = {}
 
     def register_handler_type(self, aspect_type: str, handler_cls: type[AspectHandler]) -> None:
         """Aspect type → Handler 클래스 매핑 등록.
@@ -122,6 +154,7 @@ class AspectEngine:
 
         # order 기준 정렬 (낮을수록 먼저)
         self._handlers.sort(key=lambda h: h.order)
+        self._rebuild_event_index()
 
         logger.info(
             "aspect_registered",
@@ -131,6 +164,29 @@ class AspectEngine:
             events=manifest.spec.pointcut.events,
         )
 
+    def _rebuild_event_index(self) -> None:
+        """handler 목록을 event_type 별로 색인 — 등록 시점에 1회 수행."""
+        self._wildcard_handlers = [h for h in self._handlers if not h.events]
+        event_types = {event for h in self._handlers for event in h.events}
+        self._handlers_by_event = {
+            event: [h for h in self._handlers if not h.events or event in h.events]
+            for event in event_types
+        }
+        self._dispatch_cache.clear()
+
+    def _handlers_for(self, event_type: str, agent_name: str) -> tuple[AspectHandler, ...]:
+        """(event_type, agent) 조합별 실행 대상을 1회 계산 후 캐시 — 등록 시 무효화."""
+        key = (event_type, agent_name)
+        handlers = self._dispatch_cache.get(key)
+        if handlers is None:
+            handlers = tuple(
+                h
+                for h in self._handlers_by_event.get(event_type, self._wildcard_handlers)
+                if not h.target_agents or agent_name in h.target_agents
+            )
+            self._dispatch_cache[key] = handlers
+        return handlers
+
     async def apply(
         self,
         event_type: str,
@@ -145,49 +201,40 @@ class AspectEngine:
         """
         ctx.event_type = event_type
 
-        for handler in self._handlers:
-            if not self._matches(handler, event_type, ctx):
-                continue
-
+        for handler in self._handlers_for(event_type, ctx.agent_name):
             try:
                 await handler.handle(event_type, ctx)
             except Exception as e:
-                logger.error(
+                handler._log.error(
                     "aspect_handle_error",
-                    aspect=handler.name,
                     event_type=event_type,
                     agent=ctx.agent_name,
                     error_msg=str(e),
                 )
 
-    def _matches(
-        self,
-        handler: AspectHandler,
-        event_type: str,
-        ctx: AspectContext,
-    ) -> bool:
-        """handler가 이 이벤트에 적용되어야 하는지 판단."""
-        # 이벤트 타입 매칭
-        if handler.events and event_type not in handler.events:
-            return False
-
-        # agent 이름 필터
-        if handler.target_agents and ctx.agent_name not in handler.target_agents:
-            return False
-
-        return True
+    async def shutdown(self) -> None:
+        """등록된 모든 handler의 종료 훅 실행."""
+        for handler in self._handlers:
+            try:
+                await handler.shutdown()
+            except Exception as e:
+                handler._log.error("aspect_shutdown_error", error_msg=str(e))
 
     @property
     def handler_count(self) -> int:
         return len(self._handlers)
 
+    def handlers_of[H: AspectHandler](self, handler_cls: type[H]) -> list[H]:
+        """특정 Handler 클래스의 인스턴스 목록 (서버가 의존성을 주입할 때 사용)."""
+        return [h for h in self._handlers if isinstance(h, handler_cls)]
+
     def list_handlers(self) -> list[dict[str, Any]]:
         """등록된 handler 요약 목록."""
         return [
             {
                 "name": h.name,
                 "order": h.order,
-                "events": h.events,
+                "events": sorted(h.events),
             }
             for h in self._handlers
         ]
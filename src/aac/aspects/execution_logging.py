@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
 
 import structlog
 
@@ -16,6 +16,29 @@ from aac.models.manifest import AspectManifest
 logger = structlog.get_logger()
 
 
+# 정적 로그 템플릿 — 실제 포맷은 aac_log가 출력 시점에만 수행
+_PRE_QUERY = "🎯 [ASPECT] PreQuery: prompt=%s..."
+_POST_QUERY = "🎯 [ASPECT] PostQuery: %s (%dms, $%.4f)"
+_ON_ERROR = "🎯 [ASPECT] OnError: %s"
+_PRE_TOOL_USE = "🎯 [ASPECT] PreToolUse: %s"
+_POST_TOOL_USE = "🎯 [ASPECT] PostToolUse: %s (%dms)"
+
+# event_type → (템플릿, 인자 추출기) — if/elif 체인 대신 dict 1회 조회
+_MESSAGE_BUILDERS: dict[str, tuple[str, Callable[[AspectContext], tuple[object, ...]]]] = {
+    AspectEventType.PRE_QUERY: (_PRE_QUERY, lambda ctx: (ctx.prompt_summary[:60],)),
+    AspectEventType.POST_QUERY: (
+        _POST_QUERY,
+        lambda ctx: ("✗" if ctx.error else "✓", ctx.duration_ms, ctx.cost_usd),
+    ),
+    AspectEventType.ON_ERROR: (_ON_ERROR, lambda ctx: (ctx.error,)),
+    AspectEventType.PRE_TOOL_USE: (_PRE_TOOL_USE, lambda ctx: (ctx.tool_name,)),
+    AspectEventType.POST_TOOL_USE: (
+        _POST_TOOL_USE,
+        lambda ctx: (ctx.tool_name, ctx.duration_ms),
+    ),
+}
+
+
 class ExecutionLoggingHandler(AspectHandler):
     """실행 로그 콘솔 출력 Aspect."""
 
@@ -23,40 +46,8 @@ class ExecutionLoggingHandler(AspectHandler):
         super().__init__(manifest)
 
     async def handle(self, event_type: str, ctx: AspectContext) -> None:
-        if event_type == AspectEventType.PRE_QUERY:
-            aac_log(
-                ctx.agent_name,
-                ctx.session_id,
-                ctx.tx_id,
-                f"🎯 [ASPECT] PreQuery: prompt={ctx.prompt[:60]}...",
-            )
-        elif event_type == AspectEventType.POST_QUERY:
-            status = "✓" if not ctx.error else "✗"
-            aac_log(
-                ctx.agent_name,
-                ctx.session_id,
-                ctx.tx_id,
-                f"🎯 [ASPECT] PostQuery: {status} "
-                f"({ctx.duration_ms}ms, ${ctx.cost_usd:.4f})",
-            )
-        elif event_type == AspectEventType.ON_ERROR:
-            aac_log(
-                ctx.agent_name,
-                ctx.session_id,
-                ctx.tx_id,
-                f"🎯 [ASPECT] OnError: {ctx.error}",
-            )
-        elif event_type == AspectEventType.PRE_TOOL_USE:
-            aac_log(
-                ctx.agent_name,
-                ctx.session_id,
-                ctx.tx_id,
-                f"🎯 [ASPECT] PreToolUse: {ctx.tool_name}",
-            )
-        elif event_type == AspectEventType.POST_TOOL_USE:
-            aac_log(
-                ctx.agent_name,
-                ctx.session_id,
-                ctx.tx_id,
-                f"🎯 [ASPECT] PostToolUse: {ctx.tool_name} ({ctx.duration_ms}ms)",
-            )
+        entry = _MESSAGE_BUILDERS.get(event_type)
+        if entry is None:
+            return
+        template, extract_args = entry
+        aac_log(ctx.agent_name, ctx.session_id, ctx.tx_id, template, *extract_args(ctx))
@@ -6,80 +6,81 @@ Agent별 tool 사용 통계를 메모리에 집계한다.
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import dataclass, field
+import threading
+from array import array
 from typing import Any
 
-import structlog
-
 from aac.aspects.engine import AspectContext, AspectEventType, AspectHandler
 from aac.models.manifest import AspectManifest
 
-logger = structlog.get_logger()
-
-
-@dataclass
-class ToolStats:
-    """개별 Tool 사용 통계."""
-
-    call_count: int = 0
-    success_count: int = 0
-    error_count: int = 0
-    total_duration_ms: int = 0
+_FIELDS = ("call_count", "success_count", "error_count", "total_duration_ms")
+# 인덱스별 stride 내 오프셋
+_CALL, _SUCCESS, _ERROR, _DURATION = range(len(_FIELDS))
+_STRIDE = len(_FIELDS)
 
 
 class ToolTrackingHandler(AspectHandler):
-    """Tool 사용 통계 추적 Aspect."""
+    """Tool 사용 통계 추적 Aspect.
+
+    통계는 (agent, tool) 인덱스마다 [call, success, error, duration] 4칸을 차지하는
+    단일 int64 배열에 저장하며, 카운터 증가는 배열 제자리 갱신이다.
+    """
 
     def __init__(self, manifest: AspectManifest) -> None:
         super().__init__(manifest)
-        # agent_name → tool_name → ToolStats
-        self._stats: dict[str, dict[str, ToolStats]] = defaultdict(
-            lambda: defaultdict(ToolStats)
-        )
+        # (agent_name, tool_name) → 배열 base 오프셋
+        self._index: dict[tuple[str, str], int] = {}
+        self._counters = array("q")
+        # 신규 (agent, tool) 등록 경로만 보호 — 카운터 증가에는 락을 쓰지 않음
+        self._index_lock = threading.Lock()
+
+    def _add_key(self, key: tuple[str, str]) -> int:
+        """새 (agent, tool) 조합에 base 오프셋 할당."""
+        with self._index_lock:
+            base = self._index.get(key)
+            if base is None:
+                base = len(self._counters)
+                self._counters.extend((0,) * _STRIDE)
+                self._index[key] = base
+            return base
 
     async def handle(self, event_type: str, ctx: AspectContext) -> None:
         if not ctx.tool_name:
             return
 
-        stats = self._stats[ctx.agent_name][ctx.tool_name]
+        key = (ctx.agent_name, ctx.tool_name)
+        base = self._index.get(key)
+        if base is None:
+            base = self._add_key(key)
 
+        counters = self._counters
         if event_type == AspectEventType.PRE_TOOL_USE:
-            stats.call_count += 1
-            logger.debug(
+            counters[base + _CALL] += 1
+            self._log.debug(
                 "tool_tracking_call",
                 agent=ctx.agent_name,
                 tool=ctx.tool_name,
-                count=stats.call_count,
+                count=counters[base + _CALL],
             )
         elif event_type == AspectEventType.POST_TOOL_USE:
             if ctx.error:
-                stats.error_count += 1
+                counters[base + _ERROR] += 1
             else:
-                stats.success_count += 1
-            stats.total_duration_ms += ctx.duration_ms
+                counters[base + _SUCCESS] += 1
+            counters[base + _DURATION] += ctx.duration_ms
 
     def get_stats(self, agent_name: str | None = None) -> dict[str, Any]:
         """통계 조회. agent_name 지정 시 해당 agent만."""
+        with self._index_lock:
+            entries = list(self._index.items())
+            values = self._counters.tolist()
+        result: dict[str, dict[str, dict[str, int]]] = {}
+        for (agent, tool), base in entries:
+            if agent_name and agent != agent_name:
+                continue
+            result.setdefault(agent, {})[tool] = dict(
+                zip(_FIELDS, values[base:base + _STRIDE], strict=True)
+            )
         if agent_name:
-            return {
-                tool: {
-                    "call_count": s.call_count,
-                    "success_count": s.success_count,
-                    "error_count": s.error_count,
-                    "total_duration_ms": s.total_duration_ms,
-                }
-                for tool, s in self._stats.get(agent_name, {}).items()
-            }
-        return {
-            agent: {
-                tool: {
-                    "call_count": s.call_count,
-                    "success_count": s.success_count,
-                    "error_count": s.error_count,
-                    "total_duration_ms": s.total_duration_ms,
-                }
-                for tool, s in tools.items()
-            }
-            for agent, tools in self._stats.items()
-        }
+            return result.get(agent_name, {})
+        return result
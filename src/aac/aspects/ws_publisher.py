@@ -1,13 +1,18 @@
 """WebSocketPublisherAspect — WebSocket 이벤트 발행 (FR-9.3).
 
 Aspect 이벤트를 WebSocket으로 연결된 모든 클라이언트에 broadcast한다.
+
+같은 이벤트 루프 tick에 발생한 이벤트는 한 프레임으로 묶어 전송한다.
+이벤트가 1개면 JSON 객체, 2개 이상이면 JSON 배열 프레임이 된다.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-from aac.aspects.engine import AspectContext, AspectHandler
+from aac.aspects.engine import AspectContext, AspectEventType, AspectHandler
 from aac.models.events import (
     AACEvent,
     AgentStatusChangeEvent,
@@ -18,7 +23,7 @@ from aac.models.events import (
 from aac.models.manifest import AspectManifest
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine
+    from collections.abc import Coroutine
 
 
 class WebSocketPublisherHandler(AspectHandler):
@@ -26,68 +31,140 @@ class WebSocketPublisherHandler(AspectHandler):
 
     def __init__(self, manifest: AspectManifest) -> None:
         super().__init__(manifest)
-        self._broadcast_fn: Callable[[dict[str, Any]], Coroutine] | None = None
+        self._broadcast_fn: Callable[[str], Coroutine] | None = None
+        self._client_count_fn: Callable[[], int] | None = None
+        # 직렬화된 이벤트 대기열 — 다음 tick에 한 프레임으로 전송
+        self._pending: list[str] = []
+        self._max_pending: int = self._config.get("max_pending", 256)
+        self._flush_task: asyncio.Task[None] | None = None
+        self._send_lock = asyncio.Lock()
 
     def set_broadcast(
         self,
-        fn: Callable[[dict[str, Any]], Coroutine],
+        fn: Callable[[str], Coroutine],
+        client_count_fn: Callable[[], int] | None = None,
     ) -> None:
-        """broadcast 함수 주입 — ConnectionManager.broadcast."""
+        """broadcast 함수 주입 — ConnectionManager.broadcast.
+
+        fn은 직렬화가 끝난 JSON 문자열을 받는다 (클라이언트마다 재직렬화하지 않음).
+
+        client_count_fn이 주어지면 연결된 클라이언트가 없을 때 이벤트 생성 자체를 건너뛴다.
+        ConnectionManager.connection_count는 property이므로
+        `lambda: manager.connection_count`로 넘긴다 (create_app 참고).
+        """
         self._broadcast_fn = fn
+        self._client_count_fn = client_count_fn
 
     async def handle(self, event_type: str, ctx: AspectContext) -> None:
         if self._broadcast_fn is None:
             return
+        if self._client_count_fn is not None and self._client_count_fn() == 0:
+            return
 
         event = self._build_event(event_type, ctx)
-        if event:
-            await self._broadcast_fn(event.model_dump())
+        if event is None:
+            return
+
+        self._pending.append(event.to_json())
+        if len(self._pending) >= self._max_pending:
+            # backpressure — 대기열이 가득 차면 호출자가 전송 완료까지 기다린다
+            await self._send_pending()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._send_pending())
+
+    async def _send_pending(self) -> None:
+        """대기 중인 이벤트를 한 프레임으로 broadcast (전송 순서 보장을 위해 직렬화)."""
+        async with self._send_lock:
+            self._flush_task = None
+            if not self._pending or self._broadcast_fn is None:
+                return
+            batch, self._pending = self._pending, []
+            frame = batch[0] if len(batch) == 1 else "[" + ",".join(batch) + "]"
+            await self._broadcast_fn(frame)
+
+    async def flush(self) -> None:
+        """대기 중인 이벤트를 즉시 전송."""
+        await self._send_pending()
+
+    async def shutdown(self) -> None:
+        await self.flush()
 
     def _build_event(self, event_type: str, ctx: AspectContext) -> AACEvent | None:
         """이벤트 타입에 따라 적절한 AACEvent 생성."""
-        base = {
-            "session_id": ctx.session_id,
-            "tx_id": ctx.tx_id,
-        }
-
-        if event_type == "PreQuery":
-            return QueryStartEvent(
-                **base,
-                payload={
-                    "agent": ctx.agent_name,
-                    "prompt": ctx.prompt[:200],
-                    "execution_id": ctx.execution_id,
-                },
-            )
-        elif event_type == "PostQuery":
-            return QueryCompleteEvent(
-                **base,
-                payload={
-                    "agent": ctx.agent_name,
-                    "success": ctx.error is None,
-                    "cost_usd": ctx.cost_usd,
-                    "duration_ms": ctx.duration_ms,
-                    "model": ctx.model,
-                    "execution_id": ctx.execution_id,
-                },
-            )
-        elif event_type in ("PreToolUse", "PostToolUse"):
-            return ToolUseEvent(
-                **base,
-                payload={
-                    "agent": ctx.agent_name,
-                    "tool_name": ctx.tool_name,
-                    "phase": "pre" if event_type == "PreToolUse" else "post",
-                    "duration_ms": ctx.duration_ms if event_type == "PostToolUse" else 0,
-                },
-            )
-        elif event_type == "OnError":
-            return AgentStatusChangeEvent(
-                **base,
-                payload={
-                    "agent": ctx.agent_name,
-                    "status": "error",
-                    "error": ctx.error,
-                },
-            )
-        return None
+        builder = _EVENT_BUILDERS.get(event_type)
+        return builder(ctx) if builder else None
+
+
+def _query_start(ctx: AspectContext) -> AACEvent:
+    return QueryStartEvent(
+        session_id=ctx.session_id,
+        tx_id=ctx.tx_id,
+        payload={
+            "agent": ctx.agent_name,
+            "prompt": ctx.prompt_summary[:200],
+            "execution_id": ctx.execution_id,
+        },
+    )
+
+
+def _query_complete(ctx: AspectContext) -> AACEvent:
+    return QueryCompleteEvent(
+        session_id=ctx.session_id,
+        tx_id=ctx.tx_id,
+        payload={
+            "agent": ctx.agent_name,
+            "success": ctx.error is None,
+            "cost_usd": ctx.cost_usd,
+            "duration_ms": ctx.duration_ms,
+            "model": ctx.model,
+            "execution_id": ctx.execution_id,
+        },
+    )
+
+
+def _tool_use_pre(ctx: AspectContext) -> AACEvent:
+    return ToolUseEvent(
+        session_id=ctx.session_id,
+        tx_id=ctx.tx_id,
+        payload={
+            "agent": ctx.agent_name,
+            "tool_name": ctx.tool_name,
+            "phase": "pre",
+            "duration_ms": 0,
+        },
+    )
+
+
+def _tool_use_post(ctx: AspectContext) -> AACEvent:
+    return ToolUseEvent(
+        session_id=ctx.session_id,
+        tx_id=ctx.tx_id,
+        payload={
+            "agent": ctx.agent_name,
+            "tool_name": ctx.tool_name,
+            "phase": "post",
+            "duration_ms": ctx.duration_ms,
+        },
+    )
+
+
+def _status_error(ctx: AspectContext) -> AACEvent:
+    return AgentStatusChangeEvent(
+        session_id=ctx.session_id,
+        tx_id=ctx.tx_id,
+        payload={
+            "agent": ctx.agent_name,
+            "status": "error",
+            "error": ctx.error,
+        },
+    )
+
+
+# event_type → AACEvent 생성기 (if/elif 체인 대신 dict 1회 조회)
+_EVENT_BUILDERS: dict[str, Callable[[AspectContext], AACEvent]] = {
+    AspectEventType.PRE_QUERY: _query_start,
+    AspectEventType.POST_QUERY: _query_complete,
+    AspectEventType.PRE_TOOL_USE: _tool_use_pre,
+    AspectEventType.POST_TOOL_USE: _tool_use_post,
+    AspectEventType.ON_ERROR: _status_error,
+}
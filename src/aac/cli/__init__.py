@@ -0,0 +1,22 @@
+"""AAC CLI 패키지 — `aac` 엔트리포인트."""
+
+from __future__ import annotations
+
+import sys
+
+from aac import __version__
+
+
+def run() -> None:
+    """`aac` 엔트리포인트.
+
+    `aac --version`은 Click/명령 그룹을 로드하지 않고 바로 응답한다.
+    그 외 인자는 aac.cli.main.cli로 위임한다.
+    """
+    if sys.argv[1:] == ["--version"]:
+        sys.stdout.write(f"aac, version {__version__}\n")
+        return
+
+    from aac.cli.main import cli
+
+    cli()
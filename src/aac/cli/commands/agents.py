@@ -0,0 +1,80 @@
+"""aac agents — Agent 목록 조회."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import click
+
+from aac.cli.utils import (
+    RESOURCES_DIR_TYPE,
+    ColumnSpec,
+    console,
+    new_table,
+    print_agents_table,
+    resolve_resources_dir,
+    scan_resources,
+    stream_json_array,
+)
+
+_AGENTS_COLUMNS: ColumnSpec = (
+    ("이름", {"style": "bold"}),
+    ("Status", {"style": "cyan"}),
+    ("Runtime", {"style": "yellow"}),
+    ("Scope", {}),
+    ("Tools", {"justify": "right"}),
+    ("Skills", {"justify": "right"}),
+    ("Queries", {"justify": "right"}),
+)
+
+
+@click.command()
+@click.option("--url", default="http://127.0.0.1:8800", help="AAC 서버 URL")
+@click.option("--local", "-l", is_flag=True, help="로컬 resources/ 직접 스캔 (서버 불필요)")
+@click.option(
+    "--resources", "-r",
+    type=RESOURCES_DIR_TYPE,
+    default=None,
+    help="--local 사용 시 resources/ 경로",
+)
+def agents(url: str, local: bool, resources: Path | None) -> None:
+    """🤖 Agent 목록 조회."""
+    if local:
+        resources_path = resolve_resources_dir(resources)
+        result = scan_resources(resources_path)
+        print_agents_table(result.agents)
+        return
+
+    # HTTP 클라이언트로 서버에서 조회
+    _render_agents_from_api(stream_json_array(f"{url}/api/agents"))
+
+
+def _render_agents_from_api(data: Iterable[dict[str, Any]]) -> None:
+    """서버 API에서 가져온 Agent 목록 출력."""
+    table = new_table(
+        _AGENTS_COLUMNS, title="🤖 Agents", show_header=True, header_style="bold magenta"
+    )
+
+    for agent in data:
+        status_val = agent.get("status", "?")
+        if status_val == "ready":
+            status_display = "[green]●[/green] ready"
+        elif status_val == "lazy":
+            status_display = "[yellow]⏸[/yellow] lazy"
+        elif status_val == "executing":
+            status_display = "[blue]▶[/blue] exec"
+        else:
+            status_display = status_val
+
+        table.add_row(
+            agent.get("name", "?"),
+            status_display,
+            agent.get("runtime", "?"),
+            agent.get("scope", "?"),
+            str(agent.get("tools_loaded_count", 0)),
+            str(len(agent.get("skills", []))),
+            str(agent.get("query_count", 0)),
+        )
+    console().print(table)
@@ -0,0 +1,32 @@
+"""aac cancel — 비동기 실행 취소."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from aac.cli.utils import console, error_console, request_json
+
+
+@click.command()
+@click.argument("execution_id")
+@click.option("--url", default="http://127.0.0.1:8800", help="AAC 서버 URL")
+def cancel(execution_id: str, url: str) -> None:
+    """🛑 실행 취소.
+
+    \b
+    예시:
+      aac cancel exec_a1b2c3d4
+    """
+    try:
+        data = request_json(f"{url}/api/executions/{execution_id}", method="DELETE")
+
+        status_val = data.get("status", "?")
+        if status_val == "cancelled":
+            console().print(f"[green]✓ 실행 취소됨: {execution_id}[/green]")
+        else:
+            console().print(f"[yellow]⚠ 취소 불가: {status_val}[/yellow]")
+    except Exception as e:
+        error_console().print(f"[red]✗ 취소 실패: {e}[/red]")
+        sys.exit(1)
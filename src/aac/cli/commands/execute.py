@@ -0,0 +1,283 @@
+"""aac execute — 프롬프트를 Agent에게 전달 (동기/SSE/비동기)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any
+
+import click
+
+from aac.cli.utils import console, error_console, open_url, run_async
+
+_SSE_READ_SIZE = 16 * 1024
+
+# 요청 헤더 (urllib Request는 전달받은 dict를 변경하지 않으므로 공유)
+_JSON_HEADERS: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
+_SSE_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"Content-Type": "application/json", "Accept": "text/event-stream"}
+)
+
+# text 토큰 버퍼 — 이 크기를 넘거나 문장 경계에서 stdout으로 내보낸다
+_TEXT_FLUSH_SIZE = 256
+_TEXT_FLUSH_ENDINGS = ("\n", ".", "!", "?", "。")
+
+
+@click.command()
+@click.argument("agent_name")
+@click.argument("prompt")
+@click.option("--url", default="http://127.0.0.1:8800", help="AAC 서버 URL")
+@click.option("--stream", "-s", is_flag=True, help="SSE 스트리밍 모드")
+@click.option("--async-mode", "-a", is_flag=True, help="비동기 실행 모드")
+def execute(agent_name: str, prompt: str, url: str, stream: bool, async_mode: bool) -> None:
+    """⚡ Agent 실행 — 프롬프트를 Agent에게 전달.
+
+    \b
+    예시:
+      aac execute claude-coder "Hello, world를 출력하는 Python 코드를 작성해줘"
+      aac execute claude-coder "코드 리뷰해줘" --stream
+      aac execute claude-coder "분석해줘" --async-mode
+      aac execute claude-coder,gemini-coder "같은 질문"   # 여러 Agent 동시 실행
+    """
+    agent_names = [name.strip() for name in agent_name.split(",") if name.strip()]
+    if not agent_names:
+        raise click.UsageError("Agent 이름을 입력하세요")
+    if len(agent_names) > 1:
+        if stream:
+            raise click.UsageError("--stream은 단일 Agent에만 사용할 수 있습니다")
+        _execute_many(agent_names, prompt, url, async_mode)
+        return
+    # 단일 Agent — 공백/끝 쉼표를 정리한 이름 사용 ("foo," → "foo")
+    agent_name = agent_names[0]
+
+    try:
+        payload = json.dumps({"prompt": prompt}).encode()
+        headers = _SSE_HEADERS if stream else _JSON_HEADERS
+        query = "?async=true" if async_mode else ""
+
+        with open_url(
+            f"{url}/api/agents/{agent_name}/execute{query}",
+            method="POST",
+            data=payload,
+            headers=headers,
+            timeout=600,
+        ) as resp:
+            if stream:
+                # SSE 스트리밍
+                console().print(f"[dim]▶ Streaming from {agent_name}...[/dim]")
+                # 청크 단위로 읽어 이벤트 프레임(빈 줄 구분)마다 data만 bytes로 파싱
+                chunks = iter(lambda: resp.read1(_SSE_READ_SIZE), b"")
+                text_out = _TextStreamWriter()
+                for data_bytes in _iter_sse(chunks):
+                    try:
+                        event = json.loads(data_bytes)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        text_out.flush()
+                        console().print(data_bytes.decode(errors="replace"), end="")
+                    else:
+                        _render_sse_event(event, text_out)
+                text_out.flush()
+            else:
+                data = json.loads(resp.read())
+                if async_mode:
+                    _render_async_response(data)
+                else:
+                    _render_execute_response(data)
+
+    except Exception as e:
+        error_console().print(f"[red]✗ 실행 실패: {e}[/red]")
+        sys.exit(1)
+
+
+def _execute_many(agent_names: list[str], prompt: str, url: str, async_mode: bool) -> None:
+    """여러 Agent에 같은 프롬프트를 동시에 보내고, 입력 순서대로 결과를 렌더링."""
+    payload = json.dumps({"prompt": prompt}).encode()
+    query = "?async=true" if async_mode else ""
+    targets = [f"{url}/api/agents/{name}/execute{query}" for name in agent_names]
+
+    results = run_async(_post_all(targets, payload))
+
+    failed = False
+    for name, result in zip(agent_names, results, strict=True):
+        if isinstance(result, BaseException):
+            error_console().print(f"[red]✗ {name} 실행 실패: {result}[/red]")
+            failed = True
+        elif async_mode:
+            _render_async_response(result)
+        else:
+            _render_execute_response(result)
+    if failed:
+        sys.exit(1)
+
+
+async def _post_all(targets: list[str], payload: bytes) -> list[Any]:
+    """대상 URL들에 POST를 병렬로 보낸다 (요청당 스레드 하나, 예외는 결과로 반환)."""
+    import asyncio
+
+    return await asyncio.gather(
+        *(asyncio.to_thread(_post_json, target, payload) for target in targets),
+        return_exceptions=True,
+    )
+
+
+def _post_json(target: str, payload: bytes) -> Any:
+    with open_url(
+        target, method="POST", data=payload, headers=_JSON_HEADERS, timeout=600
+    ) as resp:
+        return json.loads(resp.read())
+
+
+def _iter_sse(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """SSE 바이트 스트림을 이벤트 단위로 나눠 data 필드(bytes)를 yield한다.
+
+    이벤트 경계(빈 줄)는 bytes.find로 찾고, 줄 단위 decode/strip은 하지 않는다.
+    여러 data 줄은 SSE 규격대로 "\\n"으로 합치며, 주석(":")/기타 필드는 무시한다.
+    """
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        # 청크 경계에 걸친 CRLF를 깨지 않도록 마지막 CR은 다음 청크까지 보류
+        held = buf.endswith(b"\r")
+        if held:
+            del buf[-1]
+        if b"\r" in buf:
+            buf[:] = buf.replace(b"\r\n", b"\n")
+        start = 0
+        while (end := buf.find(b"\n\n", start)) != -1:
+            data = _sse_data(bytes(buf[start:end]))
+            if data is not None:
+                yield data
+            start = end + 2
+        del buf[:start]
+        if held:
+            buf += b"\r"
+
+    if buf.strip():
+        data = _sse_data(bytes(buf.replace(b"\r\n", b"\n").rstrip(b"\n")))
+        if data is not None:
+            yield data
+
+
+def _sse_data(frame: bytes) -> bytes | None:
+    """이벤트 프레임 하나에서 data 필드 값을 추출 (없으면 None)."""
+    parts = []
+    for line in frame.split(b"\n"):
+        if line.startswith(b"data:"):
+            value = line[5:]
+            parts.append(value[1:] if value.startswith(b" ") else value)
+    return b"\n".join(parts) if parts else None
+
+
+def _render_execute_response(data: dict[str, Any]) -> None:
+    """동기 실행 결과 렌더링."""
+    from rich.panel import Panel
+
+    success = data.get("success", False)
+    icon = "[green]✓[/green]" if success else "[red]✗[/red]"
+
+    console().print()
+    console().print(Panel(
+        f"{icon} Agent: [bold]{data.get('agent', '?')}[/bold]\n"
+        f"  execution_id: [dim]{data.get('execution_id', '?')}[/dim]\n"
+        f"  session_id: [dim]{data.get('session_id', '?')}[/dim]\n"
+        f"  tx_id: [dim]{data.get('tx_id', '?')}[/dim]\n"
+        f"  model: {data.get('model', '?')}\n"
+        f"  cost: ${data.get('cost_usd', 0):.4f}\n"
+        f"  duration: {data.get('duration_ms', 0)}ms",
+        title="⚡ Execution Result",
+        border_style="green" if success else "red",
+    ))
+
+    if data.get("result"):
+        console().print()
+        console().print(Panel(data["result"], title="📝 Response", border_style="blue"))
+
+    if data.get("error"):
+        console().print()
+        error_console().print(Panel(data["error"], title="❌ Error", border_style="red"))
+
+
+def _render_async_response(data: dict[str, Any]) -> None:
+    """비동기 실행 응답 렌더링."""
+    from rich.panel import Panel
+
+    console().print()
+    console().print(Panel(
+        f"execution_id: [bold]{data.get('execution_id', '?')}[/bold]\n"
+        f"status: [yellow]{data.get('status', '?')}[/yellow]\n"
+        f"poll_url: [cyan]{data.get('poll_url', '?')}[/cyan]",
+        title="⏳ Async Execution Started",
+        border_style="yellow",
+    ))
+    console().print(f"\n[dim]폴링 확인: aac poll {data.get('execution_id', '')}[/dim]")
+
+
+class _TextStreamWriter:
+    """SSE text 토큰을 모아 stdout에 직접 쓰는 버퍼.
+
+    토큰마다 Rich markup 파싱 + flush를 하지 않고,
+    _TEXT_FLUSH_SIZE 이상 쌓이거나 문장 경계에서 한 번에 write한다.
+    """
+
+    __slots__ = ("_parts", "_size")
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, content: str) -> None:
+        self._parts.append(content)
+        self._size += len(content)
+        if self._size >= _TEXT_FLUSH_SIZE or content.endswith(_TEXT_FLUSH_ENDINGS):
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._parts:
+            return
+        out = console().file
+        out.write("".join(self._parts))
+        out.flush()
+        self._parts.clear()
+        self._size = 0
+
+
+def _sse_text(event: dict[str, Any], text_out: _TextStreamWriter) -> None:
+    if content := event.get("content", ""):
+        text_out.write(content)
+
+
+def _sse_tool_call(event: dict[str, Any], text_out: _TextStreamWriter) -> None:
+    text_out.flush()
+    console().print(f"\n[yellow]🔧 Tool: {event.get('tool_name', '?')}[/yellow]")
+
+
+def _sse_error(event: dict[str, Any], text_out: _TextStreamWriter) -> None:
+    text_out.flush()
+    error_console().print(f"\n[red]❌ Error: {event.get('content', '')}[/red]")
+
+
+def _sse_done(event: dict[str, Any], text_out: _TextStreamWriter) -> None:
+    text_out.flush()
+    meta = event.get("metadata", {})
+    console().print(
+        f"\n[green]✓ Done[/green] "
+        f"({meta.get('duration_ms', 0)}ms, ${meta.get('cost_usd', 0):.4f})"
+    )
+
+
+# SSE 이벤트 type → 렌더러 (text 외 렌더러는 쌓인 text를 먼저 flush해 순서를 유지)
+_SSE_RENDERERS: dict[str, Callable[[dict[str, Any], _TextStreamWriter], None]] = {
+    "text": _sse_text,
+    "tool_call": _sse_tool_call,
+    "error": _sse_error,
+    "done": _sse_done,
+}
+
+
+def _render_sse_event(event: dict[str, Any], text_out: _TextStreamWriter) -> None:
+    """SSE 이벤트를 리치 출력 (text 토큰은 text_out 버퍼 경유)."""
+    renderer = _SSE_RENDERERS.get(event.get("type", ""))
+    if renderer is not None:
+        renderer(event, text_out)
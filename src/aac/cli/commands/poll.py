@@ -0,0 +1,89 @@
+"""aac poll — 비동기 실행 상태 폴링."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from aac.cli.utils import (
+    KeepAliveClient,
+    console,
+    error_console,
+    new_key_value_table,
+    request_json,
+)
+
+
+@click.command()
+@click.argument("execution_id")
+@click.option("--url", default="http://127.0.0.1:8800", help="AAC 서버 URL")
+@click.option("--watch", "-w", is_flag=True, help="완료될 때까지 반복 폴링")
+@click.option("--interval", default=2.0, type=float, help="폴링 간격 (초)")
+def poll(execution_id: str, url: str, watch: bool, interval: float) -> None:
+    """🔍 비동기 실행 상태 폴링.
+
+    \b
+    예시:
+      aac poll exec_a1b2c3d4
+      aac poll exec_a1b2c3d4 --watch
+    """
+    import time
+    from contextlib import nullcontext
+
+    from rich.panel import Panel
+
+    path = f"/api/executions/{execution_id}"
+    # --watch는 같은 연결로 반복 조회 (요청마다 새 TCP 연결을 맺지 않음)
+    client = KeepAliveClient(url) if watch else None
+
+    with client or nullcontext():
+        while True:
+            try:
+                if client is not None:
+                    data = client.get_json(path)
+                else:
+                    data = request_json(f"{url}{path}")
+            except Exception as e:
+                error_console().print(f"[red]✗ 조회 실패: {e}[/red]")
+                sys.exit(1)
+
+            status_val = data.get("status", "unknown")
+            if status_val == "running":
+                status_display = "[yellow]● RUNNING[/yellow]"
+            elif status_val == "completed":
+                status_display = "[green]● COMPLETED[/green]"
+            elif status_val == "error":
+                status_display = "[red]● ERROR[/red]"
+            elif status_val == "cancelled":
+                status_display = "[dim]● CANCELLED[/dim]"
+            else:
+                status_display = f"[dim]● {status_val}[/dim]"
+
+            if not watch or status_val != "running":
+                # 최종 출력
+                table = new_key_value_table()
+                table.add_row("Execution", data.get("execution_id", "?"))
+                table.add_row("Agent", data.get("agent", "?"))
+                table.add_row("Status", status_display)
+
+                if data.get("result"):
+                    table.add_row("Result", data["result"][:200])
+                if data.get("error"):
+                    table.add_row("Error", f"[red]{data['error']}[/red]")
+                if data.get("cost_usd"):
+                    table.add_row("Cost", f"${data['cost_usd']:.4f}")
+                if data.get("duration_ms"):
+                    table.add_row("Duration", f"{data['duration_ms']}ms")
+
+                console().print()
+                console().print(Panel(table, title="🔍 Execution Status", border_style="cyan"))
+                break
+
+            # 진행 중이면 간단 표시 후 대기
+            console().print(
+                f"  [dim]{status_display} {execution_id}... ({interval}s 후 재시도)[/dim]"
+            )
+            time.sleep(interval)
+
+    console().print()
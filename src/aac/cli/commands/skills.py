@@ -0,0 +1,77 @@
+"""aac skills — Skill 목록 조회."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import click
+
+from aac.cli.utils import (
+    RESOURCES_DIR_TYPE,
+    ColumnSpec,
+    console,
+    new_table,
+    resolve_resources_dir,
+    scan_resources,
+    stream_json_array,
+)
+
+_LOCAL_SKILLS_COLUMNS: ColumnSpec = (
+    ("이름", {"style": "bold"}),
+    ("Instruction 파일", {"style": "cyan"}),
+    ("Required Tools", {"style": "yellow"}),
+)
+_SKILLS_COLUMNS: ColumnSpec = (
+    ("이름", {"style": "bold"}),
+    ("Instruction", {"style": "cyan"}),
+    ("Required Tools", {"style": "yellow"}),
+)
+
+
+@click.command()
+@click.option("--url", default="http://127.0.0.1:8800", help="AAC 서버 URL")
+@click.option("--local", "-l", is_flag=True, help="로컬 resources/ 직접 스캔")
+@click.option(
+    "--resources", "-r",
+    type=RESOURCES_DIR_TYPE,
+    default=None,
+    help="--local 사용 시 resources/ 경로",
+)
+def skills(url: str, local: bool, resources: Path | None) -> None:
+    """📋 Skill 목록 조회."""
+    if local:
+        resources_path = resolve_resources_dir(resources)
+        result = scan_resources(resources_path)
+
+        table = new_table(
+            _LOCAL_SKILLS_COLUMNS, title="📋 Skills", show_header=True, header_style="bold green"
+        )
+
+        for skill in result.skills:
+            req_tools = ", ".join(skill.spec.required_tools) if skill.spec.required_tools else "—"
+            table.add_row(
+                skill.metadata.name,
+                skill.spec.instruction_file,
+                req_tools,
+            )
+        console().print(table)
+        return
+
+    _render_skills_from_api(stream_json_array(f"{url}/api/skills"))
+
+
+def _render_skills_from_api(data: Iterable[dict[str, Any]]) -> None:
+    """서버 API에서 가져온 Skill 목록 출력."""
+    table = new_table(
+        _SKILLS_COLUMNS, title="📋 Skills", show_header=True, header_style="bold green"
+    )
+
+    for skill in data:
+        table.add_row(
+            skill.get("name", "?"),
+            skill.get("instruction_file", "—"),
+            ", ".join(skill.get("required_tools", [])) or "—",
+        )
+    console().print(table)
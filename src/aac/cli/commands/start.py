@@ -0,0 +1,43 @@
+"""aac start — Context 기동 + HTTP API 서버."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+from aac.cli.utils import RESOURCES_DIR_TYPE, resolve_resources_dir, run_async
+
+
+@click.command()
+@click.option(
+    "--resources", "-r",
+    type=RESOURCES_DIR_TYPE,
+    default=None,
+    help="resources/ 디렉토리 경로 (기본: $AAC_RESOURCES 또는 ./resources)",
+)
+@click.option("--host", "-h", default="127.0.0.1", help="바인딩 호스트 (기본: 127.0.0.1)")
+@click.option("--port", "-p", default=8800, type=int, help="포트 번호 (기본: 8800)")
+@click.option(
+    "--strict", is_flag=True, help="strict mode — tool 충돌 또는 agent 초기화 실패 시 기동 실패",
+)
+def start(
+    resources: Path | None,
+    host: str,
+    port: int,
+    strict: bool,
+) -> None:
+    """🚀 AAC 서버 시작 — Context 기동 + HTTP API 서버.
+
+    Spring Boot의 `./gradlew bootRun`에 해당.
+    """
+    from aac.server.app import start_server
+
+    resources_path = resolve_resources_dir(resources)
+
+    run_async(start_server(
+        resources_dir=str(resources_path),
+        host=host,
+        port=port,
+        strict_tools=strict,
+    ))
@@ -0,0 +1,56 @@
+"""aac status — 서버 상태 조회."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from aac.cli.utils import console, error_console, new_key_value_table, request_json
+
+
+@click.command()
+@click.option("--url", default="http://127.0.0.1:8800", help="AAC 서버 URL")
+def status(url: str) -> None:
+    """📊 서버 상태 조회 — Context, Agent, Tool, Skill 요약."""
+    from rich.panel import Panel
+
+    try:
+        data = request_json(f"{url}/api/status")
+    except Exception as e:
+        error_console().print(f"[red]✗ 서버 연결 실패: {e}[/red]")
+        error_console().print(f"[dim]  서버가 실행 중인지 확인: {url}[/dim]")
+        sys.exit(1)
+
+    # 서버 상태 패널
+    if data.get("started"):
+        status_text = "[green bold]● RUNNING[/green bold]"
+    else:
+        status_text = "[red bold]● STOPPED[/red bold]"
+
+    table = new_key_value_table()
+
+    table.add_row("상태", status_text)
+    table.add_row("버전", data.get("version", "?"))
+    table.add_row("시작 시각", data.get("started_at", "—"))
+
+    agents_info = data.get("agents", {})
+    a_total = agents_info.get("total", 0)
+    a_active = agents_info.get("active", 0)
+    a_lazy = agents_info.get("lazy", 0)
+    table.add_row("Agents", f"{a_total} total, {a_active} active, {a_lazy} lazy")
+
+    tools_info = data.get("tools", {})
+    t_bundles = tools_info.get("bundles", 0)
+    t_total = tools_info.get("total", 0)
+    table.add_row("Tools", f"{t_bundles} bundles ({t_total} items)")
+
+    skills_info = data.get("skills", {})
+    table.add_row("Skills", f"{skills_info.get('total', 0)} total")
+
+    aspects_info = data.get("aspects", {})
+    table.add_row("Aspects", f"{aspects_info.get('total', 0)} total")
+
+    console().print()
+    console().print(Panel(table, title="📊 AAC Server Status", border_style="cyan"))
+    console().print()
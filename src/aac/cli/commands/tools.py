@@ -0,0 +1,77 @@
+"""aac tools — Tool 목록 조회."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import click
+
+from aac.cli.utils import (
+    RESOURCES_DIR_TYPE,
+    ColumnSpec,
+    console,
+    new_table,
+    resolve_resources_dir,
+    scan_resources,
+    stream_json_array,
+)
+
+_TOOLS_COLUMNS: ColumnSpec = (
+    ("Bundle", {"style": "bold", "no_wrap": True}),
+    ("Tool", {"style": "cyan", "no_wrap": True}),
+    ("설명", {}),
+)
+
+
+@click.command()
+@click.option("--url", default="http://127.0.0.1:8800", help="AAC 서버 URL")
+@click.option("--local", "-l", is_flag=True, help="로컬 resources/ 직접 스캔")
+@click.option(
+    "--resources", "-r",
+    type=RESOURCES_DIR_TYPE,
+    default=None,
+    help="--local 사용 시 resources/ 경로",
+)
+def tools(url: str, local: bool, resources: Path | None) -> None:
+    """🔧 Tool 목록 조회."""
+    if local:
+        resources_path = resolve_resources_dir(resources)
+        result = scan_resources(resources_path)
+
+        # 같은 이름 번들은 ToolRegistry.register와 동일하게 last-wins (위치는 최초 등록 순)
+        bundles = {manifest.metadata.name: manifest for manifest in result.tools}
+        _print_tools_table(
+            (bundle_name, item.name, item.description)
+            for bundle_name, manifest in bundles.items()
+            for item in manifest.spec.items
+        )
+        return
+
+    _render_tools_from_api(stream_json_array(f"{url}/api/tools"))
+
+
+def _render_tools_from_api(data: Iterable[dict[str, Any]]) -> None:
+    """서버 API에서 가져온 Tool 목록 출력."""
+    _print_tools_table(
+        (bundle.get("bundle", "?"), item.get("name", "?"), item.get("description"))
+        for bundle in data
+        for item in bundle.get("items", [])
+    )
+
+
+def _print_tools_table(rows: Iterable[tuple[str, str, str | None]]) -> None:
+    """(bundle, tool, 설명) 행을 Tools 테이블로 출력.
+
+    셀은 Text로 감싸 렌더 시 markup 파싱을 건너뛴다 (tool 설명의 "[...]"도 그대로 표시).
+    이름 컬럼은 no_wrap이라 행이 많아도 줄바꿈 계산은 설명 컬럼에서만 한다.
+    """
+    from rich.text import Text
+
+    table = new_table(
+        _TOOLS_COLUMNS, title="🔧 Tools", show_header=True, header_style="bold cyan"
+    )
+    for bundle_name, tool_name, description in rows:
+        table.add_row(Text(bundle_name), Text(tool_name), Text(description or "—"))
+    console().print(table)
@@ -0,0 +1,134 @@
+"""aac validate — 부팅 없이 YAML 리소스 스캔/검증."""
+
+from __future__ import annotations
+
+import sys
+from collections import Counter
+from pathlib import Path
+
+import click
+
+from aac.cli.utils import (
+    RESOURCES_DIR_TYPE,
+    ColumnSpec,
+    console,
+    new_table,
+    print_agents_table,
+    resolve_resources_dir,
+    scan_resources,
+)
+
+_SUMMARY_COLUMNS: ColumnSpec = (
+    ("리소스", {"style": "bold"}),
+    ("개수", {"justify": "right"}),
+    ("상태", {"justify": "center"}),
+)
+_ERROR_COLUMNS: ColumnSpec = (
+    ("파일", {"style": "dim"}),
+    ("유형", {"style": "yellow"}),
+    ("필드", {"style": "cyan"}),
+    ("메시지", {"style": "red"}),
+)
+
+
+@click.command()
+@click.option(
+    "--resources", "-r",
+    type=RESOURCES_DIR_TYPE,
+    default=None,
+    help="resources/ 디렉토리 경로 (기본: $AAC_RESOURCES 또는 ./resources)",
+)
+@click.option("--verbose", "-v", is_flag=True, help="상세 출력")
+def validate(resources: Path | None, verbose: bool) -> None:
+    """✅ YAML 리소스 검증 — 부팅 없이 스캔만 수행.
+
+    모든 agent.yaml, tool.yaml, skill.yaml, aspect.yaml을 파싱하고,
+    스키마 오류, 누락 필드, 참조 불일치를 보고한다.
+    """
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from aac.models.manifest import ResourceKind
+
+    resources_path = resolve_resources_dir(resources)
+    # 검증은 항상 현재 트리를 다시 스캔 (결과는 agents/tools -l이 재사용하도록 캐시에 기록)
+    result = scan_resources(resources_path, refresh=True)
+
+    # 요약 테이블
+    summary_table = new_table(
+        _SUMMARY_COLUMNS, title="📂 스캔 결과", show_header=True, header_style="bold cyan"
+    )
+
+    def _status(count: int, errors: int = 0) -> Text:
+        if errors > 0:
+            return Text(f"⚠ {errors} 에러", style="red bold")
+        if count > 0:
+            return Text("✓", style="green bold")
+        return Text("—", style="dim")
+
+    # 에러는 스캐너가 붙인 리소스 종류로 한 번에 집계
+    error_counts = Counter(e.kind for e in result.errors)
+    agent_errors = error_counts[ResourceKind.AGENT]
+    tool_errors = error_counts[ResourceKind.TOOL]
+    skill_errors = error_counts[ResourceKind.SKILL]
+    aspect_errors = error_counts[ResourceKind.ASPECT]
+
+    summary_table.add_row(
+        "Agents", str(len(result.agents)),
+        _status(len(result.agents), agent_errors),
+    )
+    summary_table.add_row(
+        "Tools",
+        f"{len(result.tools)} bundles ({result.total_tools} items)",
+        _status(len(result.tools), tool_errors),
+    )
+    summary_table.add_row(
+        "Skills", str(len(result.skills)),
+        _status(len(result.skills), skill_errors),
+    )
+    summary_table.add_row(
+        "Aspects", str(len(result.aspects)),
+        _status(len(result.aspects), aspect_errors),
+    )
+
+    console().print()
+    console().print(summary_table)
+
+    # 에러 상세
+    if result.errors:
+        console().print()
+        err_table = new_table(
+            _ERROR_COLUMNS, title="⚠ 스캔 에러", show_header=True, header_style="bold red"
+        )
+
+        for err in result.errors:
+            err_table.add_row(
+                err.file_path,
+                err.error_type,
+                err.field or "—",
+                err.message,
+            )
+        console().print(err_table)
+        sys.exit(1)
+
+    # 상세 모드
+    if verbose:
+        console().print()
+        print_agents_table(result.agents)
+
+        from aac.scanner import LIBYAML_AVAILABLE
+
+        if not LIBYAML_AVAILABLE:
+            console().print(
+                "[dim]ⓘ libyaml 미사용 — PyYAML을 libyaml과 함께 설치하면 스캔이 빨라집니다[/dim]"
+            )
+
+    console().print()
+    total = len(result.agents) + len(result.tools) + len(result.skills) + len(result.aspects)
+    console().print(
+        Panel(
+            f"[green bold]✓[/green bold] 모든 리소스 검증 통과 — "
+            f"총 {total}개 리소스",
+            style="green",
+        )
+    )
@@ -0,0 +1,410 @@
+"""CLI 공용 유틸리티 — Console, 비동기 실행, resources 경로, HTTP 조회.
+
+각 하위 명령 모듈(aac.cli.commands.*)이 공유한다.
+"""
+
+from __future__ import annotations
+
+import codecs
+import functools
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import click
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from rich.console import Console
+    from rich.table import Table
+
+    from aac.models.manifest import AgentManifest
+    from aac.scanner import ScanResult
+
+# Rich는 import 비용이 커서 실제 출력 시점에 생성 (--help/--version은 Click만 사용)
+_stdout_console: Console | None = None
+_stderr_console: Console | None = None
+
+
+def console() -> Console:
+    """stdout Rich Console (지연 생성)."""
+    global _stdout_console
+    if _stdout_console is None:
+        from rich.console import Console
+
+        _stdout_console = Console()
+    return _stdout_console
+
+
+def error_console() -> Console:
+    """stderr Rich Console (지연 생성)."""
+    global _stderr_console
+    if _stderr_console is None:
+        from rich.console import Console
+
+        _stderr_console = Console(stderr=True)
+    return _stderr_console
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloop이 설치되어 있으면 그 루프를 사용 (uvicorn[standard]에 포함)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run_async(coro: Any) -> Any:
+    """비동기 함수를 동기적으로 실행."""
+    import asyncio
+
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        try:
+            return runner.run(coro)
+        except KeyboardInterrupt:
+            console().print("\n[yellow]⚠ 중단됨[/yellow]")
+            sys.exit(130)
+        finally:
+            flush_pending_logs()
+
+
+def flush_pending_logs() -> None:
+    """aac_log writer 스레드에 남은 줄을 지금 write — 명령 출력 뒤로 밀리지 않도록.
+
+    formatter가 import된 적이 없으면 대기 중인 로그도 없으므로 import하지 않는다.
+    """
+    formatter = sys.modules.get("aac.logging.formatter")
+    if formatter is not None:
+        formatter.flush_logs()
+
+
+# -r 옵션이 없을 때 사용할 resources 경로 (지정 시 CWD 탐색 생략)
+RESOURCES_ENV_VAR = "AAC_RESOURCES"
+
+# 모든 명령의 --resources 옵션이 공유하는 타입 (Click이 존재 여부를 검증하고 Path로 변환)
+RESOURCES_DIR_TYPE = click.Path(exists=True, file_okay=False, path_type=Path)
+
+
+def resolve_resources_dir(resources: Path | None) -> Path:
+    """resources 디렉토리 경로 해석.
+
+    우선순위: -r 옵션 → $AAC_RESOURCES → ./resources
+    -r 값은 RESOURCES_DIR_TYPE이 이미 검증했으므로 다시 stat하지 않는다.
+    """
+    if resources:
+        return Path(resources)
+    if env_dir := os.environ.get(RESOURCES_ENV_VAR):
+        p = Path(env_dir)
+    else:
+        # 현재 디렉토리 기준 탐색 (상대 경로 — getcwd 호출 없음)
+        p = Path("resources")
+    try:
+        os.stat(p)
+    except OSError:
+        error_console().print(f"[red]✗ resources 디렉토리 없음: {p}[/red]")
+        sys.exit(1)
+    return p
+
+
+# --local 스캔 결과 캐시 — 연속된 CLI 호출(validate → agents -l → tools -l)이 재사용
+_SCAN_CACHE_VERSION = 2
+
+
+def _scan_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aac"
+
+
+def _scan_code_fingerprint() -> str:
+    """aac 버전 + 스캐너/매니페스트 모델 소스의 최대 mtime_ns.
+
+    업그레이드나 스캔 규칙 변경 시 이전 코드가 pickle한 결과를 재사용하지 않도록 키에 포함한다.
+    """
+    import aac.models
+    import aac.scanner
+    from aac import __version__
+
+    sources = [Path(aac.scanner.__file__), *Path(aac.models.__file__).parent.glob("*.py")]
+    latest = max(source.stat().st_mtime_ns for source in sources)
+    return f"{__version__}:{latest}"
+
+
+def _scan_cache_key(resources_path: Path) -> str:
+    """코드 fingerprint + resources 경로 + 트리 내 파일/디렉토리 수 + 최대 mtime_ns로 캐시 키 생성.
+
+    파일 추가/수정/삭제 시 (디렉토리 mtime 포함) 키가 바뀌어 캐시가 무효화된다.
+    """
+    root = resources_path.resolve()
+    count = 0
+    latest = root.stat().st_mtime_ns
+    for entry in root.rglob("*"):
+        count += 1
+        latest = max(latest, entry.stat().st_mtime_ns)
+    raw = f"{_SCAN_CACHE_VERSION}:{_scan_code_fingerprint()}:{root}:{count}:{latest}".encode()
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def scan_resources(resources_path: Path, *, refresh: bool = False) -> ScanResult:
+    """AgentScanner.scan_all() 결과를 디스크 캐시와 함께 반환한다.
+
+    refresh=True면 캐시를 읽지 않고 다시 스캔한 뒤 결과만 캐시에 기록한다 (validate용).
+    캐시 읽기/쓰기 실패는 무시하고 일반 스캔으로 진행한다.
+    """
+    import pickle
+
+    from aac.scanner import AgentScanner
+
+    try:
+        cache_file = _scan_cache_dir() / f"scan-{_scan_cache_key(resources_path)}.pkl"
+    except OSError:
+        return AgentScanner(resources_path).scan_all()
+
+    if not refresh:
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except Exception:
+            pass
+
+    result = AgentScanner(resources_path).scan_all()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(result, protocol=5))
+        tmp.replace(cache_file)
+    except Exception:
+        pass
+    return result
+
+
+# ─── 테이블 ───────────────────────────────────────────
+
+# (컬럼 이름, add_column 키워드) 목록 — 명령 모듈마다 모듈 수준 상수로 정의
+ColumnSpec = tuple[tuple[str, dict[str, Any]], ...]
+
+KEY_VALUE_COLUMNS: ColumnSpec = (("Key", {"style": "bold"}), ("Value", {}))
+
+_LOCAL_AGENTS_COLUMNS: ColumnSpec = (
+    ("이름", {"style": "bold"}),
+    ("Runtime", {"style": "cyan"}),
+    ("Scope", {"style": "yellow"}),
+    ("Lazy", {"justify": "center"}),
+    ("Tools", {"justify": "right"}),
+    ("Skills", {"justify": "right"}),
+)
+
+
+def new_table(columns: ColumnSpec, **table_kwargs: Any) -> Table:
+    """컬럼 명세로 Rich Table 생성 — 호출 측은 add_row만 수행."""
+    from rich.table import Table
+
+    table = Table(**table_kwargs)
+    for name, column_kwargs in columns:
+        table.add_column(name, **column_kwargs)
+    return table
+
+
+def new_key_value_table() -> Table:
+    """헤더 없는 Key/Value 2열 테이블 (status/poll 패널용)."""
+    return new_table(KEY_VALUE_COLUMNS, show_header=False, box=None, padding=(0, 2))
+
+
+def print_agents_table(agents: list[AgentManifest]) -> None:
+    """Agent 목록을 Rich 테이블로 출력."""
+    table = new_table(
+        _LOCAL_AGENTS_COLUMNS, title="🤖 Agents", show_header=True, header_style="bold magenta"
+    )
+
+    for agent in agents:
+        tool_count = len(agent.spec.tools) if agent.spec.tools else 0
+        skill_count = len(agent.spec.skills) if agent.spec.skills else 0
+        lazy = "⏸" if agent.spec.lazy else "—"
+        table.add_row(
+            agent.metadata.name,
+            agent.spec.runtime,
+            agent.spec.scope.value,
+            lazy,
+            str(tool_count),
+            str(skill_count),
+        )
+    console().print(table)
+
+
+# 목록 응답을 나눠 읽는 단위 — 본문 전체가 아니라 한 청크 + 항목 하나만 메모리에 둔다
+_STREAM_CHUNK_SIZE = 64 * 1024
+# 한 항목이 여러 청크에 걸치면 읽기 크기를 두 배씩 늘린다 (재파싱 비용이 O(n²)이 되지 않도록)
+_STREAM_MAX_READ_SIZE = 8 * 1024 * 1024
+
+_JSON_WHITESPACE = " \t\r\n"
+
+
+def iter_json_array(fp: BinaryIO, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """바이너리 스트림의 최상위 JSON 배열을 항목 단위로 점진 파싱한다.
+
+    응답 본문을 한 번에 read()하지 않고 chunk_size씩 읽어,
+    완성된 항목이 생기는 즉시 yield한다.
+    미완성 항목이 남아 있는 채로 더 읽어야 하면 읽기 크기를 두 배로 늘리고
+    (최대 _STREAM_MAX_READ_SIZE), 항목을 yield하면 chunk_size로 되돌린다 —
+    큰 항목 하나를 매 청크마다 처음부터 다시 파싱하지 않도록.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    eof = False
+    read_size = chunk_size
+    state = "start"  # start → first → (item → sep)*
+
+    while True:
+        while pos < len(buf) and buf[pos] in _JSON_WHITESPACE:
+            pos += 1
+
+        need_more = pos >= len(buf)
+        if not need_more:
+            ch = buf[pos]
+            if state == "start":
+                if ch != "[":
+                    raise ValueError("응답이 JSON 배열이 아닙니다")
+                pos += 1
+                state = "first"
+                continue
+            if ch == "]" and state in ("first", "sep"):
+                return
+            if state == "sep":
+                if ch != ",":
+                    raise ValueError(f"JSON 배열 구분자 오류: {ch!r}")
+                pos += 1
+                state = "item"
+                continue
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                need_more = True
+            else:
+                # 버퍼 끝에서 끝난 숫자 등은 다음 청크에서 이어질 수 있다
+                if end < len(buf) or eof:
+                    yield value
+                    pos = end
+                    state = "sep"
+                    read_size = chunk_size
+                    continue
+                need_more = True
+
+        if need_more:
+            if eof:
+                raise ValueError("JSON 배열이 닫히지 않았습니다")
+            if pos < len(buf):
+                # 미완성 항목이 버퍼에 남아 있음 — 다음 읽기를 키워 재파싱 횟수를 log로 줄인다
+                read_size = min(read_size * 2, max(_STREAM_MAX_READ_SIZE, chunk_size))
+            chunk = fp.read(read_size)
+            eof = not chunk
+            buf = buf[pos:] + utf8.decode(chunk, final=eof)
+            pos = 0
+
+
+# ─── HTTP ─────────────────────────────────────────────
+
+
+@functools.cache
+def _urllib_request() -> ModuleType:
+    """urllib.request 모듈 (첫 HTTP 호출 시 한 번만 import — --help 경로는 로드하지 않음)."""
+    import urllib.request
+
+    return urllib.request
+
+
+def open_url(
+    url: str,
+    *,
+    method: str | None = None,
+    data: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 5.0,
+) -> Any:
+    """HTTP 요청을 보내고 응답 객체(컨텍스트 매니저)를 반환한다."""
+    request = _urllib_request()
+    req = request.Request(url, data=data, headers=headers or {}, method=method)
+    return request.urlopen(req, timeout=timeout)
+
+
+def request_json(url: str, *, method: str | None = None, timeout: float = 5.0) -> Any:
+    """HTTP 요청 후 응답 본문을 JSON으로 파싱해 반환한다."""
+    with open_url(url, method=method, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def stream_json_array(url: str) -> Iterator[Any]:
+    """HTTP GET 응답의 JSON 배열을 항목 단위로 yield한다. 실패 시 안내 후 종료.
+
+    연결 오류(URLError 포함 OSError)와 응답 파싱 오류(ValueError)는 구분해 안내한다.
+    """
+    try:
+        with open_url(url) as resp:
+            yield from iter_json_array(resp)
+    except OSError as e:
+        error_console().print(f"[red]✗ 서버 연결 실패: {e}[/red]")
+        error_console().print("[dim]  서버가 실행 중인지 확인하거나 --local 옵션 사용[/dim]")
+        sys.exit(1)
+    except ValueError as e:
+        error_console().print(f"[red]✗ 잘못된 서버 응답 (invalid response): {e}[/red]")
+        error_console().print(f"[dim]  {url} 가 JSON 배열을 반환하는지 확인[/dim]")
+        sys.exit(1)
+
+
+class KeepAliveClient:
+    """하나의 keep-alive HTTP 연결을 재사용해 JSON을 조회하는 최소 클라이언트.
+
+    poll --watch처럼 같은 서버를 반복 조회할 때 요청마다
+    TCP(+TLS) 연결을 새로 맺지 않도록 한다.
+    서버가 idle 연결을 끊었으면 한 번 재연결 후 재시도한다.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 5.0) -> None:
+        import http.client
+        import urllib.parse
+
+        parts = urllib.parse.urlsplit(base_url)
+        if parts.scheme == "https":
+            conn_cls: type[http.client.HTTPConnection] = http.client.HTTPSConnection
+        else:
+            conn_cls = http.client.HTTPConnection
+        self._conn = conn_cls(parts.hostname or "127.0.0.1", parts.port, timeout=timeout)
+        self._prefix = parts.path.rstrip("/")
+
+    def get_json(self, path: str) -> Any:
+        """GET 요청 후 응답 본문을 JSON으로 파싱한다."""
+        import http.client
+
+        for attempt in range(2):
+            try:
+                self._conn.request("GET", self._prefix + path)
+                resp = self._conn.getresponse()
+                # 본문을 끝까지 읽어야 같은 연결로 다음 요청을 보낼 수 있다
+                body = resp.read()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError):
+                self._conn.close()
+                if attempt:
+                    raise
+                continue
+            if resp.status >= 400:
+                raise http.client.HTTPException(f"HTTP Error {resp.status}: {resp.reason}")
+            return json.loads(body)
+        return None  # pragma: no cover — 루프는 return 또는 raise로 끝난다
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> KeepAliveClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
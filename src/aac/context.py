@@ -14,34 +14,48 @@ aac start 시 이 Context가 기동되어:
 from __future__ import annotations
 
 import asyncio
-import uuid
+import os
+import sys
+from collections import Counter
 from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from aac.aspects.audit_logging import AuditLoggingHandler
 from aac.aspects.engine import AspectContext, AspectEngine, AspectEventType
 from aac.runtime.base import StreamChunk
-from aac.aspects.execution_logging import ExecutionLoggingHandler
-from aac.aspects.tool_tracking import ToolTrackingHandler
 from aac.di.skill_registry import SkillRegistry
 from aac.di.tool_registry import ToolRegistry
 from aac.factory import AgentFactory
-from aac.logging.formatter import aac_log, boot_log
-from aac.models.instance import AgentInstance, AgentStatus
+from aac.logging.formatter import (
+    aac_log,
+    boot_log,
+    boot_log_lines,
+    flush_logs,
+    format_available,
+)
+from aac.models.instance import AgentInstance, AgentStatus, QueryResult
 from aac.models.manifest import AgentManifest
-from aac.runtime.claude_code import ClaudeCodeRuntime
 from aac.runtime.registry import RuntimeRegistry
-from aac.scanner import AgentScanner, ScanResult
+
+if TYPE_CHECKING:
+    from aac.scanner import ScanResult
 
 logger = structlog.get_logger()
 
 
-def _short_uuid() -> str:
-    return uuid.uuid4().hex[:8]
+def _banner_enabled() -> bool:
+    """배너 출력 여부 — AAC_QUIET=1이거나 stdout이 터미널이 아니면(파이프/로그 수집) 생략."""
+    if os.environ.get("AAC_QUIET", "") not in ("", "0"):
+        return False
+    return sys.stdout.isatty()
+
+
+def _short_id() -> str:
+    """8자리 hex ID — uuid4 객체 없이 32비트 난수만 사용 (외부 노출 ID라 추측 불가 유지)."""
+    return os.urandom(4).hex()
 
 
 class AgentApplicationContext:
@@ -59,9 +73,13 @@ class AgentApplicationContext:
         resources_dir: str | Path = "./resources",
         *,
         strict_tools: bool = False,
+        max_init_concurrency: int | None = None,
     ) -> None:
         self._resources_dir = Path(resources_dir)
+        # strict 모드: tool 이름 충돌뿐 아니라 eager agent 초기화가 하나라도 실패해도 기동 실패
+        # (비 strict면 실패한 agent만 ERROR로 남기고 부팅을 계속한다)
         self._strict_tools = strict_tools
+        self._max_init_concurrency = max_init_concurrency
 
         # 레지스트리
         self._runtime_registry = RuntimeRegistry()
@@ -73,6 +91,8 @@ class AgentApplicationContext:
         self._agents: dict[str, AgentInstance] = {}
         self._manifests: dict[str, AgentManifest] = {}
         self._factory: AgentFactory | None = None
+        # 상태별 agent 수 — _put_agent/_set_status로만 갱신 (get_status가 매번 전체를 훑지 않도록)
+        self._status_counts: Counter[AgentStatus] = Counter()
 
         # 스캔 결과
         self._scan_result: ScanResult | None = None
@@ -114,60 +134,69 @@ class AgentApplicationContext:
 
     async def start(self) -> None:
         """Context 전체 기동 — Spring Boot의 SpringApplication.run()."""
-        print(self.AAC_BANNER)
+        if _banner_enabled():
+            print(self.AAC_BANNER)
 
         boot_log("▶ Starting AgentApplicationContext...")
 
-        # 1. 기본 Runtime 등록
-        self._register_default_runtimes()
+        # 1. resources/ 스캔 — executor 스레드에 바로 제출하고, 그동안 기본 Runtime 등록
+        #    (create_task + to_thread는 다음 await 전까지 스레드 제출이 미뤄짐)
+        # 스캐너(yaml)/aspect handler/기본 runtime 모듈은 기동 시점에 import —
+        # Context를 import만 하는 CLI·테스트는 이 비용을 내지 않는다
+        from aac.scanner import AgentScanner
 
-        # 2. resources/ 스캔
         scanner = AgentScanner(self._resources_dir)
-        self._scan_result = scanner.scan_all()
+        scan_future = asyncio.get_running_loop().run_in_executor(None, scanner.scan_all)
+        self._register_default_runtimes()
+
+        # 2. 스캔 완료 대기 — 이벤트 루프는 막지 않음
+        self._scan_result = await scan_future
 
         # 2.5. Runtime 자동 발견 (resources/runtimes/*.yaml)
-        if self._scan_result.runtimes:
-            discovered = self._runtime_registry.discover(self._scan_result.runtimes)
-            boot_log(
+        scan = self._scan_result
+        messages: list[str] = []
+        if scan.runtimes:
+            discovered = self._runtime_registry.discover(scan.runtimes)
+            messages.append(
                 f"🔌 Scanning resources/runtimes/ → "
-                f"{len(self._scan_result.runtimes)} manifests, "
-                f"{len(discovered)} registered"
+                f"{len(scan.runtimes)} manifests, {len(discovered)} registered"
             )
 
-        # 에러 보고
-        if self._scan_result.errors:
-            for err in self._scan_result.errors:
-                boot_log(
-                    f"⚠ SCAN_ERROR: {err.file_path} "
-                    f"[{err.error_type}] {err.field or ''}: {err.message}"
-                )
-
-        boot_log(
-            f"📂 Scanning resources/agents/ → {len(self._scan_result.agents)} agents"
+        # 에러 보고 + 스캔 요약 — 한 번에 출력
+        messages.extend(
+            f"⚠ SCAN_ERROR: {err.file_path} [{err.error_type}] {err.field or ''}: {err.message}"
+            for err in scan.errors
         )
-        boot_log(
+        messages += [
+            f"📂 Scanning resources/agents/ → {len(scan.agents)} agents",
             f"🔧 Scanning resources/tools/ → "
-            f"{len(self._scan_result.tools)} bundles ({self._scan_result.total_tools} tools)"
-        )
-        boot_log(
-            f"📋 Scanning resources/skills/ → {len(self._scan_result.skills)} skills"
-        )
-        boot_log(
-            f"🎯 Scanning resources/aspects/ → {len(self._scan_result.aspects)} aspects"
-        )
+            f"{len(scan.tools)} bundles ({scan.total_tools} tools)",
+            f"📋 Scanning resources/skills/ → {len(scan.skills)} skills",
+            f"🎯 Scanning resources/aspects/ → {len(scan.aspects)} aspects",
+        ]
+        boot_log_lines(messages)
 
         # 3. 레지스트리 등록
-        for tool in self._scan_result.tools:
-            self._tool_registry.register(tool)
-        for skill in self._scan_result.skills:
-            self._skill_registry.register(skill)
+        self._tool_registry.bulk_register(self._scan_result.tools)
+        self._skill_registry.bulk_register(self._scan_result.skills)
+        # agent 생성 전에 skill 문서를 병렬로 미리 읽어둔다 (resolve_skills는 캐시 히트)
+        await self._skill_registry.preload_instructions()
 
         # 4. Aspect handler 타입 등록 + manifest 등록
+        from aac.aspects.audit_logging import AuditLoggingHandler
+        from aac.aspects.execution_logging import ExecutionLoggingHandler
+        from aac.aspects.tool_tracking import ToolTrackingHandler
+        from aac.aspects.ws_publisher import WebSocketPublisherHandler
+
         self._aspect_engine.register_handler_type("AuditLoggingAspect", AuditLoggingHandler)
         self._aspect_engine.register_handler_type("ToolTrackingAspect", ToolTrackingHandler)
         self._aspect_engine.register_handler_type(
             "ExecutionLoggingAspect", ExecutionLoggingHandler
         )
+        # broadcast 함수는 서버(create_app)가 주입 — 서버 없이 기동하면 발행하지 않음
+        self._aspect_engine.register_handler_type(
+            "WebSocketPublisherAspect", WebSocketPublisherHandler
+        )
         for aspect in self._scan_result.aspects:
             self._aspect_engine.register(aspect)
 
@@ -180,24 +209,19 @@ class AgentApplicationContext:
 
         # 6. Agent 생성 (eager / lazy)
         boot_log("🚀 Initializing eager agents...")
+        eager: list[AgentManifest] = []
         for manifest in self._scan_result.agents:
-            self._manifests[manifest.metadata.name] = manifest
-            if manifest.spec.lazy:
-                # lazy agent는 placeholder만 등록
-                agent = AgentInstance(
-                    name=manifest.metadata.name,
-                    description=manifest.metadata.description,
-                    runtime_name=manifest.spec.runtime,
-                    status=AgentStatus.LAZY,
-                    scope=manifest.spec.scope.value,
-                    lazy=True,
-                    tags=manifest.metadata.tags,
-                    capabilities=manifest.spec.capabilities,
-                )
-                self._agents[manifest.metadata.name] = agent
-            else:
-                agent = await self._factory.create(manifest)
-                self._agents[manifest.metadata.name] = agent
+            # agent 이름은 intern — manifest/agent dict가 같은 키 객체를 공유
+            # (요청 경로의 이름은 intern하지 않는다: 임의 이름이 영구히 남기 때문)
+            name = sys.intern(manifest.metadata.name)
+            self._manifests[name] = manifest
+            # 모든 agent를 placeholder로 먼저 등록 — 등록 순서는 manifest 순서 유지
+            self._put_agent(name, self._placeholder(
+                manifest, AgentStatus.LAZY if manifest.spec.lazy else AgentStatus.INITIALIZING
+            ))
+            if not manifest.spec.lazy:
+                eager.append(manifest)
+        await self._create_eager_agents(eager)
 
         self._started = True
         self._started_at = datetime.now(timezone.utc)
@@ -212,17 +236,100 @@ class AgentApplicationContext:
             f"{tool_count} tools, {skill_count} skills, {aspect_count} aspects"
         )
 
+    @staticmethod
+    def _placeholder(manifest: AgentManifest, status: AgentStatus) -> AgentInstance:
+        """runtime 없는 AgentInstance (lazy 대기 / 초기화 중 / 초기화 실패)."""
+        return AgentInstance(
+            name=manifest.metadata.name,
+            description=manifest.metadata.description,
+            runtime_name=manifest.spec.runtime,
+            status=status,
+            scope=manifest.spec.scope.value,
+            lazy=manifest.spec.lazy,
+            tags=manifest.metadata.tags,
+            capabilities=manifest.spec.capabilities,
+        )
+
+    async def _create_eager_agents(self, manifests: list[AgentManifest]) -> None:
+        """eager agent들을 동시에 생성 — 부팅 시간이 Σ(tᵢ)가 아닌 max(tᵢ).
+
+        max_init_concurrency가 설정되면 동시에 초기화하는 runtime 수를 제한한다
+        (subprocess를 띄우는 runtime의 fork 폭주 방지).
+        strict 모드가 아니면 실패한 agent는 ERROR 상태로 남기고 부팅을 계속한다.
+        """
+        assert self._factory is not None
+        factory = self._factory
+        semaphore = (
+            asyncio.Semaphore(self._max_init_concurrency)
+            if self._max_init_concurrency else None
+        )
+
+        async def _create(manifest: AgentManifest) -> AgentInstance:
+            if semaphore is None:
+                return await factory.create(manifest)
+            async with semaphore:
+                return await factory.create(manifest)
+
+        results = await asyncio.gather(
+            *(_create(m) for m in manifests), return_exceptions=True
+        )
+
+        first_error: BaseException | None = None
+        for manifest, result in zip(manifests, results, strict=True):
+            name = sys.intern(manifest.metadata.name)
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                boot_log(f"⚠ AGENT_INIT_ERROR: {name} [{type(result).__name__}]: {result}")
+                self._put_agent(name, self._placeholder(manifest, AgentStatus.ERROR))
+                first_error = first_error or result
+            else:
+                self._put_agent(name, result)
+
+        # strict 모드는 기존처럼 하나라도 실패하면 기동 실패 —
+        # 이미 초기화된 runtime(subprocess 등)은 남기지 않고 종료한 뒤 raise
+        if first_error is not None and self._strict_tools:
+            await asyncio.gather(
+                *(
+                    r.runtime.shutdown() for r in results
+                    if isinstance(r, AgentInstance) and r.runtime is not None
+                ),
+                return_exceptions=True,
+            )
+            raise first_error
+
+    def _put_agent(self, name: str, agent: AgentInstance) -> None:
+        """Agent 등록/교체 — 상태별 카운터를 함께 갱신."""
+        old = self._agents.get(name)
+        if old is not None:
+            self._status_counts[old.status] -= 1
+        self._agents[name] = agent
+        self._status_counts[agent.status] += 1
+
+    def _set_status(self, agent: AgentInstance, status: AgentStatus) -> None:
+        """Agent 상태 변경 — 등록된 인스턴스면 상태별 카운터를 함께 갱신.
+
+        상태 변경은 모두 이벤트 루프 스레드에서 일어나므로 별도 lock은 두지 않는다.
+        """
+        if self._agents.get(agent.name) is agent:
+            self._status_counts[agent.status] -= 1
+            self._status_counts[status] += 1
+        agent.set_status(status)
+
     def _register_default_runtimes(self) -> None:
         """기본 Runtime 어댑터 등록."""
+        from aac.runtime.claude_code import ClaudeCodeRuntime
+
         self._runtime_registry.register("claude-code", ClaudeCodeRuntime)
         # Phase 2에서 추가: gemini-mcp, openai-mcp, codex-cli
 
     def get_agent(self, name: str) -> AgentInstance:
         """이름으로 Agent 인스턴스 조회."""
-        if name not in self._agents:
-            available = list(self._agents.keys())
+        agent = self._agents.get(name)
+        if agent is None:
+            available = format_available(self._agents.keys())
             raise KeyError(f"Agent '{name}' 미등록. 사용 가능: {available}")
-        return self._agents[name]
+        return agent
 
     async def execute(
         self,
@@ -230,7 +337,7 @@ class AgentApplicationContext:
         prompt: str,
         *,
         context: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> QueryResult:
         """Agent에 query 실행 (FR-9.2).
 
         Returns:
@@ -243,17 +350,17 @@ class AgentApplicationContext:
             manifest = self._manifests.get(agent_name)
             if manifest and self._factory:
                 new_agent = await self._factory.create(manifest)
-                self._agents[agent_name] = new_agent
+                self._put_agent(agent_name, new_agent)
                 agent = new_agent
 
         if agent.runtime is None:
             raise RuntimeError(f"Agent '{agent_name}'의 runtime이 초기화되지 않았습니다")
 
         # ID 생성 (DR-3)
-        session_id = f"sess_{_short_uuid()}"
+        session_id = f"sess_{_short_id()}"
         self._tx_counter += 1
         tx_id = f"tx_{self._tx_counter:03d}"
-        execution_id = f"exec_{_short_uuid()}"
+        execution_id = f"exec_{_short_id()}"
 
         aac_log(agent_name, session_id, tx_id, f'▶ STARTING query: "{prompt[:80]}"')
 
@@ -267,24 +374,18 @@ class AgentApplicationContext:
         )
         await self._aspect_engine.apply(AspectEventType.PRE_QUERY, aspect_ctx)
 
-        agent.status = AgentStatus.EXECUTING
-
-        # tool 정보 구성
-        tools_for_runtime = [
-            {"name": t.name, "description": t.description}
-            for t in agent.tools
-        ] if agent.tools else None
+        self._set_status(agent, AgentStatus.EXECUTING)
 
         result = await agent.runtime.execute(
             prompt,
             system_prompt=agent.system_prompt,
-            tools=tools_for_runtime,
+            tools=agent.tools_payload,
             context=context,
             max_turns=agent.max_turns,
             timeout_seconds=agent.timeout_seconds,
         )
 
-        agent.status = AgentStatus.READY
+        self._set_status(agent, AgentStatus.READY)
         agent.query_count += 1
         agent.total_cost_usd += result.cost_usd
         agent.total_duration_ms += result.duration_ms
@@ -307,18 +408,18 @@ class AgentApplicationContext:
             f"${result.cost_usd:.4f})"
         )
 
-        return {
-            "execution_id": execution_id,
-            "session_id": session_id,
-            "tx_id": tx_id,
-            "agent": agent_name,
-            "result": result.response,
-            "success": result.success,
-            "error": result.error,
-            "cost_usd": result.cost_usd,
-            "duration_ms": result.duration_ms,
-            "model": result.model,
-        }
+        return QueryResult(
+            execution_id=execution_id,
+            session_id=session_id,
+            tx_id=tx_id,
+            agent=agent_name,
+            result=result.response,
+            success=result.success,
+            error=result.error,
+            cost_usd=result.cost_usd,
+            duration_ms=result.duration_ms,
+            model=result.model,
+        )
 
     async def stream_execute(
         self,
@@ -339,7 +440,7 @@ class AgentApplicationContext:
             manifest = self._manifests.get(agent_name)
             if manifest and self._factory:
                 new_agent = await self._factory.create(manifest)
-                self._agents[agent_name] = new_agent
+                self._put_agent(agent_name, new_agent)
                 agent = new_agent
 
         if agent.runtime is None:
@@ -348,10 +449,10 @@ class AgentApplicationContext:
             return
 
         # ID 생성
-        session_id = f"sess_{_short_uuid()}"
+        session_id = f"sess_{_short_id()}"
         self._tx_counter += 1
         tx_id = f"tx_{self._tx_counter:03d}"
-        execution_id = f"exec_{_short_uuid()}"
+        execution_id = f"exec_{_short_id()}"
 
         aac_log(agent_name, session_id, tx_id, f'▶ STREAMING query: "{prompt[:80]}"')
 
@@ -365,7 +466,7 @@ class AgentApplicationContext:
         )
         await self._aspect_engine.apply(AspectEventType.PRE_QUERY, aspect_ctx)
 
-        agent.status = AgentStatus.EXECUTING
+        self._set_status(agent, AgentStatus.EXECUTING)
 
         # 스트리밍 메타 정보 전송
         yield StreamChunk(
@@ -378,17 +479,11 @@ class AgentApplicationContext:
             },
         )
 
-        # tool 정보 구성
-        tools_for_runtime = [
-            {"name": t.name, "description": t.description}
-            for t in agent.tools
-        ] if agent.tools else None
-
         # runtime.stream() 호출
         async for chunk in agent.runtime.stream(
             prompt,
             system_prompt=agent.system_prompt,
-            tools=tools_for_runtime,
+            tools=agent.tools_payload,
             context=context,
             max_turns=agent.max_turns,
             timeout_seconds=agent.timeout_seconds,
@@ -409,7 +504,7 @@ class AgentApplicationContext:
             if chunk.type == "error":
                 aspect_ctx.error = chunk.content
 
-        agent.status = AgentStatus.READY
+        self._set_status(agent, AgentStatus.READY)
 
         # Aspect: PostQuery / OnError
         if aspect_ctx.error:
@@ -432,7 +527,7 @@ class AgentApplicationContext:
         Returns:
             execution_id
         """
-        execution_id = f"exec_{_short_uuid()}"
+        execution_id = f"exec_{_short_id()}"
 
         self._executions[execution_id] = {
             "execution_id": execution_id,
@@ -466,14 +561,14 @@ class AgentApplicationContext:
         try:
             result = await self.execute(agent_name, prompt, context=context)
             self._executions[execution_id].update({
-                "status": "completed" if result.get("success") else "error",
-                "result": result.get("result"),
-                "error": result.get("error"),
-                "cost_usd": result.get("cost_usd", 0.0),
-                "duration_ms": result.get("duration_ms", 0),
-                "model": result.get("model", ""),
-                "session_id": result.get("session_id"),
-                "tx_id": result.get("tx_id"),
+                "status": "completed" if result.success else "error",
+                "result": result.result,
+                "error": result.error,
+                "cost_usd": result.cost_usd,
+                "duration_ms": result.duration_ms,
+                "model": result.model,
+                "session_id": result.session_id,
+                "tx_id": result.tx_id,
                 "completed_at": datetime.now(timezone.utc).isoformat(),
             })
         except Exception as e:
@@ -507,30 +602,38 @@ class AgentApplicationContext:
     async def shutdown(self) -> None:
         """Context 종료 — 모든 Agent runtime shutdown."""
         boot_log("Shutting down AgentApplicationContext...")
-        for name, agent in self._agents.items():
-            if agent.runtime and agent.status != AgentStatus.LAZY:
-                try:
-                    agent.status = AgentStatus.DESTROYING
-                    await agent.runtime.shutdown()
-                    agent.status = AgentStatus.DESTROYED
-                except Exception as e:
-                    logger.error("agent_shutdown_error", agent=name, error=str(e))
+        # runtime이 있는 agent만 골라 동시에 종료 — 종료 시간이 Σ(tᵢ)가 아닌 max(tᵢ)
+        targets = [
+            (name, agent) for name, agent in self._agents.items()
+            if agent.runtime and agent.status != AgentStatus.LAZY
+        ]
+        await asyncio.gather(*(self._shutdown_agent(name, agent) for name, agent in targets))
+        await self._aspect_engine.shutdown()
         self._started = False
         boot_log("✓ Context shutdown complete")
+        flush_logs()
+
+    async def _shutdown_agent(self, name: str, agent: AgentInstance) -> None:
+        """Agent 하나의 runtime 종료 — 실패는 로그만 남기고 다른 agent 종료를 막지 않는다."""
+        assert agent.runtime is not None
+        try:
+            self._set_status(agent, AgentStatus.DESTROYING)
+            await agent.runtime.shutdown()
+            self._set_status(agent, AgentStatus.DESTROYED)
+        except Exception as e:
+            logger.error("agent_shutdown_error", agent=name, error=str(e))
 
     def get_status(self) -> dict[str, Any]:
         """Context 전체 상태 (FR-9.1: GET /api/status)."""
+        counts = self._status_counts
         return {
             "version": "0.1.0",
             "started": self._started,
             "started_at": self._started_at.isoformat() if self._started_at else None,
             "agents": {
                 "total": len(self._agents),
-                "active": sum(
-                    1 for a in self._agents.values()
-                    if a.status in (AgentStatus.READY, AgentStatus.EXECUTING)
-                ),
-                "lazy": sum(1 for a in self._agents.values() if a.status == AgentStatus.LAZY),
+                "active": counts[AgentStatus.READY] + counts[AgentStatus.EXECUTING],
+                "lazy": counts[AgentStatus.LAZY],
             },
             "tools": {
                 "bundles": len(self._tool_registry),
@@ -13,21 +13,33 @@ system_prompt에 합성한다.
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
 from pathlib import Path
 
 import structlog
 
+from aac.logging.formatter import format_available
 from aac.models.manifest import SkillManifest, SkillRef
 
 logger = structlog.get_logger()
 
 
+def _debug_enabled() -> bool:
+    """debug 로그 출력 여부 — 꺼져 있으면 이벤트 kwargs 구성 자체를 건너뛴다."""
+    return logger.is_enabled_for(logging.DEBUG)
+
+
 class SkillRegistry:
     """Skill 문서 레지스트리."""
 
     def __init__(self) -> None:
         self._skills: dict[str, SkillManifest] = {}
         self._instruction_cache: dict[str, str] = {}
+        # 합성용 skill 섹션 (구분자 + 문서) — create마다 대용량 문서를 다시 복사하지 않도록
+        self._section_cache: dict[str, str] = {}
 
     def register(self, manifest: SkillManifest) -> None:
         """Skill 등록."""
@@ -35,12 +47,27 @@ class SkillRegistry:
         if name in self._skills:
             logger.warning("skill_override", name=name)
         self._skills[name] = manifest
-        logger.debug("skill_registered", name=name)
+        self._instruction_cache.pop(name, None)
+        self._section_cache.pop(name, None)
+        if _debug_enabled():
+            logger.debug("skill_registered", name=name)
+
+    def bulk_register(self, manifests: Iterable[SkillManifest]) -> None:
+        """Skill 일괄 등록 — 스캔 결과 등록용 (개별 debug 로그 없이 요약 한 줄)."""
+        incoming = {m.metadata.name: m for m in manifests}
+        for name in incoming.keys() & self._skills.keys():
+            logger.warning("skill_override", name=name)
+        self._skills.update(incoming)
+        for name in incoming:
+            self._instruction_cache.pop(name, None)
+            self._section_cache.pop(name, None)
+        if _debug_enabled():
+            logger.debug("skills_registered", count=len(incoming))
 
     def get(self, name: str) -> SkillManifest:
         """이름으로 Skill 조회."""
         if name not in self._skills:
-            available = list(self._skills.keys())
+            available = format_available(self._skills.keys())
             raise KeyError(f"Skill '{name}' 미등록. 사용 가능: {available}")
         return self._skills[name]
 
@@ -55,27 +82,63 @@ class SkillRegistry:
         if name in self._instruction_cache:
             return self._instruction_cache[name]
 
-        manifest = self.get(name)
-        if not manifest.source_path:
-            raise ValueError(f"Skill '{name}'의 source_path가 설정되지 않았습니다")
-
-        base_dir = Path(manifest.source_path).parent
-        instruction_path = base_dir / manifest.spec.instruction_file
-
-        if not instruction_path.exists():
+        instruction_path = self._instruction_path(name)
+        try:
+            content = instruction_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Skill '{name}'의 instruction 파일을 찾을 수 없습니다: {instruction_path}"
-            )
+            ) from None
 
-        content = instruction_path.read_text(encoding="utf-8")
         self._instruction_cache[name] = content
-        logger.debug("skill_instruction_loaded", name=name, path=str(instruction_path))
+        if _debug_enabled():
+            logger.debug("skill_instruction_loaded", name=name, path=str(instruction_path))
         return content
 
+    async def preload_instructions(self) -> int:
+        """등록된 모든 Skill의 instruction 문서를 병렬로 미리 읽어 캐시에 채운다.
+
+        파일 읽기는 스레드로 넘겨 이벤트 루프를 막지 않고 서로 겹쳐 수행된다.
+        읽기에 실패한 Skill은 건너뛰며, 이후 load_instruction이 원래 에러를 낸다.
+
+        Returns:
+            새로 캐시에 적재된 문서 수
+        """
+        targets: list[tuple[str, Path]] = []
+        for name, manifest in self._skills.items():
+            if name in self._instruction_cache or not manifest.source_path:
+                continue
+            targets.append((name, self._instruction_path(name)))
+
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(path.read_text, encoding="utf-8") for _, path in targets),
+            return_exceptions=True,
+        )
+
+        debug = _debug_enabled()
+        loaded = 0
+        for (name, path), content in zip(targets, contents, strict=True):
+            if isinstance(content, BaseException):
+                if debug:
+                    logger.debug("skill_instruction_preload_failed", name=name, path=str(path))
+                continue
+            self._instruction_cache[name] = content
+            loaded += 1
+        if debug:
+            logger.debug("skill_instructions_preloaded", count=loaded)
+        return loaded
+
+    def _instruction_path(self, name: str) -> Path:
+        """skill.yaml의 source_path 기준 instruction_file 경로."""
+        manifest = self.get(name)
+        if not manifest.source_path:
+            raise ValueError(f"Skill '{name}'의 source_path가 설정되지 않았습니다")
+        return Path(manifest.source_path).parent / manifest.spec.instruction_file
+
     def resolve_skills(
         self,
         skill_refs: list[SkillRef],
-        available_tools: set[str],
+        available_tools: AbstractSet[str],
         *,
         strict: bool = False,
     ) -> list[str]:
@@ -91,7 +154,8 @@ class SkillRegistry:
         for ref in skill_refs:
             name = ref.ref
             if name in seen:
-                logger.debug("skill_duplicate_skipped", name=name)
+                if _debug_enabled():
+                    logger.debug("skill_duplicate_skipped", name=name)
                 continue
             seen.add(name)
 
@@ -108,12 +172,16 @@ class SkillRegistry:
                         raise ValueError(msg)
                     logger.warning("skill_required_tool_missing", skill=name, tool=req_tool)
 
-            instruction = self.load_instruction(name)
-            instructions.append(f"\n---\n## Skill: {name}\n\n{instruction}")
+            section = self._section_cache.get(name)
+            if section is None:
+                instruction = self.load_instruction(name)
+                section = f"\n---\n## Skill: {name}\n\n{instruction}"
+                self._section_cache[name] = section
+            instructions.append(section)
 
         return instructions
 
-    def _tool_available(self, tool_name: str, available_tools: set[str]) -> bool:
+    def _tool_available(self, tool_name: str, available_tools: AbstractSet[str]) -> bool:
         """tool 이름이 available_tools에 존재하는지 확인.
 
         번들 이름(file-ops)이나 개별 tool 이름(Read) 모두 매칭.
@@ -10,37 +10,88 @@ Agent 생성 시 ref로 참조된 Tool 번들을 해석하여 ToolDefinition 목
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Iterable
+
 import structlog
 
+from aac.logging.formatter import format_available
 from aac.models.instance import ToolDefinition
 from aac.models.manifest import ToolManifest, ToolRef
 
 logger = structlog.get_logger()
 
 
+def _debug_enabled() -> bool:
+    """debug 로그 출력 여부 — 꺼져 있으면 이벤트 kwargs 구성 자체를 건너뛴다."""
+    return logger.is_enabled_for(logging.DEBUG)
+
+
 class ToolRegistry:
     """Tool 번들 레지스트리."""
 
     def __init__(self, *, strict: bool = False) -> None:
         self._bundles: dict[str, ToolManifest] = {}
         self._strict = strict
+        # 번들별 ToolDefinition — register 시 한 번 만들어 모든 agent가 공유
+        # pydantic item 모델 대신 이 튜플로 해석/집계 (item 속성 접근을 register 시 한 번만)
+        self._bundle_defs: dict[str, tuple[ToolDefinition, ...]] = {}
+        self._total_tools = 0
+        # 번들별 이름 집합 (번들 이름 + item 이름들) — skill required_tools 검사용
+        self._bundle_names: dict[str, frozenset[str]] = {}
+        # resolve_tools 결과 캐시 — {((ref, name), ...): 해석 결과}, register 시 무효화
+        self._resolve_cache: dict[
+            tuple[tuple[str | None, str | None], ...], tuple[ToolDefinition, ...]
+        ] = {}
 
     def register(self, manifest: ToolManifest) -> None:
         """Tool 번들 등록."""
         name = manifest.metadata.name
         if name in self._bundles:
             logger.warning("tool_bundle_override", name=name)
+        self._index(manifest)
+        self._resolve_cache.clear()
+        if _debug_enabled():
+            logger.debug(
+                "tool_bundle_registered",
+                name=name,
+                item_count=len(manifest.spec.items),
+            )
+
+    def bulk_register(self, manifests: Iterable[ToolManifest]) -> None:
+        """Tool 번들 일괄 등록 — 스캔 결과 등록용 (개별 debug 로그 없이 요약 한 줄)."""
+        incoming = {m.metadata.name: m for m in manifests}
+        for name in incoming.keys() & self._bundles.keys():
+            logger.warning("tool_bundle_override", name=name)
+        for manifest in incoming.values():
+            self._index(manifest)
+        self._resolve_cache.clear()
+        if _debug_enabled():
+            logger.debug("tool_bundles_registered", count=len(incoming))
+
+    def _index(self, manifest: ToolManifest) -> None:
+        """번들 저장 + ToolDefinition/이름 집합 미리 구성."""
+        name = manifest.metadata.name
         self._bundles[name] = manifest
-        logger.debug(
-            "tool_bundle_registered",
-            name=name,
-            item_count=len(manifest.spec.items),
+        self._total_tools -= len(self._bundle_defs.get(name, ()))
+        self._bundle_defs[name] = defs = tuple(
+            ToolDefinition(
+                name=item.name,
+                bundle_name=name,
+                description=item.description,
+                input_schema=item.input_schema,
+                output_schema=item.output_schema,
+                config=item.config,
+            )
+            for item in manifest.spec.items
         )
+        self._total_tools += len(defs)
+        self._bundle_names[name] = frozenset([name, *(d.name for d in defs)])
 
     def get(self, name: str) -> ToolManifest:
         """번들 이름으로 조회."""
         if name not in self._bundles:
-            available = list(self._bundles.keys())
+            available = format_available(self._bundles.keys())
             raise KeyError(f"Tool 번들 '{name}' 미등록. 사용 가능: {available}")
         return self._bundles[name]
 
@@ -52,52 +103,75 @@ class ToolRegistry:
 
         충돌 규칙 (DR-1): 번들 간 같은 이름 tool → last-wins + 경고.
         strict 모드에서는 충돌 시 예외.
+        같은 ref 구성은 캐시된 결과를 재사용한다 (ToolDefinition 인스턴스는 agent 간 공유).
         """
-        resolved: dict[str, ToolDefinition] = {}
+        key = tuple((ref.ref, ref.name) for ref in tool_refs)
+        cached = self._resolve_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        # 결과 목록 + 이름→위치 색인 — 충돌 시 같은 자리를 교체 (last-wins, 첫 등장 순서 유지)
+        resolved: list[ToolDefinition] = []
+        index: dict[str, int] = {}
+        # 충돌은 모아서 해석이 끝난 뒤 경고 한 번으로 보고
+        conflicts: list[str] = []
         for ref in tool_refs:
             if ref.ref:
-                bundle = self.get(ref.ref)
-                for item in bundle.spec.items:
-                    tool_def = ToolDefinition(
-                        name=item.name,
-                        bundle_name=bundle.metadata.name,
-                        description=item.description,
-                        input_schema=item.input_schema,
-                        output_schema=item.output_schema,
-                        config=item.config,
-                    )
-                    if item.name in resolved:
-                        existing = resolved[item.name]
-                        if self._strict:
-                            raise ValueError(
-                                f"Tool 이름 충돌 (strict 모드): '{item.name}' "
-                                f"— {existing.bundle_name} vs {bundle.metadata.name}"
-                            )
-                        logger.warning(
-                            "tool_name_conflict",
-                            tool=item.name,
-                            existing_bundle=existing.bundle_name,
-                            new_bundle=bundle.metadata.name,
-                            resolution="last-wins",
+                self.get(ref.ref)  # 미등록 번들이면 KeyError
+                for tool_def in self._bundle_defs[ref.ref]:
+                    pos = index.get(tool_def.name)
+                    if pos is None:
+                        index[tool_def.name] = len(resolved)
+                        resolved.append(tool_def)
+                        continue
+                    existing = resolved[pos]
+                    if self._strict:
+                        raise ValueError(
+                            f"Tool 이름 충돌 (strict 모드): '{tool_def.name}' "
+                            f"— {existing.bundle_name} vs {tool_def.bundle_name}"
                         )
-                    resolved[item.name] = tool_def
+                    conflicts.append(
+                        f"{tool_def.name} ({existing.bundle_name} → {tool_def.bundle_name})"
+                    )
+                    resolved[pos] = tool_def
             elif ref.name:
                 tool_def = ToolDefinition(name=ref.name)
-                if ref.name in resolved:
-                    if self._strict:
-                        raise ValueError(f"Tool 이름 충돌 (strict 모드): '{ref.name}'")
-                    logger.warning("tool_name_conflict", tool=ref.name, resolution="last-wins")
-                resolved[ref.name] = tool_def
-        return list(resolved.values())
+                pos = index.get(ref.name)
+                if pos is None:
+                    index[ref.name] = len(resolved)
+                    resolved.append(tool_def)
+                    continue
+                if self._strict:
+                    raise ValueError(f"Tool 이름 충돌 (strict 모드): '{ref.name}'")
+                conflicts.append(ref.name)
+                resolved[pos] = tool_def
+
+        if conflicts:
+            logger.warning("tool_name_conflict", tools=conflicts, resolution="last-wins")
+
+        self._resolve_cache[key] = tuple(resolved)
+        return resolved
+
+    def tool_names(self, tool_refs: list[ToolRef]) -> frozenset[str]:
+        """ToolRef 목록이 주입하는 이름 집합 — 번들 이름과 개별 tool 이름 모두 포함."""
+        names: list[str] = []
+        bundle_sets: list[frozenset[str]] = []
+        for ref in tool_refs:
+            if ref.ref:
+                self.get(ref.ref)  # 미등록 번들이면 KeyError
+                bundle_sets.append(self._bundle_names[ref.ref])
+            elif ref.name:
+                names.append(ref.name)
+        return frozenset(names).union(*bundle_sets)
 
     def list_all(self) -> dict[str, int]:
         """등록된 번들 목록 — {name: item_count}."""
-        return {name: len(m.spec.items) for name, m in self._bundles.items()}
+        return {name: len(defs) for name, defs in self._bundle_defs.items()}
 
     @property
     def total_tool_count(self) -> int:
         """전체 등록된 tool 수."""
-        return sum(len(m.spec.items) for m in self._bundles.values())
+        return self._total_tools
 
     def __len__(self) -> int:
         return len(self._bundles)
@@ -11,6 +11,7 @@ AgentManifest → AgentInstance 생성 과정에서:
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +26,16 @@ from aac.runtime.registry import RuntimeRegistry
 
 logger = structlog.get_logger()
 
+# prompt_file 캐시에 보관할 최대 파일 수 (LRU)
+_PROMPT_FILE_CACHE_SIZE = 256
+# 합성 프롬프트 캐시 크기 (LRU) — prompt_file을 고칠 때마다 새 키가 생기므로 상한을 둔다
+_PROMPT_CACHE_SIZE = 256
+
+# 합성 프롬프트 캐시 키 — (agent 이름, 버전, system_prompt, prompt_file 식별자, skill 문서들)
+# prompt_file은 내용 대신 (st_dev, st_ino, mtime_ns, size)로 식별 — 큰 문자열 사본을 키에 두지 않음
+# skill 문서는 SkillRegistry 캐시의 문자열을 참조만 하므로, 재등록으로 내용이 바뀌면 키도 바뀐다
+_PromptKey = tuple[str, str, str | None, tuple[int, int, int, int] | None, tuple[str, ...]]
+
 
 class AgentFactory:
     """Agent 인스턴스 생성 팩토리 — DI 통합."""
@@ -39,6 +50,15 @@ class AgentFactory:
         self._tool_registry = tool_registry
         self._skill_registry = skill_registry
 
+        # 합성된 system prompt 캐시 — lazy 활성화 등으로 같은 manifest를 다시 create할 때 재사용
+        self._prompt_cache: OrderedDict[_PromptKey, str] = OrderedDict()
+        # prompt_file 내용 캐시 — {(st_dev, st_ino): (mtime_ns, size, strip된 내용)}, LRU
+        # 실제 파일 기준 키라 "../shared/persona.md"처럼 여러 agent가 다른 상대 경로로
+        # 같은 파일을 참조해도 한 번만 읽는다. 수정(mtime/size 변경) 시 다시 읽음
+        self._prompt_file_cache: OrderedDict[tuple[int, int], tuple[int, int, str]] = (
+            OrderedDict()
+        )
+
     async def create(
         self,
         manifest: AgentManifest,
@@ -64,11 +84,7 @@ class AgentFactory:
         resolved_tools = self._tool_registry.resolve_tools(manifest.spec.tools)
 
         # tool 이름 집합 (skill required_tools 검사용)
-        available_tool_names: set[str] = set()
-        for t in resolved_tools:
-            available_tool_names.add(t.name)
-            if t.bundle_name:
-                available_tool_names.add(t.bundle_name)
+        available_tool_names = self._tool_registry.tool_names(manifest.spec.tools)
 
         tools_summary = self._build_tools_summary(resolved_tools)
         init_log(name, f"⚙ TOOLS_LOADED: {len(resolved_tools)} tools ({tools_summary})")
@@ -86,6 +102,12 @@ class AgentFactory:
         # 4. System Prompt 합성 (DR-2)
         system_prompt = self._synthesize_prompt(manifest, skill_instructions)
 
+        # runtime 전달용 tool 목록 — 실행마다 다시 만들지 않도록 미리 구성
+        tools_payload = [
+            {"name": t.name, "description": t.description}
+            for t in resolved_tools
+        ] or None
+
         # 5. AgentInstance 생성
         agent = AgentInstance(
             name=name,
@@ -95,6 +117,7 @@ class AgentFactory:
             runtime=runtime,
             runtime_name=manifest.spec.runtime,
             tools=resolved_tools,
+            tools_payload=tools_payload,
             skills=skill_names,
             system_prompt=system_prompt,
             capabilities=manifest.spec.capabilities,
@@ -113,7 +136,7 @@ class AgentFactory:
             name=name,
             tools_count=agent.tools_loaded_count,
             skills=skill_names,
-            status=agent.status.value,
+            status=agent.status,
         )
         return agent
 
@@ -125,7 +148,23 @@ class AgentFactory:
         """System Prompt 합성 (DR-2).
 
         순서: system_prompt → prompt_file → skill 문서들.
+        같은 agent(이름/버전/system_prompt/skill 문서)·같은 prompt_file이면 캐시된 결과를 반환.
         """
+        prompt_file = self._read_prompt_file(manifest)
+        file_stamp, prompt_file_content = prompt_file if prompt_file else (None, None)
+        key: _PromptKey = (
+            manifest.metadata.name,
+            manifest.metadata.version,
+            manifest.spec.system_prompt,
+            file_stamp,
+            tuple(skill_instructions),
+        )
+        cache = self._prompt_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+
         parts: list[str] = []
 
         # system_prompt (직접 선언)
@@ -133,24 +172,56 @@ class AgentFactory:
             parts.append(manifest.spec.system_prompt.strip())
 
         # prompt_file (파일 참조)
-        if manifest.spec.prompt_file and manifest.source_path:
-            prompt_path = Path(manifest.source_path).parent / manifest.spec.prompt_file
-            if prompt_path.exists():
-                content = prompt_path.read_text(encoding="utf-8")
-                parts.append(content.strip())
-            else:
-                logger.warning(
-                    "prompt_file_not_found",
-                    agent=manifest.metadata.name,
-                    path=str(prompt_path),
-                )
+        if prompt_file_content is not None:
+            parts.append(prompt_file_content)
 
         # skill 문서들
         if skill_instructions:
             parts.append("\n---\n## Injected Skills")
             parts.extend(skill_instructions)
 
-        return "\n\n".join(parts)
+        # join은 전체 길이를 먼저 계산해 한 번만 할당 — parts는 참조만 담으므로 StringIO보다 빠름
+        prompt = "\n\n".join(parts)
+        cache[key] = prompt
+        if len(cache) > _PROMPT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return prompt
+
+    def _read_prompt_file(
+        self, manifest: AgentManifest,
+    ) -> tuple[tuple[int, int, int, int], str] | None:
+        """prompt_file의 (식별자, strip된 내용) — mtime이 그대로면 캐시 사용, 파일이 없으면 None.
+
+        식별자는 (st_dev, st_ino, mtime_ns, size)로, 합성 프롬프트 캐시 키에 쓰인다.
+        """
+        if not (manifest.spec.prompt_file and manifest.source_path):
+            return None
+
+        prompt_path = Path(manifest.source_path).parent / manifest.spec.prompt_file
+        try:
+            st = prompt_path.stat()
+        except FileNotFoundError:
+            logger.warning(
+                "prompt_file_not_found",
+                agent=manifest.metadata.name,
+                path=str(prompt_path),
+            )
+            return None
+
+        cache = self._prompt_file_cache
+        key = (st.st_dev, st.st_ino)
+        stamp = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            cache.move_to_end(key)
+            return stamp, cached[2]
+
+        content = prompt_path.read_text(encoding="utf-8").strip()
+        cache[key] = (st.st_mtime_ns, st.st_size, content)
+        cache.move_to_end(key)
+        if len(cache) > _PROMPT_FILE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return stamp, content
 
     @staticmethod
     def _build_tools_summary(tools: list[Any]) -> str:
@@ -12,15 +12,18 @@ Agent 인스턴스의 상태 전이, 건강 검사, 우아한 종료를 관리
 from __future__ import annotations
 
 import asyncio
-import time
-from collections.abc import Callable
+import json
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from itertools import islice
+from typing import Any, Final
 
 import structlog
 
-from aac.logging.formatter import aac_log
+from aac.logging.formatter import aac_log, flush_logs
 from aac.models.instance import AgentInstance, AgentStatus
 
 logger = structlog.get_logger()
@@ -29,7 +32,7 @@ logger = structlog.get_logger()
 # ─── 이벤트 타입 ──────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class LifecycleEvent:
     """생명주기 이벤트 — 콜백/로깅용."""
 
@@ -38,21 +41,29 @@ class LifecycleEvent:
     new_status: AgentStatus
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
     error: str | None = None
+    # to_json 결과 캐시 — 이벤트는 기록 후 변경하지 않으므로 한 번만 직렬화
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "agent": self.agent_name,
-            "old_status": self.old_status.value,
-            "new_status": self.new_status.value,
+            "old_status": self.old_status,
+            "new_status": self.new_status,
             "timestamp": self.timestamp.isoformat(),
             "error": self.error,
         }
 
+    def to_json(self) -> str:
+        """JSON 문자열 — 첫 호출에서 만든 값을 재사용."""
+        if self._json is None:
+            self._json = json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        return self._json
+
 
 # ─── 건강 검사 결과 ───────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Agent 건강 검사 결과."""
 
@@ -80,26 +91,37 @@ class HealthCheckResult:
 LifecycleCallback = Callable[[LifecycleEvent], Any]
 
 
-# 유효한 상태 전이 맵
-VALID_TRANSITIONS: dict[AgentStatus, set[AgentStatus]] = {
-    AgentStatus.REGISTERED: {AgentStatus.INITIALIZING, AgentStatus.LAZY},
-    AgentStatus.LAZY: {AgentStatus.INITIALIZING},
-    AgentStatus.INITIALIZING: {AgentStatus.READY, AgentStatus.ERROR},
-    AgentStatus.READY: {
+# 유효한 상태 전이 맵 (불변 — 전이 검증마다 그대로 조회)
+VALID_TRANSITIONS: dict[AgentStatus, frozenset[AgentStatus]] = {
+    AgentStatus.REGISTERED: frozenset({AgentStatus.INITIALIZING, AgentStatus.LAZY}),
+    AgentStatus.LAZY: frozenset({AgentStatus.INITIALIZING}),
+    AgentStatus.INITIALIZING: frozenset({AgentStatus.READY, AgentStatus.ERROR}),
+    AgentStatus.READY: frozenset({
         AgentStatus.EXECUTING,
         AgentStatus.DESTROYING,
         AgentStatus.ERROR,
-    },
-    AgentStatus.EXECUTING: {
+    }),
+    AgentStatus.EXECUTING: frozenset({
         AgentStatus.READY,
         AgentStatus.ERROR,
         AgentStatus.DESTROYING,
-    },
-    AgentStatus.ERROR: {AgentStatus.INITIALIZING, AgentStatus.DESTROYING},
-    AgentStatus.DESTROYING: {AgentStatus.DESTROYED, AgentStatus.ERROR},
-    AgentStatus.DESTROYED: set(),
+    }),
+    AgentStatus.ERROR: frozenset({AgentStatus.INITIALIZING, AgentStatus.DESTROYING}),
+    AgentStatus.DESTROYING: frozenset({AgentStatus.DESTROYED, AgentStatus.ERROR}),
+    AgentStatus.DESTROYED: frozenset(),
 }
 
+# 건강 검사에서 healthy로 보는 상태
+# (tuple보다 frozenset이 빠름 — StrEnum 멤버는 불일치 시 tuple의 == 비교가 해시 조회보다 느리다)
+_HEALTHY_STATUSES: Final = frozenset({AgentStatus.READY, AgentStatus.EXECUTING})
+
+# 우아한 종료에서 건너뛰는 상태 (미초기화 / 이미 종료 중·종료됨)
+_SHUTDOWN_SKIP_STATUSES: Final = frozenset({
+    AgentStatus.LAZY,
+    AgentStatus.DESTROYED,
+    AgentStatus.DESTROYING,
+})
+
 
 class LifecycleManager:
     """Agent 생명주기 관리자.
@@ -113,8 +135,13 @@ class LifecycleManager:
 
     def __init__(self) -> None:
         self._callbacks: list[LifecycleCallback] = []
-        self._events: list[LifecycleEvent] = []
         self._max_events = 500  # 최근 이벤트만 보관
+        # 링 버퍼 — 가득 차면 가장 오래된 이벤트가 자동으로 밀려남 (복사 없음)
+        self._events: deque[LifecycleEvent] = deque(maxlen=self._max_events)
+        # agent별 보조 인덱스 — _events에 남아 있는 이벤트만 담는다 (agent 필터 조회용)
+        self._events_by_agent: dict[str, deque[LifecycleEvent]] = {}
+        # batch() 안에서 발생한 이벤트 — 콜백은 batch 종료 시 한 번에 호출
+        self._pending_events: list[LifecycleEvent] | None = None
 
     def add_callback(self, callback: LifecycleCallback) -> None:
         """생명주기 이벤트 콜백 등록."""
@@ -135,16 +162,16 @@ class LifecycleManager:
         old_status = agent.status
 
         # 전이 유효성 검증
-        valid = VALID_TRANSITIONS.get(old_status, set())
+        valid = VALID_TRANSITIONS.get(old_status, frozenset())
         if new_status not in valid:
             raise ValueError(
                 f"Agent '{agent.name}': "
-                f"{old_status.value} → {new_status.value} 전이 불가. "
+                f"{old_status} → {new_status} 전이 불가. "
                 f"허용: {[s.value for s in valid]}"
             )
 
         # 상태 변경
-        agent.status = new_status
+        agent.set_status(new_status)
 
         # 이벤트 생성
         event = LifecycleEvent(
@@ -155,11 +182,60 @@ class LifecycleManager:
         )
 
         # 이벤트 기록
+        self._record(event)
+
+        # 콜백 호출 — 등록된 콜백이 없는 일반적인 경우는 호출 자체를 건너뛴다
+        if self._callbacks:
+            if self._pending_events is not None:
+                self._pending_events.append(event)
+            else:
+                self._notify(event)
+
+        aac_log(
+            agent.name, "lifecycle", "transition",
+            f"{old_status} → {new_status}"
+            + (f" (error: {error})" if error else ""),
+        )
+
+        return event
+
+    def _record(self, event: LifecycleEvent) -> None:
+        """이벤트를 링 버퍼와 agent별 인덱스에 추가."""
+        if len(self._events) == self._events.maxlen:
+            # 밀려날 가장 오래된 이벤트는 해당 agent 인덱스에서도 가장 오래된 항목
+            evicted = self._events[0]
+            per_agent = self._events_by_agent[evicted.agent_name]
+            per_agent.popleft()
+            if not per_agent:
+                del self._events_by_agent[evicted.agent_name]
         self._events.append(event)
-        if len(self._events) > self._max_events:
-            self._events = self._events[-self._max_events:]
+        per_agent = self._events_by_agent.get(event.agent_name)
+        if per_agent is None:
+            per_agent = self._events_by_agent[event.agent_name] = deque()
+        per_agent.append(event)
 
-        # 콜백 호출
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """연속 전이의 콜백 호출을 모아서 처리.
+
+        블록 안의 transition은 상태 변경/이벤트 기록을 즉시 하되, 콜백은 블록을 빠져나갈 때
+        발생 순서대로 한 번에 호출한다. 중첩된 batch는 가장 바깥 batch가 끝날 때 호출.
+        """
+        if self._pending_events is not None:
+            yield
+            return
+
+        pending: list[LifecycleEvent] = []
+        self._pending_events = pending
+        try:
+            yield
+        finally:
+            self._pending_events = None
+            for event in pending:
+                self._notify(event)
+
+    def _notify(self, event: LifecycleEvent) -> None:
+        """콜백 호출 — 콜백 하나의 에러가 다른 콜백/전이를 막지 않는다."""
         for cb in self._callbacks:
             try:
                 cb(event)
@@ -170,14 +246,6 @@ class LifecycleManager:
                     error=str(e),
                 )
 
-        aac_log(
-            agent.name, "lifecycle", "transition",
-            f"{old_status.value} → {new_status.value}"
-            + (f" (error: {error})" if error else ""),
-        )
-
-        return event
-
     def check_health(self, agent: AgentInstance) -> HealthCheckResult:
         """Agent 건강 검사.
 
@@ -185,8 +253,7 @@ class LifecycleManager:
         - ERROR: unhealthy
         - 나머지: 상태 보고만
         """
-        healthy_statuses = {AgentStatus.READY, AgentStatus.EXECUTING}
-        is_healthy = agent.status in healthy_statuses
+        is_healthy = agent.status in _HEALTHY_STATUSES
 
         details: dict[str, Any] = {
             "query_count": agent.query_count,
@@ -203,7 +270,7 @@ class LifecycleManager:
         return HealthCheckResult(
             agent_name=agent.name,
             healthy=is_healthy,
-            status=agent.status.value,
+            status=agent.status,
             details=details,
         )
 
@@ -215,109 +282,145 @@ class LifecycleManager:
             name: self.check_health(agent) for name, agent in agents.items()
         }
 
+    def check_all_health_counts(
+        self, agents: dict[str, AgentInstance],
+    ) -> dict[str, Any]:
+        """건강 검사 요약 — 개수만 필요할 때 HealthCheckResult를 만들지 않는 경로."""
+        by_status: dict[str, int] = dict(Counter(agent.status for agent in agents.values()))
+        healthy = sum(c for status, c in by_status.items() if status in _HEALTHY_STATUSES)
+        return {
+            "healthy": healthy,
+            "unhealthy": len(agents) - healthy,
+            "by_status": by_status,
+        }
+
     async def graceful_shutdown(
         self,
         agents: dict[str, AgentInstance],
         *,
         timeout_seconds: float = 30.0,
     ) -> list[LifecycleEvent]:
-        """우아한 종료 — 모든 활성 Agent 순차 종료.
+        """우아한 종료 — 모든 활성 Agent를 동시에 종료.
 
         1. EXECUTING 상태 Agent는 완료 대기 (timeout까지)
         2. READY/ERROR 상태 Agent는 즉시 DESTROYING → DESTROYED
         3. LAZY Agent는 스킵
+
+        Agent별 종료는 서로 독립이므로 동시에 진행 — 전체 시간이 Σ(tᵢ)가 아닌 max(tᵢ).
+        timeout_seconds 안에 끝나지 않은 Agent 종료는 취소된다.
         """
+        targets = [
+            (name, agent) for name, agent in agents.items()
+            if agent.status not in _SHUTDOWN_SKIP_STATUSES
+        ]
+        if not targets:
+            flush_logs()
+            return []
+
+        # DESTROYING/DESTROYED 전이 콜백은 종료가 끝난 뒤 한 번에 호출
+        with self.batch():
+            tasks = [
+                asyncio.create_task(self._shutdown_one(name, agent, timeout_seconds))
+                for name, agent in targets
+            ]
+            _, pending = await asyncio.wait(tasks, timeout=timeout_seconds)
+            if pending:
+                logger.warning("graceful_shutdown_timeout", remaining=len(pending))
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # 입력 순서대로 이벤트를 모은다 (취소된 Agent는 완료된 전이까지만)
         events: list[LifecycleEvent] = []
-        start_time = time.monotonic()
-
-        for name, agent in agents.items():
-            elapsed = time.monotonic() - start_time
-            if elapsed > timeout_seconds:
-                logger.warning(
-                    "graceful_shutdown_timeout",
-                    remaining=len(agents) - len(events),
-                )
-                break
+        for task in tasks:
+            if not task.cancelled():
+                events.extend(task.result())
 
-            if agent.status in (
-                AgentStatus.LAZY,
-                AgentStatus.DESTROYED,
-                AgentStatus.DESTROYING,
-            ):
-                continue
+        # 전이 로그가 writer 스레드 대기열에 남지 않도록 내보낸다
+        flush_logs()
+        return events
 
-            try:
-                # EXECUTING 상태면 완료 대기
-                if agent.status == AgentStatus.EXECUTING:
-                    remaining = timeout_seconds - elapsed
-                    await self._wait_for_ready(
-                        agent, timeout=min(remaining, 10.0),
-                    )
+    async def _shutdown_one(
+        self, name: str, agent: AgentInstance, timeout_seconds: float,
+    ) -> list[LifecycleEvent]:
+        """Agent 하나 종료 — EXECUTING 대기 → DESTROYING → runtime.shutdown → DESTROYED."""
+        events: list[LifecycleEvent] = []
+        try:
+            # EXECUTING 상태면 완료 대기
+            if agent.status == AgentStatus.EXECUTING:
+                await self._wait_for_ready(agent, timeout=min(timeout_seconds, 10.0))
 
-                # DESTROYING 전이
-                ev = self.transition(agent, AgentStatus.DESTROYING)
-                events.append(ev)
-
-                # Runtime shutdown
-                if agent.runtime:
-                    try:
-                        await agent.runtime.shutdown()
-                    except Exception as e:
-                        logger.warning(
-                            "runtime_shutdown_error",
-                            agent=name,
-                            error=str(e),
-                        )
-
-                # DESTROYED 전이
-                ev = self.transition(agent, AgentStatus.DESTROYED)
-                events.append(ev)
+            # DESTROYING 전이
+            events.append(self.transition(agent, AgentStatus.DESTROYING))
 
-            except Exception as e:
-                # 전이 실패 시 ERROR 처리
+            # Runtime shutdown
+            if agent.runtime:
                 try:
-                    ev = self.transition(
-                        agent, AgentStatus.ERROR, error=str(e),
-                    )
-                    events.append(ev)
-                except ValueError:
-                    logger.error(
-                        "shutdown_transition_error",
+                    await agent.runtime.shutdown()
+                except Exception as e:
+                    logger.warning(
+                        "runtime_shutdown_error",
                         agent=name,
                         error=str(e),
                     )
 
+            # DESTROYED 전이
+            events.append(self.transition(agent, AgentStatus.DESTROYED))
+
+        except Exception as e:
+            # 전이 실패 시 ERROR 처리
+            try:
+                events.append(self.transition(agent, AgentStatus.ERROR, error=str(e)))
+            except ValueError:
+                logger.error(
+                    "shutdown_transition_error",
+                    agent=name,
+                    error=str(e),
+                )
+
         return events
 
     async def _wait_for_ready(
         self, agent: AgentInstance, *, timeout: float = 10.0,
     ) -> None:
-        """EXECUTING → READY 대기."""
-        start = time.monotonic()
-        while agent.status == AgentStatus.EXECUTING:
-            if time.monotonic() - start > timeout:
-                break
-            await asyncio.sleep(0.1)
+        """EXECUTING → READY 대기 — 상태 전이 시 set되는 idle 이벤트를 기다린다."""
+        await agent.wait_idle(timeout)
 
     def get_events(
         self,
         agent_name: str | None = None,
         limit: int = 50,
     ) -> list[dict[str, Any]]:
-        """이벤트 히스토리 조회."""
-        events = self._events
-        if agent_name:
-            events = [e for e in events if e.agent_name == agent_name]
-        return [e.to_dict() for e in events[-limit:]]
+        """이벤트 히스토리 조회 — 최근 limit개를 시간 순으로."""
+        return [e.to_dict() for e in self._recent_events(agent_name, limit)]
+
+    def get_events_json(
+        self,
+        agent_name: str | None = None,
+        limit: int = 50,
+    ) -> str:
+        """get_events와 같은 목록을 JSON 배열 문자열로 — 이벤트별 직렬화 결과를 재사용."""
+        return "[" + ",".join(e.to_json() for e in self._recent_events(agent_name, limit)) + "]"
+
+    def _recent_events(self, agent_name: str | None, limit: int) -> list[LifecycleEvent]:
+        # agent 필터는 보조 인덱스에서 바로 — 전체 버퍼를 훑지 않음
+        source: deque[LifecycleEvent] | tuple[()] = (
+            self._events_by_agent.get(agent_name, ()) if agent_name else self._events
+        )
+        if limit <= 0:
+            # 음수/0 limit은 기존 슬라이스 의미([-limit:]) 그대로
+            return list(source)[-limit:]
+
+        # 최신 쪽부터 limit개만 보고 멈춤 — 버퍼 전체를 리스트로 만들지 않음
+        recent = list(islice(reversed(source), limit))
+        recent.reverse()
+        return recent
 
     def get_summary(
         self, agents: dict[str, AgentInstance],
     ) -> dict[str, Any]:
         """생명주기 요약 통계."""
-        status_counts: dict[str, int] = {}
-        for agent in agents.values():
-            status = agent.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = dict(Counter(agent.status for agent in agents.values()))
 
         return {
             "total_agents": len(agents),
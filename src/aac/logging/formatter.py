@@ -6,7 +6,48 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Collection, Iterable
+from itertools import islice
+from typing import TextIO
+
+# (epoch 초, "YYYY-MM-DDTHH:MM:SS") — 초가 바뀔 때만 재포맷. 튜플 통째 교체로 스레드 안전
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """현재 UTC 시각을 ISO 8601(마이크로초, +00:00) 문자열로 반환.
+
+    datetime.now(timezone.utc).isoformat()과 같은 형식이지만 tz-aware datetime을
+    만들지 않고, 초 단위 prefix를 캐시하여 같은 초 안의 호출은 접미사만 포맷한다.
+    """
+    global _iso_second_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _iso_second_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_second_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
+
+
+# (epoch 초, "HH:MM:SS" 로컬 시각) — utc_now_iso와 같은 방식으로 초 단위 캐시
+_local_second_cache: tuple[int, str] = (-1, "")
+
+
+def _local_clock_ms() -> str:
+    """현재 로컬 시각 "HH:MM:SS:mmm" — datetime 객체 없이 time_ns 산술로 포맷."""
+    global _local_second_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _local_second_cache
+    if sec != cached_sec:
+        lt = time.localtime(sec)
+        prefix = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        _local_second_cache = (sec, prefix)
+    return f"{prefix}:{ns // 1_000_000:03d}"
 
 
 class AACLogFormatter:
@@ -20,9 +61,7 @@ class AACLogFormatter:
         msg: str,
     ) -> str:
         """[HH:mm:ss:SSS] [agent] [session:tx] msg 형식으로 포맷."""
-        now = datetime.now()
-        ts = now.strftime("%H:%M:%S") + f":{now.microsecond // 1000:03d}"
-        return f"[{ts}] [{agent_name}] [{session_id}:{tx_id}] {msg}"
+        return f"[{_local_clock_ms()}] [{agent_name}] [{session_id}:{tx_id}] {msg}"
 
     @staticmethod
     def format_boot(msg: str) -> str:
@@ -35,16 +74,120 @@ class AACLogFormatter:
         return AACLogFormatter.format(agent_name, "system", "init", msg)
 
 
-def aac_log(agent_name: str, session_id: str, tx_id: str, msg: str) -> None:
-    """포맷된 로그를 콘솔에 출력."""
-    print(AACLogFormatter.format(agent_name, session_id, tx_id, msg))
+_console_enabled = True
+
+
+def set_console_logging(enabled: bool) -> None:
+    """aac_log 콘솔 출력 on/off — off이면 메시지 포맷 자체를 건너뛴다."""
+    global _console_enabled
+    _console_enabled = enabled
+
+
+def aac_log(agent_name: str, session_id: str, tx_id: str, msg: str, *args: object) -> None:
+    """포맷된 로그를 콘솔에 출력 — 대기열에 넣고, writer 스레드가 모아서 한 번에 write.
+
+    args가 주어지면 msg를 %-템플릿으로 보고 출력이 필요할 때만 `msg % args`로 조립한다.
+    """
+    if not _console_enabled:
+        return
+    if args:
+        msg = msg % args
+    # 출력 대상은 호출 시점의 sys.stdout — 나중에 write돼도 호출 당시의 캡처/리다이렉트로 간다
+    _log_queue.append((sys.stdout, AACLogFormatter.format(agent_name, session_id, tx_id, msg)))
+    if _writer_thread is None:
+        _start_writer()
+    _log_wakeup.set()
+
+
+# ─── 백그라운드 로그 writer ─────────────────────────────
+
+# aac_log 대기열 — 가득 차면 가장 오래된 줄부터 버린다 (호출 스레드는 절대 막히지 않음)
+_LOG_QUEUE_SIZE = 16384
+
+_log_queue: deque[tuple[TextIO, str]] = deque(maxlen=_LOG_QUEUE_SIZE)
+_log_wakeup = threading.Event()
+# 대기열 비우기 + write를 한 덩어리로 — writer 스레드와 flush_logs 사이 줄 순서 유지
+_write_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+
+
+def _start_writer() -> None:
+    global _writer_thread
+    with _write_lock:
+        if _writer_thread is None:
+            thread = threading.Thread(target=_writer_loop, name="aac-log-writer", daemon=True)
+            thread.start()
+            _writer_thread = thread
+
+
+def _writer_loop() -> None:
+    while True:
+        _log_wakeup.wait()
+        _log_wakeup.clear()
+        _drain()
+
+
+def _drain() -> None:
+    """쌓인 줄을 출력 대상별로 모아 대상마다 한 번의 write로 내보낸다."""
+    with _write_lock:
+        if not _log_queue:
+            return
+        entries = []
+        popleft = _log_queue.popleft
+        try:
+            while True:
+                entries.append(popleft())
+        except IndexError:
+            pass
+        # 같은 대상으로 이어지는 줄끼리 묶는다 (보통 전부 같은 stdout → write 1회)
+        start = 0
+        for end in range(1, len(entries) + 1):
+            if end < len(entries) and entries[end][0] is entries[start][0]:
+                continue
+            out = entries[start][0]
+            try:
+                out.write("\n".join(line for _, line in entries[start:end]) + "\n")
+                out.flush()
+            except (OSError, ValueError):
+                pass
+            start = end
+
+
+def flush_logs() -> None:
+    """대기 중인 aac_log 출력을 호출 스레드에서 즉시 모두 write (종료 시 호출)."""
+    _drain()
+
+
+atexit.register(flush_logs)
 
 
 def boot_log(msg: str) -> None:
     """부트 로그 출력."""
+    flush_logs()
     print(AACLogFormatter.format_boot(msg))
 
 
+def boot_log_lines(messages: Iterable[str]) -> None:
+    """부트 로그 여러 줄을 한 번에 출력 — 줄마다 같은 prefix, write는 한 번."""
+    prefix = AACLogFormatter.format_boot("")
+    lines = [prefix + msg for msg in messages]
+    if lines:
+        flush_logs()
+        print("\n".join(lines))
+
+
 def init_log(agent_name: str, msg: str) -> None:
     """초기화 로그 출력."""
+    flush_logs()
     print(AACLogFormatter.format_init(agent_name, msg))
+
+
+# "미등록" 에러 메시지에 나열할 최대 이름 수
+_MAX_LISTED_NAMES = 10
+
+
+def format_available(names: Collection[str]) -> str:
+    """미등록 에러용 '사용 가능' 목록 — 앞 10개만 나열하고 나머지는 개수로 표시."""
+    shown = list(islice(names, _MAX_LISTED_NAMES))
+    more = len(names) - len(shown)
+    return f"{shown} 외 {more}개" if more else str(shown)
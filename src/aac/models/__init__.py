@@ -21,7 +21,7 @@ from aac.models.manifest import (
     ToolRef,
     ToolSpec,
 )
-from aac.models.instance import AgentInstance, AgentStatus
+from aac.models.instance import AgentInstance, AgentStatus, QueryResult
 
 __all__ = [
     "AgentManifest",
@@ -36,6 +36,7 @@ __all__ = [
     "DependsOn",
     "Hooks",
     "Limits",
+    "QueryResult",
     "SkillManifest",
     "SkillMetadata",
     "SkillRef",
@@ -5,48 +5,73 @@
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime, timezone
+import json
+import os
+from dataclasses import dataclass, field
 from typing import Any
 
-from pydantic import BaseModel, Field
+from aac.logging.formatter import utc_now_iso
 
 
 def _generate_event_id() -> str:
-    return f"evt_{uuid.uuid4().hex[:12]}"
+    return f"evt_{os.urandom(6).hex()}"
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+@dataclass(slots=True, frozen=True, kw_only=True)
+class AACEvent:
+    """AAC WebSocket 이벤트 기본 스키마.
 
-
-class AACEvent(BaseModel):
-    """AAC WebSocket 이벤트 기본 스키마."""
+    push마다 생성되는 값 객체 — 외부 입력이 아니므로 검증 없는 slotted dataclass로 둔다.
+    """
 
     schema_version: str = "1.0"
-    event_id: str = Field(default_factory=_generate_event_id)
-    timestamp: str = Field(default_factory=_now_iso)
+    event_id: str = field(default_factory=_generate_event_id)
+    timestamp: str = field(default_factory=utc_now_iso)
     session_id: str = ""
     tx_id: str = ""
     type: str
-    payload: dict[str, Any] = Field(default_factory=dict)
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """직렬화용 dict (payload는 복사하지 않는다)."""
+        return {
+            "schema_version": self.schema_version,
+            "event_id": self.event_id,
+            "timestamp": self.timestamp,
+            "session_id": self.session_id,
+            "tx_id": self.tx_id,
+            "type": self.type,
+            "payload": self.payload,
+        }
+
+    def to_json(self) -> str:
+        """공백 없는 JSON 문자열 (WebSocket 전송용)."""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+
+# 하위 이벤트의 type은 클래스마다 고정 — 생성자 인자로 받지 않는다
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class AgentStatusChangeEvent(AACEvent):
-    type: str = "agent_status_change"
+    type: str = field(default="agent_status_change", init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ToolUseEvent(AACEvent):
-    type: str = "tool_use"
+    type: str = field(default="tool_use", init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class QueryStartEvent(AACEvent):
-    type: str = "query_start"
+    type: str = field(default="query_start", init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class QueryCompleteEvent(AACEvent):
-    type: str = "query_complete"
+    type: str = field(default="query_complete", init=False)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ContextBootEvent(AACEvent):
-    type: str = "context_boot"
+    type: str = field(default="context_boot", init=False)
@@ -6,17 +6,18 @@ runtime + tools + skills + depends_on이 DI로 주입된 상태의 살아있는
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from aac.runtime.base import AgentRuntime
 
 
-class AgentStatus(str, Enum):
-    """Agent 생명주기 상태."""
+class AgentStatus(StrEnum):
+    """Agent 생명주기 상태 — 멤버가 곧 값 문자열이므로 .value 없이 포맷/직렬화에 쓴다."""
 
     REGISTERED = "REGISTERED"       # manifest 파싱됨, 아직 초기화 안됨
     INITIALIZING = "INITIALIZING"   # on_init 실행 중
@@ -28,9 +29,9 @@ class AgentStatus(str, Enum):
     LAZY = "LAZY"                   # lazy=true, 아직 초기화 안됨
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolDefinition:
-    """해석 완료된 개별 Tool 정보."""
+    """해석 완료된 개별 Tool 정보 — ToolRegistry가 번들 등록 시 만들어 agent 간 공유 (불변)."""
 
     name: str
     bundle_name: str | None = None
@@ -47,7 +48,40 @@ class ToolDefinition:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class QueryResult:
+    """Context.execute() 결과 — 동기 API 응답 / Workflow 스텝 입력.
+
+    매 query마다 dict를 만들지 않도록 slots dataclass로 두고,
+    기존 호출부를 위해 dict 스타일 조회(get, [])를 지원한다.
+    """
+
+    execution_id: str
+    session_id: str
+    tx_id: str
+    agent: str
+    result: str
+    success: bool
+    error: str | None
+    cost_usd: float
+    duration_ms: int
+    model: str
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get 호환 조회."""
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 응답용 dict (dataclasses.asdict의 deepcopy 없이 필드만 복사)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
 class AgentInstance:
     """DI가 완료된 Agent 인스턴스 — Spring의 Bean 객체."""
 
@@ -61,6 +95,8 @@ class AgentInstance:
     runtime: AgentRuntime | None = None
     runtime_name: str = ""
     tools: list[ToolDefinition] = field(default_factory=list)
+    # runtime에 전달할 tool 목록 ({"name", "description"}) — 생성 시 한 번 구성, tool이 없으면 None
+    tools_payload: list[dict[str, Any]] | None = None
     skills: list[str] = field(default_factory=list)             # skill 이름 목록
     system_prompt: str = ""
     capabilities: list[str] = field(default_factory=list)
@@ -83,18 +119,50 @@ class AgentInstance:
     max_turns: int = 30
     timeout_seconds: int = 600
 
+    # EXECUTING이 아닐 때 set — 실행 완료 대기를 polling 없이 처리
+    _idle_event: asyncio.Event = field(
+        default_factory=asyncio.Event, init=False, repr=False, compare=False
+    )
+    # to_detail의 tools 항목 — tools는 생성 후 바뀌지 않으므로 첫 조회 때 한 번만 구성
+    _tools_detail: list[dict[str, str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.status != AgentStatus.EXECUTING:
+            self._idle_event.set()
+
+    def set_status(self, status: AgentStatus) -> None:
+        """상태 변경 — EXECUTING 진입/이탈에 맞춰 idle 이벤트를 clear/set."""
+        self.status = status
+        if status == AgentStatus.EXECUTING:
+            self._idle_event.clear()
+        else:
+            self._idle_event.set()
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """EXECUTING이 끝날 때까지 대기 — timeout 내에 끝나면 True."""
+        try:
+            await asyncio.wait_for(self._idle_event.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
     @property
     def tools_loaded_count(self) -> int:
         """로딩된 tool 수 (FR-8.4)."""
         return len(self.tools)
 
     def to_summary(self) -> dict[str, Any]:
-        """API 응답용 요약 정보 (FR-9.1)."""
+        """API 응답용 요약 정보 (FR-9.1).
+
+        키가 고정된 dict literal은 상수 키 튜플로 한 번에 만들어져 dict(zip(...))보다 빠르다.
+        """
         return {
             "name": self.name,
             "description": self.description,
             "runtime": self.runtime_name,
-            "status": self.status.value,
+            "status": self.status,
             "tools_loaded_count": self.tools_loaded_count,
             "skills": self.skills,
             "capabilities": self.capabilities,
@@ -107,13 +175,15 @@ class AgentInstance:
 
     def to_detail(self) -> dict[str, Any]:
         """Agent 상세 정보."""
+        if self._tools_detail is None:
+            self._tools_detail = [
+                {"name": t.name, "bundle": t.bundle_name, "qualified_name": t.qualified_name}
+                for t in self.tools
+            ]
         summary = self.to_summary()
         summary.update({
             "version": self.version,
-            "tools": [
-                {"name": t.name, "bundle": t.bundle_name, "qualified_name": t.qualified_name}
-                for t in self.tools
-            ],
+            "tools": self._tools_detail,
             "dependencies": list(self.dependencies.keys()),
             "max_turns": self.max_turns,
             "timeout_seconds": self.timeout_seconds,
@@ -6,7 +6,8 @@ apiVersion 필드로 스키마 버전을 관리하며, kind 필드로 리소스
 
 from __future__ import annotations
 
-from enum import Enum
+from collections import Counter
+from enum import Enum, StrEnum
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
@@ -14,7 +15,7 @@ from pydantic import BaseModel, Field, field_validator
 
 # ─── 공통 ─────────────────────────────────────────────────
 
-class ResourceKind(str, Enum):
+class ResourceKind(StrEnum):
     AGENT = "Agent"
     TOOL = "Tool"
     SKILL = "Skill"
@@ -56,16 +57,18 @@ class ToolSpec(BaseModel):
     @classmethod
     def unique_item_names(cls, v: list[ToolItem]) -> list[ToolItem]:
         """번들 내 도구 이름 중복 검사."""
-        names = [item.name for item in v]
-        dupes = [n for n in names if names.count(n) > 1]
+        counts = Counter(item.name for item in v)
+        dupes = {n for n, c in counts.items() if c > 1}
         if dupes:
-            raise ValueError(f"번들 내 Tool 이름 중복: {set(dupes)}")
+            raise ValueError(f"번들 내 Tool 이름 중복: {dupes}")
         return v
 
 
 class ToolManifest(BaseModel):
     """Tool YAML 스키마 (resources/tools/*/tool.yaml)."""
 
+    model_config = {"frozen": True}
+
     apiVersion: str = "aac/v1"  # noqa: N815
     kind: Literal[ResourceKind.TOOL] = ResourceKind.TOOL
     metadata: ToolMetadata
@@ -95,6 +98,8 @@ class SkillSpec(BaseModel):
 class SkillManifest(BaseModel):
     """Skill YAML 스키마 (resources/skills/*/skill.yaml)."""
 
+    model_config = {"frozen": True}
+
     apiVersion: str = "aac/v1"  # noqa: N815
     kind: Literal[ResourceKind.SKILL] = ResourceKind.SKILL
     metadata: SkillMetadata
@@ -195,6 +200,8 @@ class AgentSpec(BaseModel):
 class AgentManifest(BaseModel):
     """Agent YAML 스키마 (resources/agents/*/agent.yaml)."""
 
+    model_config = {"frozen": True}
+
     apiVersion: str = "aac/v1"  # noqa: N815
     kind: Literal[ResourceKind.AGENT] = ResourceKind.AGENT
     metadata: AgentMetadata
@@ -230,6 +237,8 @@ class AspectSpec(BaseModel):
 class AspectManifest(BaseModel):
     """Aspect YAML 스키마 (resources/aspects/*.yaml)."""
 
+    model_config = {"frozen": True}
+
     apiVersion: str = "aac/v1"  # noqa: N815
     kind: Literal[ResourceKind.ASPECT] = ResourceKind.ASPECT
     metadata: AspectMetadata
@@ -259,6 +268,8 @@ class RuntimeSpec(BaseModel):
 class RuntimeManifest(BaseModel):
     """Runtime YAML 스키마 (resources/runtimes/*.yaml)."""
 
+    model_config = {"frozen": True}
+
     apiVersion: str = "aac/v1"  # noqa: N815
     kind: Literal[ResourceKind.RUNTIME] = ResourceKind.RUNTIME
     metadata: RuntimeMetadata
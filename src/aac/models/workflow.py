@@ -10,7 +10,7 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from aac.models.manifest import ResourceKind
 
@@ -29,9 +29,16 @@ class OnFailure(StrEnum):
     RETRY = "retry"     # 재시도
 
 
+# 워크플로우 모델은 orchestration import 시점이 아니라 첫 검증 시점에 스키마를 빌드한다
+# (워크플로우를 쓰지 않는 부팅에서는 자기참조 WorkflowStep 스키마 빌드 비용을 내지 않음)
+_DEFERRED = ConfigDict(defer_build=True)
+
+
 class WorkflowStep(BaseModel):
     """워크플로우 개별 스텝."""
 
+    model_config = _DEFERRED
+
     name: str
     type: StepType = StepType.AGENT
     agent: str | None = None              # type=agent 시 실행할 agent 이름
@@ -41,6 +48,7 @@ class WorkflowStep(BaseModel):
     on_failure: OnFailure = OnFailure.STOP
     timeout_seconds: int = 600
     retry_count: int = 0
+    cache: bool = False                   # 같은 agent + 프롬프트의 성공 결과를 재사용
 
     # type=parallel 시 하위 스텝
     steps: list[WorkflowStep] | None = None
@@ -52,6 +60,8 @@ class WorkflowStep(BaseModel):
 
 
 class WorkflowMetadata(BaseModel):
+    model_config = _DEFERRED
+
     name: str
     description: str = ""
     version: str = "0.0.0"
@@ -61,15 +71,21 @@ class WorkflowMetadata(BaseModel):
 class WorkflowSpec(BaseModel):
     """워크플로우 스펙 — 스텝 목록 + 글로벌 설정."""
 
+    model_config = _DEFERRED
+
     steps: list[WorkflowStep]
     max_total_cost_usd: float | None = None      # 전체 비용 상한
     max_total_duration_seconds: int | None = None  # 전체 시간 상한
+    # 1이면 선언 순서대로 순차 실행, 2 이상이면 스텝 간 참조(DAG) 기반으로 최대 N개 동시 실행
+    max_parallelism: int = Field(default=1, ge=1)
     context: dict[str, Any] = Field(default_factory=dict)   # 초기 컨텍스트
 
 
 class WorkflowManifest(BaseModel):
     """Workflow YAML 스키마 (resources/workflows/*.yaml)."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     apiVersion: str = "aac/v1"  # noqa: N815
     kind: Literal[ResourceKind.WORKFLOW] = ResourceKind.WORKFLOW
     metadata: WorkflowMetadata
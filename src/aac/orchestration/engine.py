@@ -12,8 +12,11 @@ Spring Batch의 JobLauncher / StepExecution에 해당하며,
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import re
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -26,10 +29,36 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# condition/prompt 안의 스텝 참조 (예: "steps.step1.success" → step1)
+_STEP_REF = re.compile(r"\bsteps\.([\w-]+)")
+
+# 스텝 이름 색인을 보관할 최대 manifest 수
+_STEP_INDEX_CACHE_SIZE = 64
+
+# step.cache 결과 캐시 최대 항목 수
+_RESULT_CACHE_SIZE = 256
+
+# 프롬프트 템플릿 변수 (예: "{{topic}}", "{{steps.step1.result}}")
+_TEMPLATE_VAR = re.compile(r"\{\{\s*([\w.-]+)\s*\}\}")
+
 
 # ─── 실행 결과 모델 ───────────────────────────────────
 
 
+def _first_leaf(group: BaseExceptionGroup) -> BaseException:
+    """(중첩) 예외 그룹에서 처음 발생한 개별 예외."""
+    first = group.exceptions[0]
+    return _first_leaf(first) if isinstance(first, BaseExceptionGroup) else first
+
+
+class _StopSiblingsError(Exception):
+    """stop 정책 실패 등 중단 조건 발생 — TaskGroup이 실행 중인 형제 태스크를 취소하게 한다."""
+
+    def __init__(self, result: StepResult) -> None:
+        super().__init__(result.error)
+        self.result = result
+
+
 @dataclass
 class StepResult:
     """개별 스텝 실행 결과."""
@@ -43,6 +72,7 @@ class StepResult:
     duration_ms: int = 0
     skipped: bool = False
     retries: int = 0
+    cached: bool = False        # 결과 캐시에서 재사용됨 (실행/비용 없음)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -55,6 +85,7 @@ class StepResult:
             "duration_ms": self.duration_ms,
             "skipped": self.skipped,
             "retries": self.retries,
+            "cached": self.cached,
         }
 
 
@@ -92,6 +123,12 @@ class WorkflowEngine:
 
     def __init__(self, ctx: AgentApplicationContext) -> None:
         self._ctx = ctx
+        # manifest별 스텝 이름 색인 (LRU) — id 재사용에 대비해 manifest 참조도 함께 보관
+        self._step_indexes: OrderedDict[
+            int, tuple[WorkflowManifest, dict[str, WorkflowStep]]
+        ] = OrderedDict()
+        # step.cache=true인 agent 스텝의 성공 결과 (LRU) — key: agent + 프롬프트 해시
+        self._result_cache: OrderedDict[str, StepResult] = OrderedDict()
 
     async def run(
         self,
@@ -101,6 +138,9 @@ class WorkflowEngine:
     ) -> WorkflowResult:
         """워크플로우 실행 — 모든 스텝을 순서대로 처리.
 
+        spec.max_parallelism > 1이면 스텝 간 참조로 DAG를 만들어 선행 스텝이 끝난
+        스텝부터 동시에 실행한다 (_run_dag).
+
         Args:
             manifest: 워크플로우 정의
             initial_context: 초기 컨텍스트 (변수 바인딩)
@@ -118,34 +158,20 @@ class WorkflowEngine:
         aac_log("Workflow", session_id, "run", f"▶ STARTING workflow: {wf_name}")
 
         start_time = time.monotonic()
+        # 시간 상한은 스텝 duration 합이 아닌 실제 경과 시간(monotonic) 기준 —
+        # 병렬/DAG 실행에서는 duration 합이 경과 시간보다 커진다
+        limit_seconds = manifest.spec.max_total_duration_seconds
+        deadline = start_time + limit_seconds if limit_seconds else None
 
         try:
-            for step in manifest.spec.steps:
-                step_result = await self._execute_step(
-                    step, wf_result, session_id, manifest,
-                )
-                wf_result.steps.append(step_result)
-                wf_result.total_cost_usd += step_result.cost_usd
-                wf_result.total_duration_ms += step_result.duration_ms
-
-                # 이전 스텝 결과를 컨텍스트에 저장
-                wf_result.context[f"steps.{step.name}"] = {
-                    "success": step_result.success,
-                    "result": step_result.result,
-                    "error": step_result.error,
-                }
-
-                # 비용/시간 상한 체크
-                if self._check_limits(manifest, wf_result):
-                    wf_result.error = "비용 또는 시간 상한 초과"
-                    break
-
-                # 스텝 실패 + stop 정책이면 중단
-                if not step_result.success and not step_result.skipped:
-                    if step.on_failure == OnFailure.STOP:
-                        wf_result.error = (
-                            f"스텝 '{step.name}' 실패로 워크플로우 중단"
-                        )
+            if manifest.spec.max_parallelism > 1:
+                await self._run_dag(manifest, wf_result, session_id, deadline)
+            else:
+                for step in manifest.spec.steps:
+                    step_result = await self._execute_step(
+                        step, wf_result, session_id, manifest,
+                    )
+                    if self._record_step(step, step_result, manifest, wf_result, deadline):
                         break
 
             wf_result.success = wf_result.error is None
@@ -168,6 +194,112 @@ class WorkflowEngine:
 
         return wf_result
 
+    def _record_step(
+        self,
+        step: WorkflowStep,
+        step_result: StepResult,
+        manifest: WorkflowManifest,
+        wf_result: WorkflowResult,
+        deadline: float | None,
+    ) -> bool:
+        """최상위 스텝 결과 반영 — 워크플로우를 중단해야 하면 True (wf_result.error 설정)."""
+        wf_result.steps.append(step_result)
+        wf_result.total_cost_usd += step_result.cost_usd
+
+        # 이전 스텝 결과를 컨텍스트에 저장
+        wf_result.context[f"steps.{step.name}"] = {
+            "success": step_result.success,
+            "result": step_result.result,
+            "error": step_result.error,
+        }
+
+        # 비용/시간 상한 체크
+        if self._check_limits(manifest, wf_result, deadline):
+            wf_result.error = "비용 또는 시간 상한 초과"
+            return True
+
+        # 스텝 실패 + stop 정책이면 중단
+        if not step_result.success and not step_result.skipped:
+            if step.on_failure == OnFailure.STOP:
+                wf_result.error = f"스텝 '{step.name}' 실패로 워크플로우 중단"
+                return True
+        return False
+
+    async def _run_dag(
+        self,
+        manifest: WorkflowManifest,
+        wf_result: WorkflowResult,
+        session_id: str,
+        deadline: float | None,
+    ) -> None:
+        """DAG 실행 (Kahn) — 선행 스텝이 모두 끝난 스텝을 max_parallelism개까지 동시에 실행.
+
+        중단 조건(stop 정책 실패/상한 초과)이 생기면 실행 중인 스텝을 취소하고
+        더 이상 스텝을 시작하지 않는다.
+        """
+        steps = manifest.spec.steps
+        in_degree, successors = self._build_dag(steps)
+        slots = asyncio.Semaphore(manifest.spec.max_parallelism)
+
+        async def run_node(i: int) -> None:
+            async with slots:
+                step_result = await self._execute_step(
+                    steps[i], wf_result, session_id, manifest,
+                )
+            if self._record_step(steps[i], step_result, manifest, wf_result, deadline):
+                raise _StopSiblingsError(step_result)
+            for j in successors[i]:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    tg.create_task(run_node(j))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for i, degree in enumerate(in_degree):
+                    if degree == 0:
+                        tg.create_task(run_node(i))
+        except ExceptionGroup as eg:
+            _, unexpected = eg.split(_StopSiblingsError)
+            if unexpected is not None:
+                # 순차 실행과 같은 에러 메시지가 되도록 그룹이 아닌 원래 예외를 올린다
+                raise _first_leaf(unexpected) from None
+            aac_log("Workflow", session_id, "run", f"✗ {wf_result.error} — 실행 중 스텝 취소")
+
+    @staticmethod
+    def _build_dag(steps: list[WorkflowStep]) -> tuple[list[int], list[list[int]]]:
+        """최상위 스텝 의존 그래프 — (진입 차수, 후속 스텝 목록), 스텝 인덱스 기준.
+
+        의존 관계:
+        - input_from이 가리키는 스텝
+        - condition/prompt에 등장하는 `steps.<name>` 참조
+        - 자신을 if_true/if_false 대상으로 갖는 condition 스텝 (분기가 먼저 평가되도록)
+
+        앞에 선언된 스텝만 의존 대상으로 보므로 항상 비순환이다.
+        """
+        branch_owners: dict[str, list[str]] = {}
+        for step in steps:
+            if step.type == StepType.CONDITION:
+                for target in (step.if_true, step.if_false):
+                    if target:
+                        branch_owners.setdefault(target, []).append(step.name)
+
+        in_degree = [0] * len(steps)
+        successors: list[list[int]] = [[] for _ in steps]
+        seen: dict[str, int] = {}  # 이름 → 가장 최근에 선언된 인덱스
+        for i, step in enumerate(steps):
+            refs: set[str] = set(branch_owners.get(step.name, ()))
+            if step.input_from:
+                refs.add(step.input_from)
+            for text in (step.condition, step.prompt):
+                if text:
+                    refs.update(_STEP_REF.findall(text))
+            deps = {seen[name] for name in refs if name in seen}
+            for dep in deps:
+                successors[dep].append(i)
+            in_degree[i] = len(deps)
+            seen[step.name] = i
+        return in_degree, successors
+
     async def _execute_step(
         self,
         step: WorkflowStep,
@@ -207,6 +339,20 @@ class WorkflowEngine:
         if not prompt:
             return StepResult(name=step.name, error="prompt 미지정")
 
+        cache_key: str | None = None
+        if step.cache:
+            cache_key = hashlib.blake2b(
+                f"{step.agent}\x00{prompt}".encode(), digest_size=16,
+            ).hexdigest()
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                aac_log("Workflow", session_id, step.name, f"⚡ Cache hit: {step.agent}")
+                return replace(
+                    cached, name=step.name, cost_usd=0.0, duration_ms=0, retries=0, cached=True,
+                )
+            aac_log("Workflow", session_id, step.name, f"Cache miss: {step.agent}")
+
         aac_log("Workflow", session_id, step.name, f"▶ Agent: {step.agent}")
 
         retries = 0
@@ -219,7 +365,7 @@ class WorkflowEngine:
                     prompt,
                     context=wf_result.context,
                 )
-                return StepResult(
+                step_result = StepResult(
                     name=step.name,
                     agent=step.agent,
                     success=result.get("success", False),
@@ -229,6 +375,11 @@ class WorkflowEngine:
                     duration_ms=result.get("duration_ms", 0),
                     retries=retries,
                 )
+                if cache_key is not None and step_result.success:
+                    self._result_cache[cache_key] = step_result
+                    if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+                return step_result
             except Exception as e:
                 last_error = str(e)
                 retries += 1
@@ -275,13 +426,28 @@ class WorkflowEngine:
             f"▶ Parallel: {len(step.steps)} sub-steps",
         )
 
-        tasks = []
-        for sub_step in step.steps:
-            tasks.append(
-                self._execute_step(sub_step, wf_result, session_id, manifest)
-            )
-
-        sub_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # TaskGroup — on_failure=stop 하위 스텝이 실패하면 나머지 하위 스텝을 즉시 취소
+        # (실패가 확정된 뒤에도 형제 Agent가 끝까지 비용을 쓰지 않도록)
+        tasks: list[asyncio.Task[StepResult | Exception]] = []
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for sub_step in step.steps:
+                    tasks.append(tg.create_task(
+                        self._execute_sub_step(sub_step, wf_result, session_id, manifest)
+                    ))
+        except* _StopSiblingsError:
+            aac_log("Workflow", session_id, step.name, "✗ 하위 스텝 실패 — 나머지 취소")
+
+        sub_results: list[StepResult | Exception] = []
+        for sub_step, task in zip(step.steps, tasks, strict=True):
+            if task.cancelled():
+                sub_results.append(StepResult(
+                    name=sub_step.name, agent=sub_step.agent, error="취소됨 (다른 하위 스텝 실패)",
+                ))
+            elif isinstance(exc := task.exception(), _StopSiblingsError):
+                sub_results.append(exc.result)
+            else:
+                sub_results.append(task.result())
 
         # 결과 집계
         total_cost = 0.0
@@ -289,7 +455,7 @@ class WorkflowEngine:
         all_success = True
         errors: list[str] = []
 
-        for i, sub_result in enumerate(sub_results):
+        for sub_result in sub_results:
             if isinstance(sub_result, Exception):
                 all_success = False
                 errors.append(str(sub_result))
@@ -317,6 +483,22 @@ class WorkflowEngine:
             error="; ".join(errors) if errors else None,
         )
 
+    async def _execute_sub_step(
+        self,
+        step: WorkflowStep,
+        wf_result: WorkflowResult,
+        session_id: str,
+        manifest: WorkflowManifest,
+    ) -> StepResult | Exception:
+        """병렬 하위 스텝 실행 — 예외는 결과로 돌려주고, stop 정책 실패만 형제 취소로 올린다."""
+        try:
+            result = await self._execute_step(step, wf_result, session_id, manifest)
+        except Exception as e:
+            return e
+        if not result.success and not result.skipped and step.on_failure == OnFailure.STOP:
+            raise _StopSiblingsError(result)
+        return result
+
     async def _execute_condition_step(
         self,
         step: WorkflowStep,
@@ -346,7 +528,7 @@ class WorkflowEngine:
             )
 
         # target 스텝을 manifest에서 찾아 실행
-        target_step = self._find_step(target, manifest.spec.steps)
+        target_step = self._step_index(manifest).get(target)
         if not target_step:
             return StepResult(
                 name=step.name,
@@ -366,19 +548,48 @@ class WorkflowEngine:
         if not prompt:
             return None
 
+        # placeholder 유무는 조각별로 확인 — 이어붙인 긴 프롬프트를 다시 훑지 않는다
+        has_template = "{{" in prompt
+
         # input_from: 이전 스텝 결과를 프롬프트에 추가
         if step.input_from:
             prev = wf_result.context.get(f"steps.{step.input_from}", {})
             prev_result = prev.get("result", "")
             if prev_result:
                 prompt = f"{prompt}\n\n이전 작업 결과:\n{prev_result}"
+                has_template = has_template or "{{" in str(prev_result)
+
+        # 템플릿 변수 치환 ({{key}} → value) — 프롬프트를 한 번만 훑는다
+        if not has_template:
+            return prompt
+        context = wf_result.context
+
+        def substitute(match: re.Match[str]) -> str:
+            value = self._lookup_context(context, match.group(1))
+            # 문자열 값만 치환, 나머지는 placeholder 그대로
+            return value if isinstance(value, str) else match.group(0)
 
-        # 간단한 템플릿 변수 치환 ({{key}} → value)
-        for key, value in wf_result.context.items():
-            if isinstance(value, str):
-                prompt = prompt.replace(f"{{{{{key}}}}}", value)
+        return _TEMPLATE_VAR.sub(substitute, prompt)
 
-        return prompt
+    @staticmethod
+    def _lookup_context(context: dict[str, Any], path: str) -> Any:
+        """템플릿 경로 조회 — 키 그대로 먼저, 없으면 "steps.<name>" 같은 점 포함 키 + 하위 필드.
+
+        예: "steps.step1.result" → context["steps.step1"]["result"]
+        """
+        if path in context:
+            return context[path]
+        parts = path.split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            base = ".".join(parts[:i])
+            if base in context:
+                current: Any = context[base]
+                for part in parts[i:]:
+                    if not isinstance(current, dict):
+                        return None
+                    current = current.get(part)
+                return current
+        return None
 
     def _evaluate_condition(
         self, condition: str, context: dict[str, Any],
@@ -404,34 +615,43 @@ class WorkflowEngine:
 
         return bool(current)
 
-    def _find_step(
-        self, name: str, steps: list[WorkflowStep],
-    ) -> WorkflowStep | None:
-        """이름으로 스텝 검색 (중첩 포함)."""
+    def _step_index(self, manifest: WorkflowManifest) -> dict[str, WorkflowStep]:
+        """manifest의 스텝 이름 → 스텝 색인 (중첩 포함) — manifest마다 한 번만 구성."""
+        key = id(manifest)
+        cached = self._step_indexes.get(key)
+        if cached is not None and cached[0] is manifest:
+            self._step_indexes.move_to_end(key)
+            return cached[1]
+
+        index = self._index_steps(manifest.spec.steps)
+        self._step_indexes[key] = (manifest, index)
+        if len(self._step_indexes) > _STEP_INDEX_CACHE_SIZE:
+            self._step_indexes.popitem(last=False)
+        return index
+
+    @staticmethod
+    def _index_steps(
+        steps: list[WorkflowStep], index: dict[str, WorkflowStep] | None = None,
+    ) -> dict[str, WorkflowStep]:
+        """스텝 트리를 이름 색인으로 평탄화 — 같은 이름은 먼저 나온 스텝(전위 순회)이 우선."""
+        if index is None:
+            index = {}
         for step in steps:
-            if step.name == name:
-                return step
+            index.setdefault(step.name, step)
             if step.steps:
-                found = self._find_step(name, step.steps)
-                if found:
-                    return found
-        return None
+                WorkflowEngine._index_steps(step.steps, index)
+        return index
 
     def _check_limits(
         self,
         manifest: WorkflowManifest,
         wf_result: WorkflowResult,
+        deadline: float | None,
     ) -> bool:
-        """비용/시간 상한 초과 여부."""
+        """비용/시간 상한 초과 여부 (deadline은 time.monotonic 기준)."""
         if (
             manifest.spec.max_total_cost_usd
             and wf_result.total_cost_usd > manifest.spec.max_total_cost_usd
         ):
             return True
-        if (
-            manifest.spec.max_total_duration_seconds
-            and wf_result.total_duration_ms
-            > manifest.spec.max_total_duration_seconds * 1000
-        ):
-            return True
-        return False
+        return deadline is not None and time.monotonic() > deadline
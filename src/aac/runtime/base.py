@@ -7,6 +7,7 @@ Spring의 DataSource에 해당하는 개념으로,
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -112,6 +113,44 @@ class AgentRuntime(ABC):
         yield StreamChunk(type="text", content=result.response)
         yield StreamChunk(type="done")
 
+    async def execute_batch(
+        self,
+        prompts: list[str],
+        *,
+        max_concurrency: int = 4,
+        system_prompt: str = "",
+        tools: list[dict[str, Any]] | None = None,
+        context: dict[str, Any] | None = None,
+        max_turns: int = 30,
+        timeout_seconds: int = 600,
+    ) -> list[ExecutionResult]:
+        """여러 프롬프트 동시 실행 — 최대 max_concurrency개씩, 결과는 입력 순서.
+
+        기본 구현은 execute를 Semaphore로 제한해 병렬 호출한다.
+        execute가 예외를 던지면 TaskGroup이 나머지 실행을 취소한다.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency는 1 이상이어야 합니다: {max_concurrency}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results: list[ExecutionResult] = [ExecutionResult() for _ in prompts]
+
+        async def run_one(index: int, prompt: str) -> None:
+            async with semaphore:
+                results[index] = await self.execute(
+                    prompt,
+                    system_prompt=system_prompt,
+                    tools=tools,
+                    context=context,
+                    max_turns=max_turns,
+                    timeout_seconds=timeout_seconds,
+                )
+
+        async with asyncio.TaskGroup() as tg:
+            for index, prompt in enumerate(prompts):
+                tg.create_task(run_one(index, prompt))
+        return results
+
     async def cancel(self) -> None:
         """실행 취소 — 기본 구현은 no-op."""
 
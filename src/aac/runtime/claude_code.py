@@ -20,6 +20,13 @@ from aac.runtime.base import AgentRuntime, ExecutionResult, RuntimeStatus, Strea
 
 logger = structlog.get_logger()
 
+# stream-json 한 줄의 최대 크기 — tool 결과가 큰 줄도 StreamReader 기본 한도(64KiB)에 걸리지 않도록
+_STREAM_LINE_LIMIT = 16 * 1024 * 1024
+# 에러 메시지에 붙일 stderr 최대 크기 (나머지는 읽어서 버림)
+_STDERR_KEEP_BYTES = 64 * 1024
+# kill 이후 stderr EOF 대기 상한 — 손자 프로세스가 파이프를 쥐고 있어도 stream이 끝나도록
+_STDERR_GRACE_SECONDS = 1.0
+
 
 class ClaudeCodeRuntime(AgentRuntime):
     """Claude Code CLI를 통한 Agent 실행."""
@@ -33,6 +40,11 @@ class ClaudeCodeRuntime(AgentRuntime):
     async def initialize(self, config: dict[str, Any]) -> None:
         self._config = config
         self._model = config.get("model", self._DEFAULT_MODEL)
+        # model은 initialize 이후 고정 — 호출마다 바뀌지 않는 인자는 미리 조립해 둔다
+        self._cmd_prefix = ("claude", "--model", self._model, "--output-format", "json")
+        self._stream_cmd_prefix = (
+            "claude", "--model", self._model, "--output-format", "stream-json",
+        )
         self._cumulative_cost = 0.0
         self._status = RuntimeStatus.READY
         logger.info("claude_code_initialized", model=self._model)
@@ -81,7 +93,6 @@ class ClaudeCodeRuntime(AgentRuntime):
                 )
 
             duration = int((time.monotonic() - start) * 1000)
-            output = stdout.decode("utf-8", errors="replace")
 
             if proc.returncode != 0:
                 error_msg = stderr.decode("utf-8", errors="replace")
@@ -92,7 +103,8 @@ class ClaudeCodeRuntime(AgentRuntime):
                     model=self._model,
                 )
 
-            result = self._parse_output(output, duration)
+            # bytes를 그대로 넘겨 json.loads가 직접 디코딩 (전체 출력 str 사본을 만들지 않음)
+            result = self._parse_output(stdout, duration)
             self._cumulative_cost += result.cost_usd
             self._status = RuntimeStatus.READY
             return result
@@ -117,26 +129,20 @@ class ClaudeCodeRuntime(AgentRuntime):
         max_turns: int,
     ) -> list[str]:
         """Claude Code CLI 명령어 조립."""
-        cmd = [
-            "claude",
-            "-p", prompt,
-            "--model", self._model,
-            "--max-turns", str(max_turns),
-            "--output-format", "json",
-        ]
-        if system_prompt:
-            cmd.extend(["--system-prompt", system_prompt])
         # allowedTools는 추후 Phase 2에서 tools 파라미터 기반으로 구현
-        return cmd
+        return _with_call_args(self._cmd_prefix, prompt, system_prompt, max_turns)
+
+    def _parse_output(self, output: bytes | str, duration_ms: int) -> ExecutionResult:
+        """Claude Code JSON 출력 파싱.
 
-    def _parse_output(self, output: str, duration_ms: int) -> ExecutionResult:
-        """Claude Code JSON 출력 파싱."""
+        output은 stdout bytes 그대로 받는다 — 원본 텍스트는 폴백 응답이 필요할 때만 디코딩.
+        """
         try:
             data = json.loads(output)
             # Claude Code JSON 출력 형식 파싱
             if isinstance(data, dict):
                 return ExecutionResult(
-                    response=data.get("result", output),
+                    response=data["result"] if "result" in data else _as_text(output),
                     cost_usd=data.get("cost_usd", 0.0),
                     duration_ms=duration_ms,
                     model=self._model,
@@ -146,26 +152,32 @@ class ClaudeCodeRuntime(AgentRuntime):
                 )
             # 리스트 형식 (대화 블록)
             if isinstance(data, list):
+                # 꼬리부터 훑어 첫 result/text 블록에서 멈춘다 (보통 마지막 원소에서 끝남).
+                # json.loads는 정확히 dict만 만들므로 type 비교로 충분하고, "type"은 한 번만 조회
                 last_text = ""
                 for block in reversed(data):
-                    if isinstance(block, dict) and block.get("type") == "result":
+                    if type(block) is not dict:
+                        continue
+                    block_type = block.get("type")
+                    if block_type == "result":
                         last_text = block.get("result", "")
                         break
-                    if isinstance(block, dict) and block.get("type") == "text":
+                    if block_type == "text":
                         last_text = block.get("text", "")
                         break
                 return ExecutionResult(
-                    response=last_text or output,
+                    response=last_text or _as_text(output),
                     duration_ms=duration_ms,
                     model=self._model,
                     metadata={"blocks": data},
                 )
-        except json.JSONDecodeError:
+        except ValueError:
+            # JSONDecodeError / UnicodeDecodeError (잘못된 UTF-8 bytes)
             pass
 
         # JSON 파싱 실패 시 원본 텍스트 반환
         return ExecutionResult(
-            response=output,
+            response=_as_text(output),
             duration_ms=duration_ms,
             model=self._model,
         )
@@ -180,7 +192,11 @@ class ClaudeCodeRuntime(AgentRuntime):
         max_turns: int = 30,
         timeout_seconds: int = 600,
     ) -> AsyncIterator[StreamChunk]:
-        """Claude Code --output-format stream-json 으로 스트리밍 실행."""
+        """Claude Code --output-format stream-json 으로 스트리밍 실행.
+
+        stdout은 줄 단위로 읽어 즉시 chunk로 내보내고, stderr는 별도 태스크가 계속 비워
+        파이프가 가득 차 subprocess가 멈추지 않게 한다. timeout_seconds를 넘기면 kill.
+        """
         self._status = RuntimeStatus.BUSY
 
         try:
@@ -191,12 +207,37 @@ class ClaudeCodeRuntime(AgentRuntime):
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                limit=_STREAM_LINE_LIMIT,
             )
+            assert proc.stderr is not None
+            stderr_task = asyncio.create_task(_drain_stderr(proc.stderr))
+            deadline = time.monotonic() + timeout_seconds
 
-            async for chunk in self._parse_stream(proc):
-                yield chunk
-
-            await proc.wait()
+            try:
+                async for chunk in self._parse_stream(proc, deadline=deadline):
+                    yield chunk
+                # stdout EOF 이후에도 종료 대기는 deadline까지만 (timeout이면 즉시 finally로)
+                await asyncio.wait_for(
+                    proc.wait(), timeout=max(deadline - time.monotonic(), 0),
+                )
+            except TimeoutError:
+                pass
+            finally:
+                # 소비자가 중간에 멈추거나 timeout이면 subprocess를 남기지 않는다
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                try:
+                    stderr = await asyncio.wait_for(stderr_task, _STDERR_GRACE_SECONDS)
+                except TimeoutError:
+                    stderr = b""
+
+            if proc.returncode:
+                logger.warning(
+                    "claude_code_stream_exit",
+                    returncode=proc.returncode,
+                    stderr=stderr.decode("utf-8", errors="replace")[:500],
+                )
             self._status = RuntimeStatus.READY
 
         except FileNotFoundError:
@@ -215,25 +256,35 @@ class ClaudeCodeRuntime(AgentRuntime):
         max_turns: int,
     ) -> list[str]:
         """스트리밍용 Claude Code CLI 명령어 조립."""
-        cmd = [
-            "claude",
-            "-p", prompt,
-            "--model", self._model,
-            "--max-turns", str(max_turns),
-            "--output-format", "stream-json",
-        ]
-        if system_prompt:
-            cmd.extend(["--system-prompt", system_prompt])
-        return cmd
+        return _with_call_args(self._stream_cmd_prefix, prompt, system_prompt, max_turns)
 
     async def _parse_stream(
         self,
         proc: asyncio.subprocess.Process,
+        *,
+        deadline: float | None = None,
     ) -> AsyncIterator[StreamChunk]:
-        """stream-json 형식 파싱 — 줄 단위로 JSON 객체 수신."""
+        """stream-json 형식 파싱 — 줄 단위로 JSON 객체 수신.
+
+        deadline(time.monotonic 기준)을 넘기면 에러 + done chunk를 내고 종료한다.
+        """
         assert proc.stdout is not None
 
-        async for line_bytes in proc.stdout:
+        while True:
+            try:
+                if deadline is None:
+                    line_bytes = await proc.stdout.readline()
+                else:
+                    line_bytes = await asyncio.wait_for(
+                        proc.stdout.readline(), timeout=max(deadline - time.monotonic(), 0),
+                    )
+            except TimeoutError:
+                yield StreamChunk(type="error", content="실행 시간 초과")
+                yield StreamChunk(type="done")
+                return
+            if not line_bytes:
+                break
+
             line = line_bytes.decode("utf-8", errors="replace").strip()
             if not line:
                 continue
@@ -295,3 +346,33 @@ class ClaudeCodeRuntime(AgentRuntime):
     async def shutdown(self) -> None:
         self._status = RuntimeStatus.SHUTDOWN
         logger.info("claude_code_shutdown")
+
+
+def _with_call_args(
+    prefix: tuple[str, ...],
+    prompt: str,
+    system_prompt: str,
+    max_turns: int,
+) -> list[str]:
+    """고정 prefix 뒤에 호출별 인자(prompt, max_turns, system_prompt)를 붙인다."""
+    if system_prompt:
+        return [
+            *prefix, "-p", prompt, "--max-turns", str(max_turns),
+            "--system-prompt", system_prompt,
+        ]
+    return [*prefix, "-p", prompt, "--max-turns", str(max_turns)]
+
+
+def _as_text(output: bytes | str) -> str:
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output
+
+
+async def _drain_stderr(stream: asyncio.StreamReader) -> bytes:
+    """stderr를 끝까지 읽고 앞부분(_STDERR_KEEP_BYTES)만 돌려준다."""
+    kept = bytearray()
+    while chunk := await stream.read(65536):
+        if len(kept) < _STDERR_KEEP_BYTES:
+            kept += chunk[: _STDERR_KEEP_BYTES - len(kept)]
+    return bytes(kept)
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 
 import structlog
 
+from aac.logging.formatter import format_available
+
 logger = structlog.get_logger()
 
 
@@ -83,7 +85,7 @@ class RuntimeRegistry:
     def get(self, name: str) -> type[AgentRuntime]:
         """이름으로 Runtime 클래스 조회."""
         if name not in self._registry:
-            available = list(self._registry.keys())
+            available = format_available(self._registry.keys())
             raise KeyError(
                 f"Runtime '{name}' 미등록. 사용 가능: {available}"
             )
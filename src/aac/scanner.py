@@ -11,11 +11,14 @@ YAML 파일을 파싱하고 Pydantic 모델로 검증한다.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
-import yaml
 import structlog
+import yaml
 from pydantic import ValidationError
 
 from aac.models.manifest import (
@@ -29,6 +32,14 @@ from aac.models.manifest import (
 
 logger = structlog.get_logger()
 
+# libyaml(C) 로더 우선 — 순수 Python SafeLoader 대비 수 배 빠름
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover — libyaml 없이 빌드된 PyYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+LIBYAML_AVAILABLE: bool = _YamlLoader is not yaml.SafeLoader
+
 
 @dataclass
 class ScanResult:
@@ -55,6 +66,7 @@ class ScanError:
     error_type: str
     message: str
     field: str | None = None
+    kind: str | None = None  # 리소스 종류 (ResourceKind 값) — CLI 집계용
 
 
 class AgentScanner:
@@ -67,81 +79,100 @@ class AgentScanner:
         "skills": "skill.yaml",
     }
 
-    def __init__(self, base_dir: str | Path) -> None:
+    # 파일 수가 이보다 적으면 스레드 풀 없이 순차 로드 (풀 생성 비용이 더 큼)
+    _PARALLEL_THRESHOLD = 8
+
+    def __init__(self, base_dir: str | Path, max_workers: int | None = None) -> None:
         self._base_dir = Path(base_dir)
+        self._max_workers = max_workers or min(8, os.cpu_count() or 1)
 
     def scan_all(self) -> ScanResult:
-        """resources/ 전체 스캔 → ScanResult."""
+        """resources/ 전체 스캔 → ScanResult.
+
+        대상 파일을 먼저 모은 뒤 YAML 로드(I/O + 파싱)는 스레드 풀로 병렬 수행하고,
+        Pydantic 검증과 결과 누적은 아래 순서대로 순차 수행한다.
+        """
         result = ScanResult()
+        jobs: list[tuple[Path, type, list]] = []
 
         # runtimes (가장 먼저 스캔 — runtime 등록이 선행되어야 함)
         runtimes_dir = self._base_dir / "runtimes"
         if runtimes_dir.exists():
             for yaml_file in sorted(runtimes_dir.glob("*.yaml")):
-                parsed = self._parse_yaml(yaml_file, RuntimeManifest, result)
-                if parsed:
-                    result.runtimes.append(parsed)
+                jobs.append((yaml_file, RuntimeManifest, result.runtimes))
 
         # tools (agent의 tool ref 해석에 필요)
         tools_dir = self._base_dir / "tools"
         if tools_dir.exists():
-            for manifest in self._scan_directory(tools_dir, "tool.yaml", ToolManifest, result):
-                result.tools.append(manifest)
+            for yaml_file in self._scan_directory(tools_dir, "tool.yaml"):
+                jobs.append((yaml_file, ToolManifest, result.tools))
 
         # skills
         skills_dir = self._base_dir / "skills"
         if skills_dir.exists():
-            for manifest in self._scan_directory(skills_dir, "skill.yaml", SkillManifest, result):
-                result.skills.append(manifest)
+            for yaml_file in self._scan_directory(skills_dir, "skill.yaml"):
+                jobs.append((yaml_file, SkillManifest, result.skills))
 
         # aspects (파일 패턴이 다름 — 디렉토리가 아닌 직접 yaml)
         aspects_dir = self._base_dir / "aspects"
         if aspects_dir.exists():
             for yaml_file in sorted(aspects_dir.glob("*.yaml")):
-                parsed = self._parse_yaml(yaml_file, AspectManifest, result)
-                if parsed:
-                    result.aspects.append(parsed)
+                jobs.append((yaml_file, AspectManifest, result.aspects))
 
         # agents (마지막 — 의존성 해석 준비용)
         agents_dir = self._base_dir / "agents"
         if agents_dir.exists():
-            for manifest in self._scan_directory(agents_dir, "agent.yaml", AgentManifest, result):
-                result.agents.append(manifest)
+            for yaml_file in self._scan_directory(agents_dir, "agent.yaml"):
+                jobs.append((yaml_file, AgentManifest, result.agents))
+
+        loaded = self._load_all([yaml_file for yaml_file, _, _ in jobs])
+        for (yaml_file, model_cls, target), raw in zip(jobs, loaded, strict=True):
+            parsed = self._parse_yaml(yaml_file, raw, model_cls, result)
+            if parsed:
+                target.append(parsed)
 
         return result
 
-    def _scan_directory(
-        self,
-        parent_dir: Path,
-        filename: str,
-        model_cls: type,
-        result: ScanResult,
-    ) -> list:
-        """parent_dir 하위 디렉토리를 순회하며 filename을 파싱."""
-        manifests = []
+    def _scan_directory(self, parent_dir: Path, filename: str) -> list[Path]:
+        """parent_dir 하위 디렉토리를 순회하며 filename 경로를 수집."""
+        files = []
         for subdir in sorted(parent_dir.iterdir()):
             if not subdir.is_dir():
                 continue
             yaml_file = subdir / filename
             if yaml_file.exists():
-                parsed = self._parse_yaml(yaml_file, model_cls, result)
-                if parsed:
-                    manifests.append(parsed)
-        return manifests
+                files.append(yaml_file)
+        return files
+
+    def _load_all(self, files: list[Path]) -> list[Any]:
+        """YAML 파일들을 로드 — 결과 순서는 입력 순서와 같다.
+
+        실패한 파일은 예외 객체를 그 자리에 담아 _parse_yaml에서 ScanError로 변환한다.
+        """
+        if len(files) < self._PARALLEL_THRESHOLD or self._max_workers <= 1:
+            return [_load_yaml(f) for f in files]
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="aac-scan"
+        ) as pool:
+            return list(pool.map(_load_yaml, files))
 
     def _parse_yaml(
         self,
         yaml_file: Path,
+        raw: Any,
         model_cls: type,
         result: ScanResult,
     ) -> object | None:
-        """YAML 파일을 파싱하고 Pydantic 모델로 검증."""
+        """로드된 YAML 내용을 Pydantic 모델로 검증."""
         file_str = str(yaml_file)
+        expected_kind = self._expected_kind(model_cls)
         try:
-            raw = yaml.safe_load(yaml_file.read_text(encoding="utf-8"))
+            if isinstance(raw, BaseException):
+                raise raw
             if raw is None:
                 result.errors.append(ScanError(
                     file_path=file_str,
+                    kind=expected_kind,
                     error_type="EmptyFile",
                     message="YAML 파일이 비어있습니다",
                 ))
@@ -149,24 +180,26 @@ class AgentScanner:
 
             # kind 필드 검증
             kind = raw.get("kind")
-            expected_kind = self._expected_kind(model_cls)
             if kind and expected_kind and kind != expected_kind:
                 result.errors.append(ScanError(
                     file_path=file_str,
+                    kind=expected_kind,
                     error_type="KindMismatch",
                     message=f"kind '{kind}'이 예상과 다릅니다 (기대: '{expected_kind}')",
                     field="kind",
                 ))
                 return None
 
+            # manifest는 frozen — source_path도 검증 입력으로 함께 넘긴다
+            raw["source_path"] = file_str
             manifest = model_cls.model_validate(raw)
-            manifest.source_path = file_str
             logger.debug("yaml_parsed", file=file_str, kind=kind)
             return manifest
 
         except yaml.YAMLError as e:
             result.errors.append(ScanError(
                 file_path=file_str,
+                kind=expected_kind,
                 error_type="YAMLSyntax",
                 message=str(e),
             ))
@@ -174,6 +207,7 @@ class AgentScanner:
             for err in e.errors():
                 result.errors.append(ScanError(
                     file_path=file_str,
+                    kind=expected_kind,
                     error_type="ValidationError",
                     message=err["msg"],
                     field=" → ".join(str(loc) for loc in err["loc"]),
@@ -181,6 +215,7 @@ class AgentScanner:
         except Exception as e:
             result.errors.append(ScanError(
                 file_path=file_str,
+                kind=expected_kind,
                 error_type=type(e).__name__,
                 message=str(e),
             ))
@@ -189,13 +224,21 @@ class AgentScanner:
     @staticmethod
     def _expected_kind(model_cls: type) -> str | None:
         if model_cls is AgentManifest:
-            return ResourceKind.AGENT.value
+            return ResourceKind.AGENT
         if model_cls is ToolManifest:
-            return ResourceKind.TOOL.value
+            return ResourceKind.TOOL
         if model_cls is SkillManifest:
-            return ResourceKind.SKILL.value
+            return ResourceKind.SKILL
         if model_cls is AspectManifest:
-            return ResourceKind.ASPECT.value
+            return ResourceKind.ASPECT
         if model_cls is RuntimeManifest:
-            return ResourceKind.RUNTIME.value
+            return ResourceKind.RUNTIME
         return None
+
+
+def _load_yaml(yaml_file: Path) -> Any:
+    """파일 읽기 + YAML 로드 (safe). 예외는 raise하지 않고 반환한다 (스레드 풀 작업용)."""
+    try:
+        return yaml.load(yaml_file.read_text(encoding="utf-8"), Loader=_YamlLoader)
+    except Exception as e:
+        return e
@@ -13,9 +13,11 @@ from typing import Any
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
+from aac.aspects.ws_publisher import WebSocketPublisherHandler
 from aac.context import AgentApplicationContext
 from aac.logging.formatter import boot_log
 
@@ -74,12 +76,17 @@ class ConnectionManager:
     def disconnect(self, ws: WebSocket) -> None:
         self._connections.remove(ws)
 
-    async def broadcast(self, data: dict[str, Any]) -> None:
-        """모든 연결에 이벤트 전송."""
+    async def broadcast(self, data: dict[str, Any] | str) -> None:
+        """모든 연결에 이벤트 전송.
+
+        JSON 직렬화는 클라이언트 수와 무관하게 1회만 수행한다.
+        이미 직렬화된 JSON 문자열을 받으면 그대로 전송한다.
+        """
+        text = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
         dead: list[WebSocket] = []
         for ws in self._connections:
             try:
-                await ws.send_json(data)
+                await ws.send_text(text)
             except Exception:
                 dead.append(ws)
         for ws in dead:
@@ -122,6 +129,13 @@ def create_app(ctx: AgentApplicationContext) -> FastAPI:
     global _ctx
     _ctx = ctx
 
+    # WebSocketPublisher aspect에 broadcast 주입 — 연결된 클라이언트가 없으면 이벤트 생성 생략
+    manager = get_ws_manager()
+    for publisher in ctx.aspect_engine.handlers_of(WebSocketPublisherHandler):
+        publisher.set_broadcast(
+            manager.broadcast, client_count_fn=lambda: manager.connection_count,
+        )
+
     app = FastAPI(
         title="Agent Application Context",
         version="0.1.0",
@@ -192,7 +206,8 @@ def create_app(ctx: AgentApplicationContext) -> FastAPI:
             result = await context.execute(
                 name, request.prompt, context=request.context,
             )
-            return result
+            # 필드가 모두 JSON 기본 타입이므로 jsonable_encoder 순회 없이 바로 직렬화
+            return JSONResponse(result.to_dict())
 
         except KeyError as e:
             raise HTTPException(status_code=404, detail=str(e))
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
+from aac.logging.formatter import flush_logs
 from tests.helpers import (
     SAMPLE_AGENT_YAML,
     SAMPLE_ASPECT_YAML,
@@ -15,6 +17,13 @@ from tests.helpers import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _flush_aac_logs() -> Iterator[None]:
+    """테스트가 남긴 aac_log 출력을 teardown 안에서 write — 해당 테스트의 캡처에 포함되도록."""
+    yield
+    flush_logs()
+
+
 @pytest.fixture
 def resources_dir(tmp_path: Path) -> Path:
     """완전한 샘플 리소스 디렉토리 생성."""
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import sqlite3
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
 from aac.aspects.audit_logging import AuditLoggingHandler
 from aac.aspects.engine import (
+    PROMPT_SUMMARY_LENGTH,
     AspectContext,
     AspectEngine,
     AspectEventType,
@@ -16,6 +18,7 @@ from aac.aspects.engine import (
 )
 from aac.aspects.execution_logging import ExecutionLoggingHandler
 from aac.aspects.tool_tracking import ToolTrackingHandler
+from aac.logging.formatter import aac_log, flush_logs, set_console_logging
 from aac.models.manifest import (
     AspectManifest,
     AspectMetadata,
@@ -154,6 +157,27 @@ class TestAspectEngine:
 
         assert len(calls) == 2
 
+    async def test_wildcard와_이벤트_handler_order_유지(self) -> None:
+        """events가 빈 handler와 지정 handler가 섞여도 order 순으로 실행되어야 한다."""
+        engine = AspectEngine()
+        calls: list[str] = []
+
+        class TrackingHandler(AspectHandler):
+            async def handle(self, event_type: str, ctx: AspectContext) -> None:
+                calls.append(self.name)
+
+        engine.register_handler_type("Tracking", TrackingHandler)
+        engine.register(_make_aspect_manifest("late", aspect_type="Tracking", order=30))
+        engine.register(
+            _make_aspect_manifest("pre", aspect_type="Tracking", order=20, events=["PreQuery"])
+        )
+        engine.register(_make_aspect_manifest("early", aspect_type="Tracking", order=10))
+
+        await engine.apply(AspectEventType.PRE_QUERY, _make_ctx())
+        await engine.apply(AspectEventType.ON_ERROR, _make_ctx())
+
+        assert calls == ["early", "pre", "late", "early", "late"]
+
     async def test_handler_에러_격리(self) -> None:
         """handler 에러가 다른 handler 실행을 막지 않아야 한다."""
         engine = AspectEngine()
@@ -177,6 +201,24 @@ class TestAspectEngine:
         assert calls == ["ok"]
 
 
+class TestAspectContext:
+    """AspectContext — prompt 요약 캐시."""
+
+    def test_prompt_summary_1회_계산(self) -> None:
+        ctx = _make_ctx(prompt="x" * (PROMPT_SUMMARY_LENGTH * 4))
+        assert ctx.prompt_summary == "x" * PROMPT_SUMMARY_LENGTH
+
+    def test_짧은_prompt는_그대로(self) -> None:
+        assert _make_ctx(prompt="짧은 프롬프트").prompt_summary == "짧은 프롬프트"
+
+    def test_metadata_지연_생성(self) -> None:
+        ctx = _make_ctx()
+        assert ctx._metadata is None
+
+        ctx.metadata["key"] = "value"
+        assert ctx.metadata == {"key": "value"}
+
+
 # ─── AuditLoggingHandler ─────────────────────────────
 
 
@@ -197,6 +239,7 @@ class TestAuditLoggingHandler:
         await handler.handle(AspectEventType.PRE_QUERY, ctx)
 
         # DB 직접 검증
+        await handler.flush()
         conn = sqlite3.connect(db_path)
         rows = conn.execute("SELECT * FROM executions").fetchall()
         conn.close()
@@ -230,6 +273,7 @@ class TestAuditLoggingHandler:
         ctx.model = "test-model"
         await handler.handle(AspectEventType.POST_QUERY, ctx)
 
+        await handler.flush()
         conn = sqlite3.connect(db_path)
         row = conn.execute("SELECT status, cost_usd, duration_ms FROM executions").fetchone()
         conn.close()
@@ -254,6 +298,7 @@ class TestAuditLoggingHandler:
         ctx.error = "실행 실패"
         await handler.handle(AspectEventType.ON_ERROR, ctx)
 
+        await handler.flush()
         conn = sqlite3.connect(db_path)
         row = conn.execute("SELECT status, error FROM executions").fetchone()
         conn.close()
@@ -262,6 +307,86 @@ class TestAuditLoggingHandler:
         assert row[0] == "error"
         assert row[1] == "실행 실패"
 
+    async def test_created_at_ISO_형식(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "audit.db")
+        manifest = _make_aspect_manifest(
+            "audit",
+            aspect_type="AuditLoggingAspect",
+            config={"db_path": db_path},
+        )
+        handler = AuditLoggingHandler(manifest)
+
+        before = datetime.now(UTC)
+        await handler.handle(AspectEventType.PRE_QUERY, _make_ctx())
+        await handler.flush()
+        conn = sqlite3.connect(db_path)
+        created_at = conn.execute("SELECT created_at FROM executions").fetchone()[0]
+        conn.close()
+        handler.close()
+
+        parsed = datetime.fromisoformat(created_at)
+        assert parsed.tzinfo is not None
+        assert abs((parsed - before).total_seconds()) < 5
+
+    async def test_open_reader_조회_전용(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "audit.db")
+        manifest = _make_aspect_manifest(
+            "audit",
+            aspect_type="AuditLoggingAspect",
+            config={"db_path": db_path},
+        )
+        handler = AuditLoggingHandler(manifest)
+        await handler.handle(AspectEventType.PRE_QUERY, _make_ctx())
+        await handler.flush()
+
+        reader = handler.open_reader()
+        try:
+            assert reader.execute("SELECT COUNT(*) FROM executions").fetchone()[0] == 1
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM executions")
+        finally:
+            reader.close()
+            handler.close()
+
+    async def test_close_시_미기록_행_기록(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "audit.db")
+        manifest = _make_aspect_manifest(
+            "audit",
+            aspect_type="AuditLoggingAspect",
+            config={"db_path": db_path, "flush_interval_ms": 10_000},
+        )
+        handler = AuditLoggingHandler(manifest)
+
+        for i in range(3):
+            await handler.handle(AspectEventType.PRE_QUERY, _make_ctx(execution_id=f"exec_{i}"))
+        handler.close()
+
+        conn = sqlite3.connect(db_path)
+        count = conn.execute("SELECT COUNT(*) FROM executions").fetchone()[0]
+        conn.close()
+        assert count == 3
+
+    async def test_WAL_PRAGMA_적용(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "audit.db")
+        manifest = _make_aspect_manifest(
+            "audit",
+            aspect_type="AuditLoggingAspect",
+            config={"db_path": db_path, "pragmas": {"synchronous": "OFF"}},
+        )
+        handler = AuditLoggingHandler(manifest)
+
+        await handler.handle(AspectEventType.PRE_QUERY, _make_ctx())
+
+        await handler.flush()
+        conn = sqlite3.connect(db_path)
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        handler.close()
+
+        assert journal_mode == "wal"
+        assert handler._pragmas["synchronous"] == "OFF"
+        assert handler._pragmas["temp_store"] == "MEMORY"
+
 
 # ─── ToolTrackingHandler ─────────────────────────────
 
@@ -332,6 +457,7 @@ class TestExecutionLoggingHandler:
         ctx = _make_ctx()
         await handler.handle(AspectEventType.PRE_QUERY, ctx)
 
+        flush_logs()
         captured = capsys.readouterr()
         assert "[ASPECT] PreQuery" in captured.out
         assert "test-agent" in captured.out
@@ -348,6 +474,47 @@ class TestExecutionLoggingHandler:
         ctx.cost_usd = 0.01
         await handler.handle(AspectEventType.POST_QUERY, ctx)
 
+        flush_logs()
         captured = capsys.readouterr()
         assert "PostQuery" in captured.out
         assert "500ms" in captured.out
+
+    async def test_콘솔_로그_비활성화(self, capsys) -> None:
+        manifest = _make_aspect_manifest(
+            "exec-log",
+            aspect_type="ExecutionLoggingAspect",
+        )
+        handler = ExecutionLoggingHandler(manifest)
+
+        set_console_logging(False)
+        try:
+            await handler.handle(AspectEventType.POST_QUERY, _make_ctx())
+        finally:
+            set_console_logging(True)
+
+        flush_logs()
+        assert capsys.readouterr().out == ""
+
+    def test_flush_logs_순서_유지(self, capsys) -> None:
+        for i in range(100):
+            aac_log("test-agent", "s1", "tx1", "line-%d", i)
+        flush_logs()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [line.rsplit(" ", 1)[-1] for line in lines] == [f"line-{i}" for i in range(100)]
+
+    def test_호출_시점의_stdout으로_출력(self, capsys) -> None:
+        """redirect_stdout 안에서 남긴 로그는 나중에 flush돼도 그 대상에 써져야 한다."""
+        import io
+        from contextlib import redirect_stdout
+
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            aac_log("test-agent", "s1", "tx1", "inside")
+        aac_log("test-agent", "s1", "tx1", "outside")
+        flush_logs()
+
+        out = capsys.readouterr().out
+        assert buf.getvalue().rstrip().endswith("inside")
+        assert "outside" in out
+        assert "inside" not in out
@@ -26,8 +26,9 @@ from aac.models.manifest import (
     ToolRef,
     ToolSpec,
 )
+from aac.runtime.base import RuntimeStatus
 from aac.runtime.registry import RuntimeRegistry
-from tests.helpers import MockRuntime
+from tests.helpers import MockRuntime, write_yaml
 
 
 # ─── 픽스처 ──────────────────────────────────────────
@@ -73,8 +74,8 @@ def skill_registry(tmp_path: Path) -> SkillRegistry:
             instruction_file="./SKILL.md",
             required_tools=["test-tools"],
         ),
+        source_path=str(skill_dir / "skill.yaml"),
     )
-    manifest.source_path = str(skill_dir / "skill.yaml")
     registry.register(manifest)
 
     return registry
@@ -150,6 +151,8 @@ class TestCreate:
         tool_names = {t.name for t in agent.tools}
         assert "Read" in tool_names
         assert "Write" in tool_names
+        assert agent.tools_payload is not None
+        assert {t["name"] for t in agent.tools_payload} == tool_names
 
     async def test_skill_DI(self, factory: AgentFactory) -> None:
         """SkillRegistry에서 해석된 skill이 주입되어야 한다."""
@@ -185,6 +188,7 @@ class TestCreate:
         agent = await factory.create(manifest)
 
         assert agent.tools_loaded_count == 0
+        assert agent.tools_payload is None
         assert len(agent.skills) == 0
 
     async def test_미등록_runtime_에러(self, factory: AgentFactory) -> None:
@@ -221,13 +225,96 @@ class TestPromptSynthesis:
             skills=[],
         )
         manifest.spec.prompt_file = "./custom.md"
-        manifest.source_path = str(prompt_dir / "agent.yaml")
+        manifest = manifest.model_copy(update={"source_path": str(prompt_dir / "agent.yaml")})
 
         agent = await factory.create(manifest)
 
         assert "기본" in agent.system_prompt
         assert "파일 프롬프트" in agent.system_prompt
 
+    async def test_prompt_file_수정_반영(self, factory: AgentFactory, tmp_path: Path) -> None:
+        """같은 입력은 캐시된 프롬프트를 쓰고, prompt_file이 수정되면 다시 읽어야 한다."""
+        import os
+
+        prompt_dir = tmp_path / "agents" / "cached-agent"
+        prompt_dir.mkdir(parents=True)
+        prompt_path = prompt_dir / "custom.md"
+        prompt_path.write_text("# 첫 번째", encoding="utf-8")
+
+        manifest = _make_agent_manifest(name="cached-agent", system_prompt="기본", skills=[])
+        manifest.spec.prompt_file = "./custom.md"
+        manifest = manifest.model_copy(update={"source_path": str(prompt_dir / "agent.yaml")})
+
+        first = await factory.create(manifest)
+        second = await factory.create(manifest)
+        assert second.system_prompt is first.system_prompt
+
+        prompt_path.write_text("# 두 번째", encoding="utf-8")
+        stat = prompt_path.stat()
+        os.utime(prompt_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        third = await factory.create(manifest)
+        assert "두 번째" in third.system_prompt
+        assert "첫 번째" not in third.system_prompt
+
+    async def test_skill_재등록시_프롬프트_갱신(
+        self, factory: AgentFactory, skill_registry: SkillRegistry, tmp_path: Path,
+    ) -> None:
+        """같은 이름의 skill을 다른 instruction 파일로 재등록하면 새 문서가 합성되어야 한다."""
+        skill_dir = tmp_path / "skills" / "sk"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "OLD.md").write_text("OLD SKILL", encoding="utf-8")
+        (skill_dir / "NEW.md").write_text("NEW SKILL", encoding="utf-8")
+
+        def register(instruction_file: str) -> None:
+            skill_registry.register(SkillManifest(
+                metadata=SkillMetadata(name="sk"),
+                spec=SkillSpec(instruction_file=instruction_file),
+                source_path=str(skill_dir / "skill.yaml"),
+            ))
+
+        manifest = _make_agent_manifest(skills=[{"ref": "sk"}])
+        register("./OLD.md")
+        first = await factory.create(manifest)
+        register("./NEW.md")
+        second = await factory.create(manifest)
+
+        assert "OLD SKILL" in first.system_prompt
+        assert "NEW SKILL" in second.system_prompt
+        assert "OLD SKILL" not in second.system_prompt
+
+    async def test_프롬프트_캐시_상한(
+        self, factory: AgentFactory, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """합성 프롬프트 캐시는 LRU 상한을 넘지 않아야 한다."""
+        monkeypatch.setattr("aac.factory._PROMPT_CACHE_SIZE", 2)
+
+        for i in range(4):
+            manifest = _make_agent_manifest(name=f"agent-{i}", system_prompt="기본", skills=[])
+            await factory.create(manifest)
+
+        assert len(factory._prompt_cache) == 2
+        assert [key[0] for key in factory._prompt_cache] == ["agent-2", "agent-3"]
+
+    async def test_공유_prompt_file_한_번만_캐시(
+        self, factory: AgentFactory, tmp_path: Path
+    ) -> None:
+        """다른 상대 경로로 같은 prompt_file을 참조해도 캐시 항목은 하나여야 한다."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        (shared / "persona.md").write_text("# 공용 페르소나", encoding="utf-8")
+
+        for name in ("agent-a", "agent-b"):
+            agent_dir = tmp_path / "agents" / name
+            agent_dir.mkdir(parents=True)
+            manifest = _make_agent_manifest(name=name, system_prompt="기본", skills=[])
+            manifest.spec.prompt_file = "../../shared/persona.md"
+            manifest = manifest.model_copy(update={"source_path": str(agent_dir / "agent.yaml")})
+            agent = await factory.create(manifest)
+            assert "공용 페르소나" in agent.system_prompt
+
+        assert len(factory._prompt_file_cache) == 1
+
     async def test_skill_문서_순서(self, factory: AgentFactory) -> None:
         """skill 문서는 system_prompt 뒤에 구분자와 함께 합성되어야 한다."""
         manifest = _make_agent_manifest(system_prompt="메인 프롬프트")
@@ -262,3 +349,247 @@ class TestToSummary:
         assert len(detail["tools"]) == 2
         assert detail["tools"][0]["qualified_name"].startswith("test-tools/")
         assert detail["max_turns"] == 10
+
+        agent.query_count = 3
+        again = agent.to_detail()
+        assert again["tools"] == detail["tools"]
+        assert again["query_count"] == 3
+
+
+# ─── Context eager 초기화 ─────────────────────────────
+
+
+class _SlowMockRuntime(MockRuntime):
+    """initialize에 지연을 주고 동시 초기화 수를 기록하는 Mock."""
+
+    active = 0
+    peak = 0
+
+    async def initialize(self, config: dict[str, Any]) -> None:
+        import asyncio
+
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        await asyncio.sleep(0.05)
+        cls.active -= 1
+        if config.get("fail"):
+            raise RuntimeError("init 실패")
+        await super().initialize(config)
+
+
+def _write_agents(resources: Path, configs: list[dict[str, Any]]) -> None:
+    for i, runtime_config in enumerate(configs):
+        write_yaml(resources / "agents" / f"a{i}" / "agent.yaml", {
+            "apiVersion": "aac/v1",
+            "kind": "Agent",
+            "metadata": {"name": f"agent-{i}"},
+            "spec": {"runtime": "slow", "runtime_config": runtime_config},
+        })
+
+
+class TestContextEagerInit:
+    """AgentApplicationContext.start — eager agent 동시 초기화."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_counters(self) -> None:
+        _SlowMockRuntime.active = 0
+        _SlowMockRuntime.peak = 0
+
+    async def test_동시_초기화_순서_유지(self, tmp_path: Path) -> None:
+        from aac.context import AgentApplicationContext
+
+        _write_agents(tmp_path, [{}, {}, {}, {}])
+        ctx = AgentApplicationContext(resources_dir=tmp_path)
+        ctx.runtime_registry.register("slow", _SlowMockRuntime)
+        await ctx.start()
+
+        assert _SlowMockRuntime.peak == 4
+        assert list(ctx.agents) == ["agent-0", "agent-1", "agent-2", "agent-3"]
+        assert all(a.status == AgentStatus.READY for a in ctx.agents.values())
+        await ctx.shutdown()
+
+    async def test_동시성_제한(self, tmp_path: Path) -> None:
+        from aac.context import AgentApplicationContext
+
+        _write_agents(tmp_path, [{}, {}, {}, {}])
+        ctx = AgentApplicationContext(resources_dir=tmp_path, max_init_concurrency=2)
+        ctx.runtime_registry.register("slow", _SlowMockRuntime)
+        await ctx.start()
+
+        assert _SlowMockRuntime.peak == 2
+        await ctx.shutdown()
+
+    async def test_실패한_agent는_ERROR로_남고_부팅_계속(self, tmp_path: Path) -> None:
+        from aac.context import AgentApplicationContext
+
+        _write_agents(tmp_path, [{}, {"fail": True}])
+        ctx = AgentApplicationContext(resources_dir=tmp_path)
+        ctx.runtime_registry.register("slow", _SlowMockRuntime)
+        await ctx.start()
+
+        assert ctx.is_started
+        assert ctx.agents["agent-0"].status == AgentStatus.READY
+        assert ctx.agents["agent-1"].status == AgentStatus.ERROR
+        await ctx.shutdown()
+
+    async def test_strict_모드는_실패_시_기동_중단(self, tmp_path: Path) -> None:
+        from aac.context import AgentApplicationContext
+
+        _write_agents(tmp_path, [{}, {"fail": True}])
+        ctx = AgentApplicationContext(resources_dir=tmp_path, strict_tools=True)
+        ctx.runtime_registry.register("slow", _SlowMockRuntime)
+        with pytest.raises(RuntimeError, match="init 실패"):
+            await ctx.start()
+
+        # 먼저 초기화에 성공한 agent의 runtime은 종료돼 있어야 한다 (누수 방지)
+        runtime = ctx.agents["agent-0"].runtime
+        assert runtime is not None
+        assert runtime.status == RuntimeStatus.SHUTDOWN
+
+    async def test_get_status_카운터(self, tmp_path: Path) -> None:
+        """lazy 활성화/실행/종료 후에도 get_status의 active/lazy 수가 맞아야 한다."""
+        from aac.context import AgentApplicationContext
+
+        _write_agents(tmp_path, [{}, {}])
+        write_yaml(tmp_path / "agents" / "lazy" / "agent.yaml", {
+            "apiVersion": "aac/v1",
+            "kind": "Agent",
+            "metadata": {"name": "lazy-agent"},
+            "spec": {"runtime": "slow", "lazy": True},
+        })
+        ctx = AgentApplicationContext(resources_dir=tmp_path)
+        ctx.runtime_registry.register("slow", _SlowMockRuntime)
+        await ctx.start()
+
+        agents = ctx.get_status()["agents"]
+        assert (agents["total"], agents["active"], agents["lazy"]) == (3, 2, 1)
+
+        await ctx.execute("lazy-agent", "hello")
+        agents = ctx.get_status()["agents"]
+        assert (agents["total"], agents["active"], agents["lazy"]) == (3, 3, 0)
+
+        await ctx.shutdown()
+        assert ctx.get_status()["agents"]["active"] == 0
+
+
+class _SlowShutdownRuntime(MockRuntime):
+    """shutdown에 지연을 주고 동시 종료 수를 기록하는 Mock (config fail_shutdown이면 실패)."""
+
+    active = 0
+    peak = 0
+
+    async def shutdown(self) -> None:
+        import asyncio
+
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        await asyncio.sleep(0.05)
+        cls.active -= 1
+        if self._config.get("fail_shutdown"):
+            raise RuntimeError("shutdown 실패")
+        await super().shutdown()
+
+
+class TestContextShutdown:
+    """AgentApplicationContext.shutdown — runtime 동시 종료."""
+
+    async def test_동시_종료_실패는_격리(self, tmp_path: Path) -> None:
+        from aac.context import AgentApplicationContext
+
+        _SlowShutdownRuntime.active = _SlowShutdownRuntime.peak = 0
+        _write_agents(tmp_path, [{}, {"fail_shutdown": True}, {}])
+        ctx = AgentApplicationContext(resources_dir=tmp_path)
+        ctx.runtime_registry.register("slow", _SlowShutdownRuntime)
+        await ctx.start()
+
+        await ctx.shutdown()
+
+        assert _SlowShutdownRuntime.peak == 3
+        statuses = [a.status for a in ctx.agents.values()]
+        assert statuses == [AgentStatus.DESTROYED, AgentStatus.DESTROYING, AgentStatus.DESTROYED]
+        assert not ctx.is_started
+
+
+class TestContextBanner:
+    """start() 배너 — 터미널에서만 출력, AAC_QUIET=1이면 생략."""
+
+    async def _start(self, tmp_path: Path) -> str:
+        from aac.context import AgentApplicationContext
+
+        ctx = AgentApplicationContext(resources_dir=tmp_path)
+        await ctx.start()
+        await ctx.shutdown()
+        return ctx.AAC_BANNER
+
+    async def test_파이프_출력이면_생략(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("AAC_QUIET", raising=False)
+        banner = await self._start(tmp_path)
+        assert banner not in capsys.readouterr().out
+
+    async def test_터미널이면_출력_AAC_QUIET면_생략(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import sys
+
+        monkeypatch.delenv("AAC_QUIET", raising=False)
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        banner = await self._start(tmp_path)
+        assert banner in capsys.readouterr().out
+
+        monkeypatch.setenv("AAC_QUIET", "1")
+        await self._start(tmp_path)
+        assert banner not in capsys.readouterr().out
+
+
+class TestContextBootLog:
+    """start() 스캔 결과 로그 — 한 번에 출력하되 줄마다 부트 로그 prefix 유지."""
+
+    async def test_스캔_에러와_요약_줄(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        from aac.context import AgentApplicationContext
+
+        bad = tmp_path / "agents" / "bad" / "agent.yaml"
+        bad.parent.mkdir(parents=True)
+        bad.write_text("kind: [unclosed", encoding="utf-8")
+
+        ctx = AgentApplicationContext(resources_dir=tmp_path)
+        await ctx.start()
+        await ctx.shutdown()
+
+        lines = [
+            line for line in capsys.readouterr().out.splitlines()
+            if "SCAN_ERROR" in line or "Scanning resources/" in line
+        ]
+        assert len(lines) == 5
+        assert all("[AAC] [system:boot]" in line for line in lines)
+
+
+class TestQueryResult:
+    """Context.execute() 결과 — dict 호환 조회 + JSON 직렬화."""
+
+    async def test_execute_결과_dict_호환(self, tmp_path: Path) -> None:
+        import json
+
+        from aac.context import AgentApplicationContext
+        from aac.models.instance import QueryResult
+
+        _write_agents(tmp_path, [{}])
+        ctx = AgentApplicationContext(resources_dir=tmp_path)
+        ctx.runtime_registry.register("slow", _SlowMockRuntime)
+        await ctx.start()
+
+        result = await ctx.execute("agent-0", "hello")
+
+        assert isinstance(result, QueryResult)
+        assert result.get("agent") == "agent-0"
+        assert result["success"] is result.success
+        assert result.get("missing", "기본값") == "기본값"
+        with pytest.raises(KeyError):
+            result["missing"]
+        assert json.loads(json.dumps(result.to_dict()))["execution_id"] == result.execution_id
+        await ctx.shutdown()
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -317,8 +316,8 @@ class TestWebSocketPublisher:
         """PreQuery → QueryStartEvent가 broadcast되어야 한다."""
         published: list[dict] = []
 
-        async def mock_broadcast(data: dict[str, Any]) -> None:
-            published.append(data)
+        async def mock_broadcast(data: str) -> None:
+            published.append(json.loads(data))
 
         manifest = AspectManifest(
             metadata=AspectMetadata(name="ws-pub"),
@@ -339,6 +338,7 @@ class TestWebSocketPublisher:
             prompt="테스트 쿼리",
         )
         await handler.handle("PreQuery", ctx)
+        await handler.flush()
 
         assert len(published) == 1
         assert published[0]["type"] == "query_start"
@@ -347,8 +347,8 @@ class TestWebSocketPublisher:
     async def test_PostQuery_이벤트_발행(self) -> None:
         published: list[dict] = []
 
-        async def mock_broadcast(data: dict[str, Any]) -> None:
-            published.append(data)
+        async def mock_broadcast(data: str) -> None:
+            published.append(json.loads(data))
 
         manifest = AspectManifest(
             metadata=AspectMetadata(name="ws-pub"),
@@ -371,6 +371,7 @@ class TestWebSocketPublisher:
             model="test-model",
         )
         await handler.handle("PostQuery", ctx)
+        await handler.flush()
 
         assert len(published) == 1
         assert published[0]["type"] == "query_complete"
@@ -379,8 +380,8 @@ class TestWebSocketPublisher:
     async def test_ToolUse_이벤트_발행(self) -> None:
         published: list[dict] = []
 
-        async def mock_broadcast(data: dict[str, Any]) -> None:
-            published.append(data)
+        async def mock_broadcast(data: str) -> None:
+            published.append(json.loads(data))
 
         manifest = AspectManifest(
             metadata=AspectMetadata(name="ws-pub"),
@@ -400,6 +401,7 @@ class TestWebSocketPublisher:
             tool_name="Read",
         )
         await handler.handle("PreToolUse", ctx)
+        await handler.flush()
 
         assert len(published) == 1
         assert published[0]["type"] == "tool_use"
@@ -409,8 +411,8 @@ class TestWebSocketPublisher:
     async def test_OnError_이벤트_발행(self) -> None:
         published: list[dict] = []
 
-        async def mock_broadcast(data: dict[str, Any]) -> None:
-            published.append(data)
+        async def mock_broadcast(data: str) -> None:
+            published.append(json.loads(data))
 
         manifest = AspectManifest(
             metadata=AspectMetadata(name="ws-pub"),
@@ -430,6 +432,7 @@ class TestWebSocketPublisher:
             error="테스트 에러",
         )
         await handler.handle("OnError", ctx)
+        await handler.flush()
 
         assert len(published) == 1
         assert published[0]["type"] == "agent_status_change"
@@ -455,6 +458,88 @@ class TestWebSocketPublisher:
         # broadcast 미설정 — 예외 없이 통과해야 한다
         await handler.handle("PreQuery", ctx)
 
+    async def test_클라이언트_없으면_발행_생략(self) -> None:
+        """client_count_fn이 0을 반환하면 이벤트를 만들지 않아야 한다."""
+        published: list[dict] = []
+        client_count = 0
+
+        async def mock_broadcast(data: str) -> None:
+            published.append(json.loads(data))
+
+        manifest = AspectManifest(
+            metadata=AspectMetadata(name="ws-pub"),
+            spec=AspectSpec(
+                type="WebSocketPublisher",
+                order=999,
+                pointcut=AspectPointcut(events=[]),
+            ),
+        )
+        handler = WebSocketPublisherHandler(manifest)
+        handler.set_broadcast(mock_broadcast, client_count_fn=lambda: client_count)
+
+        ctx = AspectContext(
+            agent_name="test-agent",
+            session_id="sess_test",
+            tx_id="tx_001",
+        )
+        await handler.handle("PreQuery", ctx)
+        assert published == []
+
+        client_count = 1
+        await handler.handle("PreQuery", ctx)
+        await handler.flush()
+        assert len(published) == 1
+
+    async def test_create_app이_broadcast_주입(self, ctx_with_agent) -> None:
+        """서버 기동 시 WebSocketPublisherAspect에 broadcast/클라이언트 수 함수를 주입해야 한다."""
+        ctx_with_agent.aspect_engine.register(AspectManifest(
+            metadata=AspectMetadata(name="ws-pub"),
+            spec=AspectSpec(
+                type="WebSocketPublisherAspect",
+                order=999,
+                pointcut=AspectPointcut(events=[]),
+            ),
+        ))
+
+        create_app(ctx_with_agent)
+
+        [handler] = ctx_with_agent.aspect_engine.handlers_of(WebSocketPublisherHandler)
+        assert handler._broadcast_fn is not None
+        assert handler._client_count_fn is not None
+        assert handler._client_count_fn() == 0
+
+    async def test_같은_tick_이벤트_배열_프레임(self) -> None:
+        """연속 이벤트는 한 번의 broadcast로 묶여 JSON 배열로 전송되어야 한다."""
+        published: list = []
+
+        async def mock_broadcast(data: str) -> None:
+            published.append(json.loads(data))
+
+        manifest = AspectManifest(
+            metadata=AspectMetadata(name="ws-pub"),
+            spec=AspectSpec(
+                type="WebSocketPublisher",
+                order=999,
+                pointcut=AspectPointcut(events=[]),
+            ),
+        )
+        handler = WebSocketPublisherHandler(manifest)
+        handler.set_broadcast(mock_broadcast)
+
+        ctx = AspectContext(
+            agent_name="test-agent",
+            session_id="sess_test",
+            tx_id="tx_001",
+            tool_name="Read",
+        )
+        await handler.handle("PreQuery", ctx)
+        await handler.handle("PreToolUse", ctx)
+        await handler.handle("PostToolUse", ctx)
+        await asyncio.sleep(0)
+
+        assert len(published) == 1
+        assert [e["type"] for e in published[0]] == ["query_start", "tool_use", "tool_use"]
+
 
 # ─── Event Models ────────────────────────────────────
 
@@ -468,6 +553,14 @@ class TestEventModels:
         assert event.event_id.startswith("evt_")
         assert event.type == "test"
 
+    def test_timestamp_ISO_UTC(self) -> None:
+        from datetime import UTC, datetime
+
+        event = AACEvent(type="test")
+        parsed = datetime.fromisoformat(event.timestamp)
+        assert parsed.tzinfo is not None
+        assert abs((datetime.now(UTC) - parsed).total_seconds()) < 5
+
     def test_QueryStartEvent(self) -> None:
         event = QueryStartEvent(
             session_id="sess_1",
@@ -484,6 +577,12 @@ class TestEventModels:
         event = ToolUseEvent(payload={"tool": "Read"})
         assert event.type == "tool_use"
 
+    def test_하위_이벤트_type_고정(self) -> None:
+        with pytest.raises(TypeError):
+            ToolUseEvent(type="other")  # type: ignore[call-arg]
+        with pytest.raises(AttributeError):
+            ToolUseEvent().type = "other"  # type: ignore[misc]
+
     def test_AgentStatusChangeEvent(self) -> None:
         event = AgentStatusChangeEvent(payload={"status": "error"})
         assert event.type == "agent_status_change"
@@ -495,7 +594,8 @@ class TestEventModels:
             tx_id="tx_001",
             payload={"agent": "test", "prompt": "hello"},
         )
-        data = event.model_dump()
+        data = event.to_dict()
         assert isinstance(data, dict)
         assert data["type"] == "query_start"
         assert "event_id" in data
+        assert json.loads(event.to_json()) == data
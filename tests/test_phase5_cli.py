@@ -9,12 +9,14 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
 from aac.cli.main import cli
+from tests.helpers import SAMPLE_TOOL_YAML, write_yaml
 
 # ─── 테스트 fixtures ──────────────────────────────────
 
@@ -26,6 +28,14 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_scan_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """--local 스캔 캐시를 테스트별 임시 디렉토리로 격리."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 # ─── 기본 CLI 테스트 ──────────────────────────────────
 
 
@@ -43,6 +53,24 @@ class TestCLIBasic:
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
+    def test_help_명령_요약_docstring_일치(self) -> None:
+        """--help 목록의 정적 요약이 각 명령의 short help와 같아야 한다."""
+        import importlib
+
+        from aac.cli.main import _COMMANDS
+
+        for module_path, attr, summary in _COMMANDS.values():
+            command = getattr(importlib.import_module(module_path), attr)
+            assert command.get_short_help_str(limit=100) == summary
+
+    def test_version_fast_path(self, capsys: pytest.CaptureFixture[str]) -> None:
+        from aac import __version__
+        from aac.cli import run
+
+        with patch("sys.argv", ["aac", "--version"]):
+            run()
+        assert capsys.readouterr().out == f"aac, version {__version__}\n"
+
     def test_start_help(self, runner: CliRunner) -> None:
         result = runner.invoke(cli, ["start", "--help"])
         assert result.exit_code == 0
@@ -95,6 +123,18 @@ class TestValidateCommand:
         result = runner.invoke(cli, ["validate", "-r", "/nonexistent/path"])
         assert result.exit_code != 0
 
+    def test_validate_환경변수_경로(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("AAC_RESOURCES", RESOURCES_DIR)
+        result = runner.invoke(cli, ["validate"])
+        assert result.exit_code == 0
+
+        monkeypatch.setenv("AAC_RESOURCES", "/nonexistent/path")
+        result = runner.invoke(cli, ["validate"])
+        assert result.exit_code != 0
+        assert "resources 디렉토리 없음" in result.output
+
     def test_validate_스캔_결과_포함(self, runner: CliRunner) -> None:
         result = runner.invoke(cli, ["validate", "-r", RESOURCES_DIR])
         assert result.exit_code == 0
@@ -145,6 +185,169 @@ class TestToolsCommand:
         assert result.exit_code != 0
 
 
+    @patch("urllib.request.urlopen")
+    def test_tools_서버_스트리밍_렌더링(self, mock_urlopen: MagicMock, runner: CliRunner) -> None:
+        body = json.dumps([
+            {"bundle": "fs", "items": [{"name": "read_file", "description": "파일 [b]읽기[/b]"}]},
+        ]).encode()
+        mock_resp = MagicMock()
+        mock_resp.read.side_effect = [body[:10], body[10:], b""]
+        mock_resp.__enter__ = MagicMock(return_value=mock_resp)
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_resp
+
+        result = runner.invoke(cli, ["tools"])
+        assert result.exit_code == 0
+        assert "read_file" in result.output
+        # API 문자열은 Rich markup으로 해석하지 않는다
+        assert "[b]읽기[/b]" in result.output
+
+
+class TestIterJsonArray:
+    """목록 응답 점진 파싱 테스트."""
+
+    def test_청크_경계를_넘는_항목(self) -> None:
+        from io import BytesIO
+
+        from aac.cli.utils import iter_json_array
+
+        data = [{"name": "한글-에이전트", "n": 12345}, 678, "끝", [1, {"a": None}]]
+        raw = json.dumps(data, ensure_ascii=False).encode()
+        assert list(iter_json_array(BytesIO(raw), chunk_size=3)) == data
+
+    def test_큰_항목은_읽기_크기를_늘림(self) -> None:
+        """여러 청크에 걸친 큰 항목도 청크 수에 비례한 재파싱 없이 읽어야 한다."""
+        from io import BytesIO
+
+        from aac.cli.utils import iter_json_array
+
+        class CountingReader(BytesIO):
+            reads = 0
+
+            def read(self, size: int | None = -1) -> bytes:
+                self.reads += 1
+                return super().read(size)
+
+        data = ["x" * 1_000_000, {"small": 1}, "y" * 300_000]
+        fp = CountingReader(json.dumps(data).encode())
+
+        assert list(iter_json_array(fp, chunk_size=1024)) == data
+        assert fp.reads < 50  # 고정 1KiB 읽기라면 1300회 이상
+
+    def test_빈_배열(self) -> None:
+        from io import BytesIO
+
+        from aac.cli.utils import iter_json_array
+
+        assert list(iter_json_array(BytesIO(b" [ ] "), chunk_size=1)) == []
+
+    def test_배열이_아니면_오류(self) -> None:
+        from io import BytesIO
+
+        from aac.cli.utils import iter_json_array
+
+        with pytest.raises(ValueError):
+            list(iter_json_array(BytesIO(b'{"a": 1}')))
+
+    def test_닫히지_않은_배열(self) -> None:
+        from io import BytesIO
+
+        from aac.cli.utils import iter_json_array
+
+        with pytest.raises(ValueError):
+            list(iter_json_array(BytesIO(b'[1, 2'), chunk_size=2))
+
+
+    def test_스트림_파싱_오류는_잘못된_응답으로_안내(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        from io import BytesIO
+
+        from aac.cli import utils
+
+        monkeypatch.setattr(utils, "open_url", lambda url: BytesIO(b'{"a": 1}'))
+        with pytest.raises(SystemExit):
+            list(utils.stream_json_array("http://127.0.0.1:1/api/agents"))
+
+        err = capsys.readouterr().err
+        assert "잘못된 서버 응답" in err
+        assert "서버 연결 실패" not in err
+
+    def test_스트림_연결_오류는_연결_실패로_안내(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        from urllib.error import URLError
+
+        from aac.cli import utils
+
+        def refuse(url: str) -> None:
+            raise URLError("connection refused")
+
+        monkeypatch.setattr(utils, "open_url", refuse)
+        with pytest.raises(SystemExit):
+            list(utils.stream_json_array("http://127.0.0.1:1/api/agents"))
+
+        assert "서버 연결 실패" in capsys.readouterr().err
+
+
+class TestScanCache:
+    """--local 스캔 결과 디스크 캐시 테스트."""
+
+    def test_캐시_재사용_및_무효화(self, tmp_path: Path, _isolated_scan_cache: Path) -> None:
+        from aac.cli.utils import scan_resources
+
+        resources = tmp_path / "resources"
+        write_yaml(resources / "tools" / "t1" / "tool.yaml", SAMPLE_TOOL_YAML)
+
+        first = scan_resources(resources)
+        assert len(first.tools) == 1
+        assert len(list((_isolated_scan_cache / "aac").glob("scan-*.pkl"))) == 1
+
+        with patch("aac.scanner.AgentScanner.scan_all") as mock_scan:
+            cached = scan_resources(resources)
+        mock_scan.assert_not_called()
+        assert cached.tools[0].metadata.name == first.tools[0].metadata.name
+
+        # 파일 추가 → 키 변경 → 재스캔
+        data = {**SAMPLE_TOOL_YAML, "metadata": {"name": "second-tools"}}
+        write_yaml(resources / "tools" / "t2" / "tool.yaml", data)
+        assert len(scan_resources(resources).tools) == 2
+
+    def test_코드_버전이_바뀌면_재스캔(
+        self, tmp_path: Path, _isolated_scan_cache: Path,
+    ) -> None:
+        from aac.cli.utils import scan_resources
+
+        resources = tmp_path / "resources"
+        write_yaml(resources / "tools" / "t1" / "tool.yaml", SAMPLE_TOOL_YAML)
+        scan_resources(resources)
+
+        with (
+            patch("aac.__version__", "999.0.0"),
+            patch("aac.scanner.AgentScanner.scan_all") as mock_scan,
+        ):
+            scan_resources(resources)
+        mock_scan.assert_called_once()
+
+    def test_validate는_캐시를_읽지_않음(
+        self, runner: CliRunner, tmp_path: Path, _isolated_scan_cache: Path,
+    ) -> None:
+        from aac.cli.utils import scan_resources
+        from aac.scanner import AgentScanner
+
+        resources = tmp_path / "resources"
+        write_yaml(resources / "tools" / "t1" / "tool.yaml", SAMPLE_TOOL_YAML)
+        scan_resources(resources)
+
+        real_scan_all = AgentScanner.scan_all
+        with patch.object(
+            AgentScanner, "scan_all", autospec=True, side_effect=real_scan_all,
+        ) as mock_scan:
+            result = runner.invoke(cli, ["validate", "--resources", str(resources)])
+        assert result.exit_code == 0, result.output
+        mock_scan.assert_called_once()
+
+
 # ─── skills 명령 테스트 ───────────────────────────────
 
 
@@ -228,6 +431,26 @@ class TestExecuteCommand:
         assert "Hello, World!" in result.output
         assert "exec_test123" in result.output
 
+    @patch("urllib.request.urlopen")
+    def test_execute_단일_이름_정리(self, mock_urlopen: MagicMock, runner: CliRunner) -> None:
+        """끝 쉼표/공백이 붙은 단일 Agent 이름은 정리된 이름으로 요청해야 한다."""
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = json.dumps({"success": True, "result": "ok"}).encode()
+        mock_resp.__enter__ = lambda s: s
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_resp
+
+        result = runner.invoke(cli, ["execute", " claude-coder,", "Hello"])
+
+        assert result.exit_code == 0
+        request = mock_urlopen.call_args.args[0]
+        assert request.full_url.endswith("/api/agents/claude-coder/execute")
+
+    def test_execute_빈_이름(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["execute", ",", "Hello"])
+        assert result.exit_code == 2
+        assert "Agent 이름" in result.output
+
     @patch("urllib.request.urlopen")
     def test_execute_비동기(self, mock_urlopen: MagicMock, runner: CliRunner) -> None:
         mock_resp = MagicMock()
@@ -245,6 +468,70 @@ class TestExecuteCommand:
         assert "exec_async123" in result.output
         assert "RUNNING" in result.output or "running" in result.output.lower()
 
+    @patch("urllib.request.urlopen")
+    def test_execute_스트리밍(self, mock_urlopen: MagicMock, runner: CliRunner) -> None:
+        body = (
+            b": ping\r\n\r\n"
+            b'data: {"type": "text", "content": "\xec\x95\x88\xeb\x85\x95"}\r\n\r\n'
+            b'data: {"type": "done", "metadata": {"duration_ms": 7, "cost_usd": 0.5}}\r\n\r\n'
+        )
+        # CRLF와 멀티바이트 문자가 청크 경계에 걸리도록 작은 조각으로 전달
+        pieces = [body[i:i + 5] for i in range(0, len(body), 5)]
+        mock_resp = MagicMock()
+        mock_resp.read1.side_effect = [*pieces, b""]
+        mock_resp.__enter__ = MagicMock(return_value=mock_resp)
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_resp
+
+        result = runner.invoke(cli, ["execute", "claude-coder", "hi", "--stream"])
+        assert result.exit_code == 0
+        assert "안녕" in result.output
+        assert "Done" in result.output
+        assert "7ms" in result.output
+
+    def test_render_sse_text_버퍼링(self, capsys: pytest.CaptureFixture[str]) -> None:
+        from aac.cli.commands.execute import _render_sse_event, _TextStreamWriter
+
+        text_out = _TextStreamWriter()
+        _render_sse_event({"type": "text", "content": "a[b]"}, text_out)
+        _render_sse_event({"type": "text", "content": "c"}, text_out)
+        assert capsys.readouterr().out == ""  # 문장 경계 전까지 버퍼에 보관
+
+        _render_sse_event({"type": "text", "content": "d."}, text_out)
+        assert capsys.readouterr().out == "a[b]cd."
+
+    def test_iter_sse_여러_data_줄과_주석(self) -> None:
+        from aac.cli.commands.execute import _iter_sse
+
+        chunks = [b": c\n\nevent: x\ndata: a\nda", b"ta: b\n\ndata:c\n\r", b"\n", b"data: tail"]
+        assert list(_iter_sse(chunks)) == [b"a\nb", b"c", b"tail"]
+
+    @patch("urllib.request.urlopen")
+    def test_execute_여러_agent_동시(self, mock_urlopen: MagicMock, runner: CliRunner) -> None:
+        def _respond(req: Any, timeout: float) -> MagicMock:
+            name = req.full_url.split("/api/agents/")[1].split("/")[0]
+            mock_resp = MagicMock()
+            mock_resp.read.return_value = json.dumps({
+                "success": name != "broken",
+                "agent": name,
+                "error": "boom" if name == "broken" else None,
+            }).encode()
+            mock_resp.__enter__ = MagicMock(return_value=mock_resp)
+            mock_resp.__exit__ = MagicMock(return_value=False)
+            return mock_resp
+
+        mock_urlopen.side_effect = _respond
+
+        result = runner.invoke(cli, ["execute", "alpha,beta", "hi"])
+        assert result.exit_code == 0
+        assert mock_urlopen.call_count == 2
+        assert result.output.index("alpha") < result.output.index("beta")
+
+    def test_execute_여러_agent_스트리밍_불가(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["execute", "alpha,beta", "hi", "--stream"])
+        assert result.exit_code != 0
+        assert "단일 Agent" in result.output
+
     def test_execute_서버_다운(self, runner: CliRunner) -> None:
         result = runner.invoke(
             cli,
@@ -304,6 +591,68 @@ class TestPollCommand:
         assert result.exit_code != 0
 
 
+class TestRunAsync:
+    """run_async 테스트."""
+
+    def test_코루틴_결과_반환(self) -> None:
+        from aac.cli.utils import run_async
+
+        async def _answer() -> int:
+            return 42
+
+        assert run_async(_answer()) == 42
+
+    def test_uvloop_없으면_기본_루프(self) -> None:
+        from aac.cli.utils import _event_loop_factory
+
+        with patch.dict("sys.modules", {"uvloop": None}):
+            assert _event_loop_factory() is None
+
+
+class TestKeepAliveClient:
+    """poll --watch용 keep-alive 클라이언트 테스트."""
+
+    def test_연결_재사용(self) -> None:
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from aac.cli.utils import KeepAliveClient
+
+        connections: list[int] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                connections.append(1)
+
+            def do_GET(self) -> None:  # noqa: N802
+                body = json.dumps({"status": "running", "path": self.path}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            with KeepAliveClient(base) as client:
+                for _ in range(3):
+                    data = client.get_json("/api/executions/exec_1")
+                    assert data["path"] == "/api/executions/exec_1"
+            assert len(connections) == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
 # ─── cancel 명령 테스트 ───────────────────────────────
 
 
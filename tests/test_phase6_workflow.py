@@ -6,6 +6,8 @@ WorkflowManifest 파싱, WorkflowEngine 순차/병렬/조건 실행,
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -156,6 +158,8 @@ def _make_manifest(
     name: str = "test-wf",
     context: dict[str, Any] | None = None,
     max_cost: float | None = None,
+    max_duration: int | None = None,
+    max_parallelism: int = 1,
 ) -> WorkflowManifest:
     return WorkflowManifest(
         metadata=WorkflowMetadata(name=name),
@@ -163,6 +167,8 @@ def _make_manifest(
             steps=steps,
             context=context or {},
             max_total_cost_usd=max_cost,
+            max_total_duration_seconds=max_duration,
+            max_parallelism=max_parallelism,
         ),
     )
 
@@ -233,6 +239,56 @@ class TestWorkflowEngineSequential:
         prompt_arg = ctx.execute.call_args.args[1]
         assert "Python" in prompt_arg
 
+    async def test_이전_스텝_결과_템플릿_참조(self) -> None:
+        """{{steps.<name>.result}}는 이전 스텝 결과로, 모르는/비문자열 변수는 그대로 둔다."""
+        ctx = _make_ctx_mock()
+        engine = WorkflowEngine(ctx)
+        manifest = _make_manifest(
+            [
+                WorkflowStep(name="s1", agent="a", prompt="first"),
+                WorkflowStep(
+                    name="s2", agent="b",
+                    prompt="got {{ steps.s1.result }} / {{steps.s1.success}} / {{missing}}",
+                ),
+            ],
+        )
+
+        await engine.run(manifest)
+        prompt_arg = ctx.execute.call_args.args[1]
+        assert prompt_arg == "got OK / {{steps.s1.success}} / {{missing}}"
+
+    async def test_placeholder_없으면_치환_생략(self) -> None:
+        """프롬프트/이전 결과 어디에도 "{{"가 없으면 템플릿 정규식을 돌리지 않는다."""
+        ctx = _make_ctx_mock()
+        engine = WorkflowEngine(ctx)
+        manifest = _make_manifest(
+            [
+                WorkflowStep(name="s1", agent="a", prompt="first"),
+                WorkflowStep(name="s2", agent="b", prompt="second", input_from="s1"),
+            ],
+        )
+
+        with patch("aac.orchestration.engine._TEMPLATE_VAR") as template_var:
+            await engine.run(manifest)
+
+        template_var.sub.assert_not_called()
+        assert ctx.execute.call_args.args[1] == "second\n\n이전 작업 결과:\nOK"
+
+    async def test_이전_결과의_placeholder도_치환(self) -> None:
+        ctx = _make_ctx_mock({"success": True, "result": "use {{lang}}", "error": None})
+        engine = WorkflowEngine(ctx)
+        manifest = _make_manifest(
+            [
+                WorkflowStep(name="s1", agent="a", prompt="first"),
+                WorkflowStep(name="s2", agent="b", prompt="second", input_from="s1"),
+            ],
+            context={"lang": "Python"},
+        )
+
+        await engine.run(manifest)
+
+        assert ctx.execute.call_args.args[1].endswith("use Python")
+
     async def test_스텝_실패_stop(self) -> None:
         """on_failure=stop 시 후속 스텝 실행 안됨."""
         ctx = _make_ctx_mock({"success": False, "result": "", "error": "fail",
@@ -304,6 +360,72 @@ class TestWorkflowEngineParallel:
         assert result.success is True
         assert ctx.execute.call_count == 2
 
+    async def test_stop_하위_스텝_실패시_나머지_취소(self) -> None:
+        ctx = _make_ctx_mock()
+        slow_cancelled = asyncio.Event()
+
+        async def execute(agent: str, prompt: str, **_: Any) -> dict[str, Any]:
+            if agent == "fail":
+                return {"success": False, "error": "boom"}
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+            return {"success": True}
+
+        ctx.execute = AsyncMock(side_effect=execute)
+        engine = WorkflowEngine(ctx)
+        manifest = _make_manifest([
+            WorkflowStep(
+                name="par",
+                type=StepType.PARALLEL,
+                steps=[
+                    WorkflowStep(name="slow", agent="slow", prompt="p"),
+                    WorkflowStep(name="fast-fail", agent="fail", prompt="p"),
+                ],
+            ),
+        ])
+
+        result = await asyncio.wait_for(engine.run(manifest), timeout=2)
+
+        assert slow_cancelled.is_set()
+        assert result.success is False
+        sub = {s.name: s for s in result.steps}
+        assert sub["fast-fail"].error == "boom"
+        assert sub["slow"].success is False
+        assert "취소" in sub["slow"].error
+
+    async def test_skip_하위_스텝_실패는_형제_유지(self) -> None:
+        ctx = _make_ctx_mock()
+
+        async def execute(agent: str, prompt: str, **_: Any) -> dict[str, Any]:
+            if agent == "fail":
+                return {"success": False, "error": "boom"}
+            await asyncio.sleep(0.01)
+            return {"success": True, "result": "OK"}
+
+        ctx.execute = AsyncMock(side_effect=execute)
+        engine = WorkflowEngine(ctx)
+        manifest = _make_manifest([
+            WorkflowStep(
+                name="par",
+                type=StepType.PARALLEL,
+                steps=[
+                    WorkflowStep(name="ok", agent="ok", prompt="p"),
+                    WorkflowStep(
+                        name="soft", agent="fail", prompt="p", on_failure=OnFailure.SKIP,
+                    ),
+                ],
+            ),
+        ])
+
+        result = await engine.run(manifest)
+
+        sub = {s.name: s for s in result.steps}
+        assert sub["ok"].success is True
+        assert sub["soft"].error == "boom"
+
     async def test_빈_병렬_그룹(self) -> None:
         ctx = _make_ctx_mock()
         engine = WorkflowEngine(ctx)
@@ -315,9 +437,146 @@ class TestWorkflowEngineParallel:
         assert result.success is True
 
 
+class TestWorkflowEngineCache:
+    """step.cache — 같은 agent + 프롬프트 결과 재사용."""
+
+    async def test_캐시_적중시_실행_생략(self) -> None:
+        ctx = _make_ctx_mock()
+        engine = WorkflowEngine(ctx)
+        manifest = _make_manifest([
+            WorkflowStep(name="s1", agent="a", prompt="same", cache=True),
+            WorkflowStep(name="s2", agent="a", prompt="same", cache=True),
+            WorkflowStep(name="s3", agent="a", prompt="other", cache=True),
+        ])
+
+        result = await engine.run(manifest)
+
+        assert ctx.execute.call_count == 2
+        s2 = result.steps[1]
+        assert (s2.name, s2.result, s2.cached, s2.cost_usd) == ("s2", "OK", True, 0.0)
+        assert result.steps[2].cached is False
+
+    async def test_실패_결과와_cache_미지정_스텝은_캐시_안함(self) -> None:
+        ctx = _make_ctx_mock({"success": False, "error": "fail"})
+        engine = WorkflowEngine(ctx)
+        manifest = _make_manifest([
+            WorkflowStep(name="s1", agent="a", prompt="p", cache=True, on_failure=OnFailure.SKIP),
+            WorkflowStep(name="s2", agent="a", prompt="p", cache=True, on_failure=OnFailure.SKIP),
+        ])
+        await engine.run(manifest)
+        assert ctx.execute.call_count == 2
+
+        ctx.execute.return_value = {"success": True, "result": "OK"}
+        uncached = _make_manifest([WorkflowStep(name="s", agent="a", prompt="q")] * 2)
+        await engine.run(uncached)
+        assert ctx.execute.call_count == 4
+
+
+class TestWorkflowEngineDAG:
+    """max_parallelism > 1 — 의존 관계 기반 동시 실행."""
+
+    @staticmethod
+    def _recording_ctx(order: list[str], delay: float = 0.05) -> MagicMock:
+        ctx = _make_ctx_mock()
+
+        async def execute(agent: str, prompt: str, **_: Any) -> dict[str, Any]:
+            order.append(f"start:{agent}")
+            await asyncio.sleep(delay)
+            order.append(f"end:{agent}")
+            return {"success": agent != "fail", "result": f"{agent}-out", "error": None}
+
+        ctx.execute = AsyncMock(side_effect=execute)
+        return ctx
+
+    @pytest.mark.parametrize("max_parallelism", [1, 4])
+    async def test_예상치_못한_예외는_원래_메시지로_기록(self, max_parallelism: int) -> None:
+        """DAG 모드도 순차 모드와 같이 ExceptionGroup이 아닌 원래 예외 메시지를 기록해야 한다."""
+        engine = WorkflowEngine(_make_ctx_mock())
+        manifest = _make_manifest(
+            [
+                WorkflowStep(name="a", agent="a", prompt="p"),
+                WorkflowStep(name="b", agent="b", prompt="p"),
+            ],
+            max_parallelism=max_parallelism,
+        )
+
+        with patch.object(engine, "_record_step", side_effect=RuntimeError("기록 실패")):
+            result = await engine.run(manifest)
+
+        assert result.success is False
+        assert result.error == "기록 실패"
+
+    def test_build_dag(self) -> None:
+        steps = [
+            WorkflowStep(name="a", agent="a", prompt="p"),
+            WorkflowStep(name="b", agent="b", prompt="p"),
+            WorkflowStep(name="c", agent="c", prompt="p", input_from="a"),
+            WorkflowStep(
+                name="d", type=StepType.CONDITION, condition="steps.b.success", if_true="e",
+            ),
+            WorkflowStep(name="e", agent="e", prompt="p"),
+        ]
+        in_degree, successors = WorkflowEngine._build_dag(steps)
+
+        assert in_degree == [0, 0, 1, 1, 1]
+        assert successors == [[2], [3], [], [4], []]
+
+    async def test_독립_스텝_동시_실행(self) -> None:
+        order: list[str] = []
+        engine = WorkflowEngine(self._recording_ctx(order))
+        manifest = _make_manifest(
+            [
+                WorkflowStep(name="a", agent="a", prompt="p"),
+                WorkflowStep(name="b", agent="b", prompt="p"),
+                WorkflowStep(name="c", agent="c", prompt="p", input_from="a"),
+            ],
+            max_parallelism=4,
+        )
+
+        started = time.monotonic()
+        result = await engine.run(manifest)
+
+        assert result.success is True
+        assert time.monotonic() - started < 0.14  # 순차라면 0.15s 이상
+        assert order[:2] == ["start:a", "start:b"]
+        assert order.index("start:c") > order.index("end:a")
+        assert {s.name for s in result.steps} == {"a", "b", "c"}
+
+    async def test_stop_실패시_후속_스텝_미실행(self) -> None:
+        order: list[str] = []
+        engine = WorkflowEngine(self._recording_ctx(order))
+        manifest = _make_manifest(
+            [
+                WorkflowStep(name="f", agent="fail", prompt="p"),
+                WorkflowStep(name="next", agent="next", prompt="p", input_from="f"),
+            ],
+            max_parallelism=2,
+        )
+
+        result = await engine.run(manifest)
+
+        assert result.success is False
+        assert "f" in (result.error or "")
+        assert "start:next" not in order
+
+
 class TestWorkflowEngineCondition:
     """조건 분기 테스트."""
 
+    def test_스텝_색인_중첩_포함_먼저_나온_스텝_우선(self) -> None:
+        engine = WorkflowEngine(_make_ctx_mock())
+        first = WorkflowStep(name="dup", agent="a", prompt="p")
+        nested = WorkflowStep(name="inner", agent="b", prompt="p")
+        manifest = _make_manifest([
+            WorkflowStep(name="par", type=StepType.PARALLEL, steps=[first, nested]),
+            WorkflowStep(name="dup", agent="c", prompt="p"),
+        ])
+
+        index = engine._step_index(manifest)
+        assert index["dup"] is first
+        assert index["inner"] is nested
+        assert engine._step_index(manifest) is index  # manifest당 한 번만 구성
+
     async def test_조건_참(self) -> None:
         ctx = _make_ctx_mock()
         engine = WorkflowEngine(ctx)
@@ -407,6 +666,26 @@ class TestWorkflowEngineLimits:
         # s1 + s2 = $1.0 > $0.8, s3는 실행 안됨
         assert len(result.steps) == 2
 
+    async def test_시간_상한은_실제_경과_시간_기준(self) -> None:
+        """스텝이 보고한 duration 합(80s)이 상한(60s)을 넘어도 실제 경과 시간이 짧으면 계속 실행."""
+        ctx = _make_ctx_mock({"success": True, "result": "OK", "error": None,
+                              "cost_usd": 0.0, "duration_ms": 40_000, "model": ""})
+        engine = WorkflowEngine(ctx)
+        manifest = _make_manifest(
+            [
+                WorkflowStep(name="s1", agent="a", prompt="p1"),
+                WorkflowStep(name="s2", agent="b", prompt="p2"),
+                WorkflowStep(name="s3", agent="c", prompt="p3"),
+            ],
+            max_duration=60,
+        )
+
+        result = await engine.run(manifest)
+
+        assert result.success is True
+        assert len(result.steps) == 3
+        assert result.total_duration_ms < 60_000
+
 
 class TestWorkflowEngineRetry:
     """재시도 테스트."""
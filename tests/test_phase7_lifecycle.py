@@ -6,6 +6,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -82,7 +85,7 @@ class TestStateTransition:
     def test_무효_전이_예외(self) -> None:
         mgr = LifecycleManager()
         agent = _make_agent(status=AgentStatus.REGISTERED)
-        with pytest.raises(ValueError, match="전이 불가"):
+        with pytest.raises(ValueError, match="REGISTERED → EXECUTING 전이 불가"):
             mgr.transition(agent, AgentStatus.EXECUTING)
 
     def test_DESTROYED_전이_불가(self) -> None:
@@ -153,6 +156,57 @@ class TestEventHistory:
         events = mgr.get_events(limit=2)
         assert len(events) == 2
 
+    def test_limit은_최근_이벤트를_시간순으로(self) -> None:
+        mgr = LifecycleManager()
+        agent = _make_agent(status=AgentStatus.REGISTERED)
+        mgr.transition(agent, AgentStatus.INITIALIZING)
+        mgr.transition(agent, AgentStatus.READY)
+        mgr.transition(agent, AgentStatus.EXECUTING)
+
+        events = mgr.get_events(limit=2)
+        assert [e["new_status"] for e in events] == ["READY", "EXECUTING"]
+
+    def test_agent_필터는_보관_버퍼와_일치(self) -> None:
+        mgr = LifecycleManager()
+        a = _make_agent("a", AgentStatus.READY)
+        b = _make_agent("b", AgentStatus.READY)
+        for _ in range(200):
+            mgr.transition(a, AgentStatus.EXECUTING)
+            mgr.transition(a, AgentStatus.READY)
+        for _ in range(100):
+            mgr.transition(b, AgentStatus.EXECUTING)
+            mgr.transition(b, AgentStatus.READY)
+
+        # 전체 500개 중 a는 오래된 100개가 밀려나 300개만 남아야 한다
+        everything = mgr.get_events(limit=0)
+        assert len(everything) == 500
+        for name in ("a", "b"):
+            expected = [e for e in everything if e["agent"] == name]
+            assert mgr.get_events(agent_name=name, limit=0) == expected
+            assert mgr.get_events(agent_name=name, limit=5) == expected[-5:]
+        assert len(mgr.get_events(agent_name="a", limit=1000)) == 300
+        assert mgr.get_events(agent_name="없음") == []
+
+    def test_events_json은_get_events와_동일(self) -> None:
+        mgr = LifecycleManager()
+        for name in ("a", "b"):
+            agent = _make_agent(name, status=AgentStatus.REGISTERED)
+            mgr.transition(agent, AgentStatus.INITIALIZING)
+            mgr.transition(agent, AgentStatus.ERROR, error="실패")
+
+        for kwargs in ({}, {"agent_name": "b"}, {"limit": 3}, {"limit": 0}):
+            assert json.loads(mgr.get_events_json(**kwargs)) == mgr.get_events(**kwargs)
+
+    def test_최대_보관_수_초과시_오래된_것부터_제거(self) -> None:
+        mgr = LifecycleManager()
+        agent = _make_agent(status=AgentStatus.READY)
+        for _ in range(300):
+            mgr.transition(agent, AgentStatus.EXECUTING)
+            mgr.transition(agent, AgentStatus.READY)
+
+        assert mgr.get_summary({})["total_events"] == 500
+        assert mgr.get_events(limit=1)[0]["new_status"] == "READY"
+
     def test_이벤트_직렬화(self) -> None:
         event = LifecycleEvent(
             agent_name="test",
@@ -162,6 +216,7 @@ class TestEventHistory:
         d = event.to_dict()
         assert d["agent"] == "test"
         assert "timestamp" in d
+        assert json.loads(json.dumps(d))["new_status"] == "EXECUTING"
 
 
 # ─── 콜백 테스트 ──────────────────────────────────────
@@ -199,6 +254,23 @@ class TestCallbacks:
 
         assert count[0] == 11
 
+    def test_batch_안의_콜백은_종료_시_순서대로(self) -> None:
+        mgr = LifecycleManager()
+        events_received: list[LifecycleEvent] = []
+        mgr.add_callback(events_received.append)
+
+        agent = _make_agent(status=AgentStatus.REGISTERED)
+        with mgr.batch():
+            mgr.transition(agent, AgentStatus.INITIALIZING)
+            with mgr.batch():
+                mgr.transition(agent, AgentStatus.READY)
+            assert events_received == []
+            assert agent.status == AgentStatus.READY
+
+        assert [e.new_status for e in events_received] == [
+            AgentStatus.INITIALIZING, AgentStatus.READY,
+        ]
+
     def test_콜백_에러_무시(self) -> None:
         mgr = LifecycleManager()
         mgr.add_callback(lambda _: 1 / 0)  # 에러 발생하는 콜백
@@ -258,6 +330,21 @@ class TestHealthCheck:
         assert results["b"].healthy is False
         assert results["c"].healthy is False
 
+    def test_전체_건강_개수(self) -> None:
+        mgr = LifecycleManager()
+        agents = {
+            "a": _make_agent("a", AgentStatus.READY),
+            "b": _make_agent("b", AgentStatus.ERROR),
+            "c": _make_agent("c", AgentStatus.LAZY),
+            "d": _make_agent("d", AgentStatus.EXECUTING),
+        }
+        counts = mgr.check_all_health_counts(agents)
+
+        details = mgr.check_all_health(agents)
+        assert counts["healthy"] == sum(r.healthy for r in details.values()) == 2
+        assert counts["unhealthy"] == 2
+        assert counts["by_status"] == {"READY": 1, "ERROR": 1, "LAZY": 1, "EXECUTING": 1}
+
     def test_결과_직렬화(self) -> None:
         result = HealthCheckResult(
             agent_name="test",
@@ -272,6 +359,15 @@ class TestHealthCheck:
 # ─── 우아한 종료 테스트 ───────────────────────────────
 
 
+def _sleep(seconds: float):
+    """AsyncMock side_effect — 호출되면 seconds만큼 대기."""
+
+    async def side_effect() -> None:
+        await asyncio.sleep(seconds)
+
+    return side_effect
+
+
 class TestGracefulShutdown:
     """우아한 종료 테스트."""
 
@@ -331,6 +427,59 @@ class TestGracefulShutdown:
         assert agents["b"].status == AgentStatus.DESTROYED
         assert agents["c"].status == AgentStatus.LAZY
 
+    async def test_EXECUTING_에이전트_완료_대기(self) -> None:
+        mgr = LifecycleManager()
+        agent = _make_agent(status=AgentStatus.READY)
+        mgr.transition(agent, AgentStatus.EXECUTING)
+
+        async def finish() -> None:
+            await asyncio.sleep(0.01)
+            mgr.transition(agent, AgentStatus.READY)
+
+        task = asyncio.create_task(finish())
+        started = time.monotonic()
+        events = await mgr.graceful_shutdown({"a": agent})
+        await task
+
+        assert time.monotonic() - started < 0.1  # polling 주기(0.1s)를 기다리지 않음
+        assert agent.status == AgentStatus.DESTROYED
+        assert [e.old_status for e in events] == [AgentStatus.READY, AgentStatus.DESTROYING]
+
+    async def test_런타임_동시_종료(self) -> None:
+        mgr = LifecycleManager()
+        agents = {name: _make_agent(name, AgentStatus.READY) for name in ("a", "b", "c")}
+        for a in agents.values():
+            a.runtime = MagicMock()
+            a.runtime.shutdown = AsyncMock(side_effect=_sleep(0.05))
+
+        started = time.monotonic()
+        events = await mgr.graceful_shutdown(agents)
+
+        assert time.monotonic() - started < 0.12  # 순차라면 0.15s 이상
+        assert [e.agent_name for e in events] == ["a", "a", "b", "b", "c", "c"]
+        assert all(a.status == AgentStatus.DESTROYED for a in agents.values())
+
+    async def test_종료_timeout_시_남은_종료_취소(self) -> None:
+        mgr = LifecycleManager()
+        fast = _make_agent("fast", AgentStatus.READY)
+        slow = _make_agent("slow", AgentStatus.READY)
+        fast.runtime = MagicMock()
+        fast.runtime.shutdown = AsyncMock()
+        slow.runtime = MagicMock()
+        slow.runtime.shutdown = AsyncMock(side_effect=_sleep(10))
+
+        events = await mgr.graceful_shutdown({"fast": fast, "slow": slow}, timeout_seconds=0.05)
+
+        assert fast.status == AgentStatus.DESTROYED
+        assert slow.status == AgentStatus.DESTROYING
+        assert [e.agent_name for e in events] == ["fast", "fast"]
+
+    async def test_EXECUTING_대기_timeout(self) -> None:
+        agent = _make_agent(status=AgentStatus.EXECUTING)
+        assert await agent.wait_idle(0.01) is False
+        agent.set_status(AgentStatus.READY)
+        assert await agent.wait_idle(0.01) is True
+
 
 # ─── 요약 통계 테스트 ─────────────────────────────────
 
@@ -6,13 +6,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import sys
+import time
 from pathlib import Path
 from typing import Any
 
 import pytest
 
 from aac.models.manifest import RuntimeManifest, RuntimeMetadata, RuntimeSpec
-from aac.runtime.base import ExecutionResult, RuntimeStatus
+from aac.runtime.base import AgentRuntime, ExecutionResult, RuntimeStatus
 from aac.runtime.claude_code import ClaudeCodeRuntime
 from aac.runtime.codex_cli import CodexCLIRuntime
 from aac.runtime.gemini_mcp import GeminiMCPRuntime
@@ -182,6 +186,173 @@ class TestCodexCLIRuntime:
         assert runtime.status == RuntimeStatus.SHUTDOWN
 
 
+# ─── AgentRuntime.execute_batch ──────────────────────
+
+
+class _SlowEchoRuntime(AgentRuntime):
+    """execute마다 잠깐 대기 후 프롬프트를 그대로 돌려주는 테스트용 Runtime."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.running = 0
+        self.peak = 0
+
+    async def initialize(self, config: dict[str, Any]) -> None:
+        self._status = RuntimeStatus.READY
+
+    async def execute(self, prompt: str, **kwargs: Any) -> ExecutionResult:
+        if prompt == "boom":
+            raise RuntimeError("실패")
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.05 if prompt == "slow" else 0.01)
+        self.running -= 1
+        return ExecutionResult(response=prompt)
+
+    async def shutdown(self) -> None:
+        self._status = RuntimeStatus.SHUTDOWN
+
+
+class TestExecuteBatch:
+    """AgentRuntime.execute_batch — 동시 실행 상한 + 입력 순서 보존."""
+
+    async def test_입력_순서_유지(self) -> None:
+        runtime = _SlowEchoRuntime()
+
+        results = await runtime.execute_batch(["slow", "a", "b"], max_concurrency=3)
+
+        assert [r.response for r in results] == ["slow", "a", "b"]
+
+    async def test_동시_실행_상한(self) -> None:
+        runtime = _SlowEchoRuntime()
+
+        results = await runtime.execute_batch([f"p{i}" for i in range(8)], max_concurrency=2)
+
+        assert len(results) == 8
+        assert runtime.peak == 2
+
+    async def test_예외는_전파(self) -> None:
+        runtime = _SlowEchoRuntime()
+
+        with pytest.raises(ExceptionGroup):
+            await runtime.execute_batch(["a", "boom"], max_concurrency=2)
+
+    async def test_잘못된_동시성(self) -> None:
+        with pytest.raises(ValueError):
+            await _SlowEchoRuntime().execute_batch(["a"], max_concurrency=0)
+
+
+# ─── ClaudeCodeRuntime ───────────────────────────────
+
+
+async def _spawn_python(code: str) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-c", code,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+
+class TestClaudeCodeRuntime:
+    """ClaudeCodeRuntime 출력 파싱 — bytes JSON + 실제 subprocess 파이프 스트리밍."""
+
+    async def test_명령어_조립(self) -> None:
+        runtime = ClaudeCodeRuntime()
+        await runtime.initialize({"model": "opus"})
+
+        cmd = runtime._build_command("질문", "", 5)
+        stream_cmd = runtime._build_stream_command("질문", "시스템", 5)
+
+        assert cmd == [
+            "claude", "--model", "opus", "--output-format", "json",
+            "-p", "질문", "--max-turns", "5",
+        ]
+        assert stream_cmd[stream_cmd.index("--output-format") + 1] == "stream-json"
+        assert stream_cmd[-2:] == ["--system-prompt", "시스템"]
+
+    async def test_bytes_JSON_파싱(self) -> None:
+        runtime = ClaudeCodeRuntime()
+        await runtime.initialize({})
+
+        output = '{"result": "완료", "cost_usd": 0.003}'.encode()
+        result = runtime._parse_output(output, 120)
+
+        assert result.response == "완료"
+        assert result.cost_usd == 0.003
+
+    async def test_블록_리스트는_마지막_result_우선(self) -> None:
+        runtime = ClaudeCodeRuntime()
+        await runtime.initialize({})
+
+        output = (
+            b'[{"type": "text", "text": "middle"}, "noise",'
+            b' {"type": "result", "result": "done"}, {"type": "tool_use"}]'
+        )
+        result = runtime._parse_output(output, 10)
+
+        assert result.response == "done"
+
+    async def test_bytes_비JSON_폴백(self) -> None:
+        """JSON이 아니거나 잘못된 UTF-8이면 디코딩한 원본 텍스트를 응답으로 쓴다."""
+        runtime = ClaudeCodeRuntime()
+        await runtime.initialize({})
+
+        assert runtime._parse_output("일반 텍스트".encode(), 10).response == "일반 텍스트"
+        assert runtime._parse_output(b"\xff\xfe", 10).response == "\ufffd\ufffd"
+
+    async def test_줄_단위_파싱(self) -> None:
+        runtime = ClaudeCodeRuntime()
+        await runtime.initialize({})
+        proc = await _spawn_python(
+            "import json\n"
+            "block = {'type': 'text', 'text': '안녕'}\n"
+            "msg = {'type': 'assistant', 'message': {'content': [block]}}\n"
+            "print(json.dumps(msg), flush=True)\n"
+            "print(json.dumps({'type': 'result', 'cost_usd': 0.01, 'duration_ms': 5}))\n"
+        )
+
+        chunks = [c async for c in runtime._parse_stream(proc)]
+        await proc.wait()
+
+        assert [c.type for c in chunks] == ["text", "done"]
+        assert chunks[0].content == "안녕"
+        assert chunks[1].metadata["cost_usd"] == 0.01
+
+    async def test_stream_timeout시_subprocess_종료(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """응답 없는 claude CLI도 timeout_seconds 안에 kill되고 stream이 끝나야 한다."""
+        fake = tmp_path / "claude"
+        fake.write_text(f"#!{sys.executable}\nimport time\ntime.sleep(8)\n")
+        fake.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+        runtime = ClaudeCodeRuntime()
+        await runtime.initialize({})
+
+        start = time.monotonic()
+        chunks = [c async for c in runtime.stream("질문", timeout_seconds=1)]
+        elapsed = time.monotonic() - start
+
+        assert [c.type for c in chunks] == ["error", "done"]
+        assert elapsed < 4
+        assert runtime.status == RuntimeStatus.READY
+
+    async def test_deadline_초과시_에러(self) -> None:
+        runtime = ClaudeCodeRuntime()
+        proc = await _spawn_python("import time; time.sleep(5)")
+
+        start = time.monotonic()
+        chunks = [
+            c async for c in runtime._parse_stream(proc, deadline=time.monotonic() + 0.2)
+        ]
+        elapsed = time.monotonic() - start
+        proc.kill()
+        await proc.wait()
+
+        assert [c.type for c in chunks] == ["error", "done"]
+        assert elapsed < 2
+
+
 # ─── RuntimeRegistry discover ────────────────────────
 
 
@@ -62,6 +62,14 @@ class TestScanAll:
         assert result.skills[0].source_path is not None
         assert result.aspects[0].source_path is not None
 
+    def test_scan_결과_manifest는_불변(self, resources_dir: Path) -> None:
+        """스캔된 manifest는 frozen — 필드 재할당이 막혀야 한다."""
+        from pydantic import ValidationError
+
+        result = AgentScanner(resources_dir).scan_all()
+        with pytest.raises(ValidationError):
+            result.agents[0].source_path = "other.yaml"
+
     def test_빈_디렉토리_스캔(self, tmp_path: Path) -> None:
         """리소스 디렉토리가 비어있으면 빈 결과를 반환해야 한다."""
         result = AgentScanner(tmp_path).scan_all()
@@ -82,6 +90,22 @@ class TestScanAll:
         assert len(result.agents) == 0  # agents/ 디렉토리 없음 → 무시
 
 
+    def test_병렬_로드_순서_유지(self, tmp_path: Path) -> None:
+        """스레드 풀로 로드해도 결과/에러 순서는 디렉토리 정렬 순서와 같아야 한다."""
+        for i in range(12):
+            data = {**SAMPLE_TOOL_YAML, "metadata": {"name": f"tools-{i:02d}"}}
+            write_yaml(tmp_path / "tools" / f"t{i:02d}" / "tool.yaml", data)
+        bad = tmp_path / "tools" / "t05x" / "tool.yaml"
+        bad.parent.mkdir(parents=True)
+        bad.write_text("{ invalid: yaml: content", encoding="utf-8")
+
+        result = AgentScanner(tmp_path, max_workers=4).scan_all()
+
+        assert [t.metadata.name for t in result.tools] == [f"tools-{i:02d}" for i in range(12)]
+        assert len(result.errors) == 1
+        assert "t05x" in result.errors[0].file_path
+
+
 class TestScanErrors:
     """scan_all() — 에러 검출."""
 
@@ -124,6 +148,21 @@ class TestScanErrors:
         assert result.errors[0].error_type == "KindMismatch"
         assert result.errors[0].field == "kind"
 
+    def test_에러에_리소스_종류_기록(self, tmp_path: Path) -> None:
+        """ScanError.kind에 스캔 대상 리소스 종류가 기록되어야 한다."""
+        for sub, name in (
+            ("tools", "tool.yaml"),
+            ("skills", "skill.yaml"),
+            ("agents", "agent.yaml"),
+        ):
+            bad = tmp_path / sub / "bad" / name
+            bad.parent.mkdir(parents=True)
+            bad.write_text("", encoding="utf-8")
+
+        result = AgentScanner(tmp_path).scan_all()
+
+        assert sorted(e.kind for e in result.errors) == ["Agent", "Skill", "Tool"]
+
     def test_필수_필드_누락(self, tmp_path: Path) -> None:
         """필수 필드가 누락되면 ValidationError를 생성해야 한다."""
         invalid = {
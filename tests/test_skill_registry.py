@@ -23,8 +23,8 @@ def _make_skill_manifest(
             instruction_file=instruction_file,
             required_tools=required_tools or [],
         ),
+        source_path=source_path,
     )
-    m.source_path = source_path
     return m
 
 
@@ -50,6 +50,18 @@ class TestRegister:
 
         assert len(registry) == 1
 
+    def test_일괄_등록(self) -> None:
+        registry = SkillRegistry()
+        registry.register(_make_skill_manifest("code-review"))
+
+        registry.bulk_register([
+            _make_skill_manifest("code-review"),
+            _make_skill_manifest("testing"),
+        ])
+
+        assert len(registry) == 2
+        assert registry.list_all() == ["code-review", "testing"]
+
     def test_미등록_스킬_조회_에러(self) -> None:
         registry = SkillRegistry()
 
@@ -126,6 +138,40 @@ class TestLoadInstruction:
             registry.load_instruction("missing")
 
 
+class TestPreloadInstructions:
+    """preload_instructions() — instruction 문서 병렬 선적재."""
+
+    async def test_전체_선적재_후_캐시_사용(self, tmp_path: Path) -> None:
+        registry = SkillRegistry()
+        for name in ("review", "docs"):
+            skill_dir = tmp_path / "skills" / name
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"# {name} 지침", encoding="utf-8")
+            registry.register(
+                _make_skill_manifest(name, source_path=str(skill_dir / "skill.yaml"))
+            )
+
+        assert await registry.preload_instructions() == 2
+
+        # 파일을 지워도 캐시에서 반환
+        (tmp_path / "skills" / "docs" / "SKILL.md").unlink()
+        assert registry.load_instruction("docs") == "# docs 지침"
+        assert await registry.preload_instructions() == 0
+
+    async def test_실패한_문서는_건너뛰고_지연_로드에서_에러(self, tmp_path: Path) -> None:
+        registry = SkillRegistry()
+        skill_dir = tmp_path / "skills" / "missing"
+        skill_dir.mkdir(parents=True)
+        registry.register(
+            _make_skill_manifest("missing", source_path=str(skill_dir / "skill.yaml"))
+        )
+        registry.register(_make_skill_manifest("no-path", source_path=None))
+
+        assert await registry.preload_instructions() == 0
+        with pytest.raises(FileNotFoundError, match="찾을 수 없습니다"):
+            registry.load_instruction("missing")
+
+
 class TestResolveSkills:
     """resolve_skills() — DR-2 문서 합성 + required_tools 검증."""
 
@@ -177,6 +223,21 @@ class TestResolveSkills:
 
         assert instructions[0].startswith("\n---\n## Skill: review")
 
+    def test_섹션_재사용_재등록_시_갱신(self, tmp_path: Path) -> None:
+        """같은 skill 섹션은 재사용하고, skill을 다시 등록하면 새 문서로 합성해야 한다."""
+        registry = self._setup_registry(tmp_path)
+        refs = [SkillRef(ref="security")]
+
+        first = registry.resolve_skills(refs, set())
+        second = registry.resolve_skills(refs, set())
+        assert first[0] is second[0]
+
+        (tmp_path / "skills" / "security" / "SKILL.md").write_text(
+            "# 새 보안 지침", encoding="utf-8"
+        )
+        registry.register(registry.get("security"))
+        assert "새 보안 지침" in registry.resolve_skills(refs, set())[0]
+
     def test_중복_스킬_무시(self, tmp_path: Path) -> None:
         """같은 skill을 여러 번 참조하면 첫 번째만 처리해야 한다."""
         registry = self._setup_registry(tmp_path)
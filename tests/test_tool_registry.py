@@ -31,6 +31,11 @@ class TestRegister:
         assert registry.has("file-ops")
         assert len(registry) == 1
 
+    def test_번들_내_tool_이름_중복_거부(self) -> None:
+        """번들 안에서 tool 이름이 겹치면 manifest 검증에서 실패해야 한다."""
+        with pytest.raises(ValueError, match="Tool 이름 중복: {'Read'}"):
+            _make_tool_manifest("file-ops", ["Read", "Write", "Read"])
+
     def test_동일_이름_번들_덮어쓰기(self) -> None:
         """같은 이름의 번들을 등록하면 덮어쓰기해야 한다."""
         registry = ToolRegistry()
@@ -44,6 +49,21 @@ class TestRegister:
         result = registry.get("file-ops")
         assert len(result.spec.items) == 3
 
+    def test_일괄_등록(self) -> None:
+        """bulk_register는 기존 번들을 덮어쓰고 해석 캐시를 무효화해야 한다."""
+        registry = ToolRegistry()
+        registry.register(_make_tool_manifest("file-ops", ["Read"]))
+        assert len(registry.resolve_tools([ToolRef(ref="file-ops")])) == 1
+
+        registry.bulk_register([
+            _make_tool_manifest("file-ops", ["Read", "Write"]),
+            _make_tool_manifest("shell", ["Bash"]),
+        ])
+
+        assert len(registry) == 2
+        assert len(registry.resolve_tools([ToolRef(ref="file-ops")])) == 2
+        assert registry.tool_names([ToolRef(ref="shell")]) == {"shell", "Bash"}
+
     def test_미등록_번들_조회_에러(self) -> None:
         """등록되지 않은 번들을 조회하면 KeyError가 발생해야 한다."""
         registry = ToolRegistry()
@@ -52,6 +72,17 @@ class TestRegister:
             registry.get("nonexistent")
 
 
+    def test_미등록_에러_목록_상한(self) -> None:
+        """번들이 많으면 에러 메시지에 앞 10개만 나열하고 나머지는 개수로 표시해야 한다."""
+        registry = ToolRegistry()
+        registry.bulk_register(_make_tool_manifest(f"b{i:02d}", ["T"]) for i in range(25))
+
+        with pytest.raises(KeyError, match="외 15개") as exc_info:
+            registry.get("nonexistent")
+        assert "b09" in str(exc_info.value)
+        assert "b10" not in str(exc_info.value)
+
+
 class TestResolveTools:
     """resolve_tools() — ToolRef 해석 + DR-1 충돌 규칙."""
 
@@ -108,6 +139,33 @@ class TestResolveTools:
             registry.resolve_tools([ToolRef(ref="nonexistent")])
 
 
+    def test_같은_ref_결과_재사용(self) -> None:
+        """같은 ref 구성은 같은 ToolDefinition을 공유하고, 재등록 시 다시 해석되어야 한다."""
+        registry = ToolRegistry()
+        registry.register(_make_tool_manifest("file-ops", ["Read", "Write"]))
+
+        first = registry.resolve_tools([ToolRef(ref="file-ops")])
+        second = registry.resolve_tools([ToolRef(ref="file-ops")])
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+        registry.register(_make_tool_manifest("file-ops", ["Read", "Write", "Edit"]))
+        third = registry.resolve_tools([ToolRef(ref="file-ops")])
+        assert {t.name for t in third} == {"Read", "Write", "Edit"}
+
+    def test_tool_names_번들과_개별_이름(self) -> None:
+        """tool_names는 번들 이름, 번들 item 이름, 개별 name을 모두 포함해야 한다."""
+        registry = ToolRegistry()
+        registry.register(_make_tool_manifest("file-ops", ["Read", "Write"]))
+
+        names = registry.tool_names([ToolRef(ref="file-ops"), ToolRef(name="Bash")])
+
+        assert names == {"file-ops", "Read", "Write", "Bash"}
+        with pytest.raises(KeyError):
+            registry.tool_names([ToolRef(ref="nonexistent")])
+
+
 class TestDR1ConflictResolution:
     """DR-1: 번들 간 Tool 이름 충돌 해결."""
 
@@ -158,6 +216,32 @@ class TestDR1ConflictResolution:
 
         assert len(tools) == 2
 
+    def test_last_wins_첫_등장_순서_유지(self) -> None:
+        """충돌한 tool은 나중 번들 것으로 교체되되 처음 등장한 위치를 유지해야 한다."""
+        registry = ToolRegistry(strict=False)
+        registry.register(_make_tool_manifest("bundle-a", ["Read", "Write"]))
+        registry.register(_make_tool_manifest("bundle-b", ["Write", "Grep"]))
+
+        tools = registry.resolve_tools([ToolRef(ref="bundle-a"), ToolRef(ref="bundle-b")])
+
+        assert [t.name for t in tools] == ["Read", "Write", "Grep"]
+        assert tools[1].bundle_name == "bundle-b"
+
+    def test_충돌_경고는_한_번으로_요약(self) -> None:
+        """여러 이름이 충돌해도 해석당 경고는 한 번만, 충돌 목록을 담아 기록되어야 한다."""
+        from structlog.testing import capture_logs
+
+        registry = ToolRegistry(strict=False)
+        registry.register(_make_tool_manifest("bundle-a", ["Read", "Write"]))
+        registry.register(_make_tool_manifest("bundle-b", ["Read", "Write"]))
+
+        with capture_logs() as logs:
+            registry.resolve_tools([ToolRef(ref="bundle-a"), ToolRef(ref="bundle-b")])
+
+        warnings = [e for e in logs if e["event"] == "tool_name_conflict"]
+        assert len(warnings) == 1
+        assert len(warnings[0]["tools"]) == 2
+
 
 class TestListAll:
     """list_all() / total_tool_count."""
@@ -179,3 +263,12 @@ class TestListAll:
         registry.register(_make_tool_manifest("b", ["T3"]))
 
         assert registry.total_tool_count == 3
+
+    def test_total_tool_count_재등록_반영(self) -> None:
+        """같은 번들을 다시 등록하면 이전 item 수 대신 새 item 수로 집계되어야 한다."""
+        registry = ToolRegistry()
+        registry.register(_make_tool_manifest("a", ["T1", "T2"]))
+        registry.register(_make_tool_manifest("a", ["T1"]))
+
+        assert registry.total_tool_count == 1
+        assert registry.list_all() == {"a": 1}